@@ -0,0 +1,84 @@
+"""Per-request overhead of the /rows handler as the list function's signature grows.
+
+Compares the precompiled CallPlan path against the previous per-request
+introspection (inspect.signature + find_pagination_params + find_sort_param).
+
+    uv run python benchmarks/bench_call_plans.py
+"""
+import inspect
+import time
+from typing import Annotated
+
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from typeboard.fields import AdminField
+from typeboard.introspection import find_pagination_params, find_sort_param
+from typeboard.pagination import Page
+from typeboard.site import AdminSite
+
+SIGNATURE_SIZES = (2, 16, 64, 256)
+REQUESTS = 300
+
+
+class Row(BaseModel):
+    id: int
+    name: str
+
+
+ROWS = [Row(id=i, name=f"row {i}") for i in range(25)]
+
+
+def make_list_fn(n_params: int):
+    """Build a list function with n_params search filters plus pagination."""
+    params = ", ".join(
+        f"f{i}: Annotated[str | None, AdminField(filter='search')] = None" for i in range(n_params)
+    )
+    src = (
+        f"def list_rows(page: int = 1, page_size: int = 25, {params}) -> Page[Row]:\n"
+        f"    return Page(items=ROWS, total=len(ROWS), page=page, page_size=page_size)\n"
+    )
+    namespace = {"Annotated": Annotated, "AdminField": AdminField, "Page": Page, "Row": Row, "ROWS": ROWS}
+    exec(src, namespace)
+    return namespace["list_rows"]
+
+
+def legacy_prepare(fn, kwargs):
+    """The work the handler used to do on every request before calling list_fn."""
+    sig = inspect.signature(fn)
+    find_pagination_params(fn)
+    find_sort_param(fn)
+    return {k: v for k, v in kwargs.items() if k in sig.parameters}
+
+
+def time_per_call(func, *args, n=REQUESTS) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        func(*args)
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def main():
+    print(f"{'params':>8} {'legacy prep µs':>16} {'plan prep µs':>14} {'/rows µs':>10}")
+    for size in SIGNATURE_SIZES:
+        fn = make_list_fn(size)
+        site = AdminSite(title="Bench")
+        res = site.resource("rows", list=fn)
+        client = TestClient(site.as_asgi())
+        plan = res.plans["list"]
+        kwargs = {"page": 1, "page_size": 25, "f0": "x"}
+
+        legacy = time_per_call(legacy_prepare, fn, kwargs)
+        planned = time_per_call(plan.bind, kwargs)
+
+        client.get("/rows/rows")  # warm up
+        start = time.perf_counter()
+        for _ in range(REQUESTS):
+            client.get("/rows/rows?f0=x")
+        end_to_end = (time.perf_counter() - start) / REQUESTS * 1e6
+
+        print(f"{size:>8} {legacy:>16.1f} {planned:>14.2f} {end_to_end:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Bytes on the wire for /rows, uncompressed vs each available encoding, as page size grows.
+
+    uv run python benchmarks/bench_compression.py
+"""
+import asyncio
+import time
+
+from pydantic import BaseModel
+
+from typeboard.compression import available_encodings
+from typeboard.site import AdminSite
+
+PAGE_SIZES = (25, 100, 1_000, 10_000)
+
+
+class Row(BaseModel):
+    id: int
+    name: str
+    email: str
+    status: str
+
+
+ROWS = [Row(id=i, name=f"user {i}", email=f"user{i}@example.com", status="active") for i in range(max(PAGE_SIZES))]
+
+
+def list_rows() -> list[Row]:
+    return ROWS
+
+
+def delete_row(id: int) -> None:
+    ...
+
+
+async def measure(app, page_size: int, encoding: str) -> tuple[int, float]:
+    """Return (body bytes sent, total ms) for one GET /rows/rows request."""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": "/rows/rows", "raw_path": b"/rows/rows", "root_path": "",
+        "query_string": f"page_size={page_size}".encode(),
+        "headers": [(b"accept-encoding", encoding.encode())], "server": ("test", 80), "client": ("test", 1234),
+    }
+    sent = 0
+    requested = False
+    done = asyncio.Event()
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal sent
+        if message["type"] != "http.response.body":
+            return
+        sent += len(message.get("body", b""))
+        if not message.get("more_body"):
+            done.set()
+
+    start = time.perf_counter()
+    await app(scope, receive, send)
+    return sent, (time.perf_counter() - start) * 1e3
+
+
+async def main():
+    encodings = ("identity", *available_encodings())
+    print(f"{'rows':>7} {'streamed':>9} {'encoding':>9} {'bytes':>11} {'ratio':>7} {'ms':>8}")
+    for streaming in (False, True):
+        site = AdminSite(title="Bench", streaming=streaming, compression=True)
+        site.resource("rows", list=list_rows, delete=delete_row)
+        app = site.as_asgi()
+        await measure(app, 10, "identity")  # warm up template compilation
+        for size in PAGE_SIZES:
+            baseline = None
+            for encoding in encodings:
+                sent, ms = await measure(app, size, encoding)
+                baseline = baseline or sent
+                print(f"{size:>7} {str(streaming):>9} {encoding:>9} {sent:>11,} {baseline / sent:>6.1f}x {ms:>8.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,85 @@
+"""Time-to-first-byte and peak memory of /rows, buffered vs streamed, as page size grows.
+
+    uv run python benchmarks/bench_streaming.py
+"""
+import asyncio
+import time
+import tracemalloc
+
+from pydantic import BaseModel
+
+from typeboard.site import AdminSite
+
+PAGE_SIZES = (100, 1_000, 10_000)
+
+
+class Row(BaseModel):
+    id: int
+    name: str
+    email: str
+    status: str
+
+
+ROWS = [Row(id=i, name=f"user {i}", email=f"user{i}@example.com", status="active") for i in range(max(PAGE_SIZES))]
+
+
+def list_rows() -> list[Row]:
+    return ROWS
+
+
+def delete_row(id: int) -> None:
+    ...
+
+
+async def measure(app, page_size: int) -> tuple[float, float, int]:
+    """Return (ttfb ms, total ms, peak KiB) for one GET /rows/rows request."""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": "/rows/rows", "raw_path": b"/rows/rows", "root_path": "",
+        "query_string": f"page_size={page_size}".encode(), "headers": [], "server": ("test", 80),
+        "client": ("test", 1234),
+    }
+    first_byte: list[float] = []
+    requested = False
+    done = asyncio.Event()
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] != "http.response.body":
+            return
+        if message.get("body") and not first_byte:
+            first_byte.append(time.perf_counter())
+        if not message.get("more_body"):
+            done.set()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    await app(scope, receive, send)
+    end = time.perf_counter()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (first_byte[0] - start) * 1e3, (end - start) * 1e3, peak // 1024
+
+
+async def main():
+    print(f"{'rows':>7} {'mode':>9} {'ttfb ms':>9} {'total ms':>9} {'peak KiB':>9}")
+    for streaming in (False, True):
+        site = AdminSite(title="Bench", streaming=streaming)
+        site.resource("rows", list=list_rows, delete=delete_row)
+        app = site.as_asgi()
+        await measure(app, 10)  # warm up template compilation
+        for size in PAGE_SIZES:
+            ttfb, total, peak = await measure(app, size)
+            mode = "streamed" if streaming else "buffered"
+            print(f"{size:>7} {mode:>9} {ttfb:>9.1f} {total:>9.1f} {peak:>9}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,71 @@
+"""Benchmark typeboard's request hot paths against synthetic sites.
+
+    uv run python -m benchmarks.suite run --output benchmarks/baselines/default.json
+    uv run python -m benchmarks.suite run --output /tmp/current.json
+    uv run python -m benchmarks.suite compare benchmarks/baselines/default.json /tmp/current.json
+
+`compare` exits non-zero when any metric regressed by more than --threshold.
+"""
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from benchmarks.suite.compare import compare
+from benchmarks.suite.runner import run
+from benchmarks.suite.synthetic import Shape
+
+
+def _print_run(data: dict) -> None:
+    print(f"shape: {data['shape']}")
+    print(f"{'scenario':<14} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'alloc KiB':>10}")
+    for r in data["results"]:
+        print(
+            f"{r['scenario']:<14} {r['throughput_rps']:>9.0f} {r['p50_ms']:>8.2f} "
+            f"{r['p99_ms']:>8.2f} {r['alloc_kib_per_request']:>10.1f}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_p = sub.add_parser("run", help="benchmark every scenario and optionally save the results")
+    run_p.add_argument("--resources", type=int, default=Shape.resources)
+    run_p.add_argument("--fields", type=int, default=Shape.fields)
+    run_p.add_argument("--relationships", type=int, default=Shape.relationships)
+    run_p.add_argument("--rows", type=int, default=Shape.rows)
+    run_p.add_argument("--async", dest="use_async", action="store_true", help="register async callables")
+    run_p.add_argument("--requests", type=int, default=300, help="timed requests per scenario")
+    run_p.add_argument("--rounds", type=int, default=3, help="timed rounds per scenario (medians are reported)")
+    run_p.add_argument("--only", nargs="*", help="scenario names to run")
+    run_p.add_argument("--output", type=Path, help="write results as JSON")
+
+    cmp_p = sub.add_parser("compare", help="compare a run against a baseline")
+    cmp_p.add_argument("baseline", type=Path)
+    cmp_p.add_argument("current", type=Path)
+    cmp_p.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown as a fraction")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        shape = Shape(args.resources, args.fields, args.relationships, args.rows, args.use_async)
+        data = asyncio.run(run(shape, args.requests, args.rounds, set(args.only) if args.only else None))
+        _print_run(data)
+        if args.output:
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            args.output.write_text(json.dumps(data, indent=2) + "\n")
+        return 0
+
+    lines, regressions = compare(json.loads(args.baseline.read_text()), json.loads(args.current.read_text()), args.threshold)
+    print("\n".join(lines))
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}:", file=sys.stderr)
+        for r in regressions:
+            print(f"  {r}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+"""Compare two saved benchmark runs and flag regressions."""
+
+# metric -> True when higher is better
+METRICS = {
+    "throughput_rps": True,
+    "p50_ms": False,
+    "p99_ms": False,
+    "alloc_kib_per_request": False,
+}
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.10) -> tuple[list[str], list[str]]:
+    """Return (report lines, regressions) for scenarios present in both runs.
+
+    A metric regresses when it is worse than the baseline by more than threshold
+    (a fraction, 0.10 = 10%).
+    """
+    if baseline.get("shape") != current.get("shape"):
+        raise ValueError("runs were made with different site shapes; rerun with the baseline's shape")
+    base = {r["scenario"]: r for r in baseline["results"]}
+    lines = [f"{'scenario':<14} {'metric':<22} {'baseline':>10} {'current':>10} {'change':>8}"]
+    regressions = []
+    for result in current["results"]:
+        before = base.get(result["scenario"])
+        if before is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            old, new = before[metric], result[metric]
+            change = (new - old) / old if old else 0.0
+            worse = -change if higher_is_better else change
+            flag = " !" if worse > threshold else ""
+            lines.append(f"{result['scenario']:<14} {metric:<22} {old:>10.2f} {new:>10.2f} {change:>+7.1%}{flag}")
+            if flag:
+                regressions.append(f"{result['scenario']} {metric}: {old:.2f} -> {new:.2f} ({change:+.1%})")
+    return lines, regressions
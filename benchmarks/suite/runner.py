@@ -0,0 +1,149 @@
+"""Drive the admin ASGI app in-process and measure each hot path."""
+import asyncio
+import gc
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from urllib.parse import urlencode
+
+from benchmarks.suite.synthetic import Shape, build_site, form_values
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    method: str
+    path: str
+    body: bytes = b""
+
+
+@dataclass
+class Result:
+    scenario: str
+    requests: int
+    throughput_rps: float
+    p50_ms: float
+    p99_ms: float
+    alloc_kib_per_request: float
+
+
+def scenarios(shape: Shape) -> list[Scenario]:
+    res = shape.resource_id(0)
+    form = urlencode(form_values(shape, 0)).encode()
+    found = [
+        Scenario("rows", "GET", f"/{res}/rows?page=2&page_size=25"),
+        Scenario("rows_search", "GET", f"/{res}/rows?f0=value%201"),
+        Scenario("detail", "GET", f"/{res}/3"),
+        Scenario("create_form", "GET", f"/{res}/new"),
+        Scenario("create_submit", "POST", f"/{res}/new", form),
+        Scenario("edit_submit", "POST", f"/{res}/3/edit", form),
+    ]
+    if shape.relationships:
+        found.insert(3, Scenario("options", "GET", f"/{res}/options/rel0_id?q=value&selected=1&selected=2"))
+    return found
+
+
+async def request(app, scenario: Scenario) -> int:
+    """Send one request through the ASGI app; returns the status code."""
+    path, _, query = scenario.path.partition("?")
+    headers = [(b"host", b"bench")]
+    if scenario.body:
+        headers += [
+            (b"content-type", b"application/x-www-form-urlencoded"),
+            (b"content-length", str(len(scenario.body)).encode()),
+        ]
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": scenario.method,
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "",
+        "query_string": query.encode(), "headers": headers, "server": ("bench", 80), "client": ("bench", 1234),
+    }
+    status = 0
+    requested = False
+    done = asyncio.Event()
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": scenario.body, "more_body": False}
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body" and not message.get("more_body"):
+            done.set()
+
+    await app(scope, receive, send)
+    return status
+
+
+async def measure(app, scenario: Scenario, requests: int, rounds: int = 3, warmup: int = 20) -> Result:
+    for _ in range(warmup):
+        status = await request(app, scenario)
+        if status >= 400:
+            raise RuntimeError(f"{scenario.name}: {scenario.method} {scenario.path} returned {status}")
+
+    # Median of several timed rounds, so one noisy round doesn't move the numbers
+    per_round = []
+    for _ in range(rounds):
+        gc.collect()
+        latencies = []
+        start = time.perf_counter()
+        for _ in range(requests):
+            t0 = time.perf_counter()
+            await request(app, scenario)
+            latencies.append((time.perf_counter() - t0) * 1e3)
+        elapsed = time.perf_counter() - start
+        latencies.sort()
+        per_round.append((
+            requests / elapsed,
+            statistics.median(latencies),
+            latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        ))
+
+    # Allocations are sampled in a separate pass: tracemalloc skews timings
+    alloc_samples = min(requests, 50)
+    tracemalloc.start()
+    try:
+        peaks = []
+        for _ in range(alloc_samples):
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            await request(app, scenario)
+            peaks.append(tracemalloc.get_traced_memory()[1] - base)
+    finally:
+        tracemalloc.stop()
+
+    throughput, p50, p99 = (statistics.median(metric) for metric in zip(*per_round))
+    return Result(
+        scenario=scenario.name,
+        requests=requests,
+        throughput_rps=throughput,
+        p50_ms=p50,
+        p99_ms=p99,
+        alloc_kib_per_request=statistics.mean(peaks) / 1024,
+    )
+
+
+async def run(shape: Shape, requests: int, rounds: int = 3, only: set[str] | None = None) -> dict:
+    """Benchmark every scenario against a freshly built synthetic site."""
+    app = build_site(shape).as_asgi()
+    results = []
+    for scenario in scenarios(shape):
+        if only and scenario.name not in only:
+            continue
+        results.append(asdict(await measure(app, scenario, requests, rounds)))
+    return {
+        "shape": asdict(shape),
+        "requests": requests,
+        "rounds": rounds,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
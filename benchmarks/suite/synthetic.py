@@ -0,0 +1,137 @@
+"""Synthetic AdminSites: N resources x M fields x K relationships over in-memory stores."""
+import enum
+import functools
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import BaseModel, create_model
+
+from typeboard.fields import AdminField
+from typeboard.pagination import Page
+from typeboard.site import AdminSite
+
+
+class Status(enum.Enum):
+    ACTIVE = "active"
+    PAUSED = "paused"
+    ARCHIVED = "archived"
+
+
+# Field types cycled through for the M plain fields, with a valid form value for each
+FIELD_KINDS: tuple[tuple[type, str], ...] = (
+    (str, "text"),
+    (int, "42"),
+    (Status, "paused"),
+    (bool, "on"),
+    (datetime, "2024-05-01T12:00"),
+    (float, "3.5"),
+)
+
+
+@dataclass(frozen=True)
+class Shape:
+    resources: int = 5
+    fields: int = 10
+    relationships: int = 2
+    rows: int = 500
+    use_async: bool = False
+
+    def resource_id(self, i: int) -> str:
+        return f"res{i}"
+
+    def relationship_targets(self, i: int) -> list[str]:
+        return [self.resource_id((i + k + 1) % self.resources) for k in range(self.relationships)]
+
+
+def _plain_field(j: int):
+    python_type, _ = FIELD_KINDS[j % len(FIELD_KINDS)]
+    if j == 0:
+        return Annotated[str, AdminField(display_name=True, filter="search")], ...
+    return python_type, ...
+
+
+def _sample_value(python_type: type, row: int):
+    if python_type is str:
+        return f"value {row}"
+    if python_type is int:
+        return row
+    if python_type is Status:
+        return list(Status)[row % 3]
+    if python_type is bool:
+        return row % 2 == 0
+    if python_type is datetime:
+        return datetime(2024, 1, 1 + row % 28)
+    return row / 2
+
+
+def form_values(shape: Shape, i: int) -> dict[str, str]:
+    """A valid submitted form for resource i's create/edit form."""
+    values = {f"f{j}": FIELD_KINDS[j % len(FIELD_KINDS)][1] for j in range(shape.fields)}
+    for k, _ in enumerate(shape.relationship_targets(i)):
+        values[f"rel{k}_id"] = "1"
+    return values
+
+
+def _make_callables(model: type[BaseModel], create_model_cls: type[BaseModel], store: dict[int, BaseModel], use_async: bool):
+    def list_fn(page: int = 1, page_size: int = 25, f0: Annotated[str | None, AdminField(filter="search")] = None):
+        rows = list(store.values())
+        if f0:
+            rows = [r for r in rows if f0 in r.f0]
+        start = (page - 1) * page_size
+        return Page(items=rows[start:start + page_size], total=len(rows), page=page, page_size=page_size)
+
+    def get_fn(id: int):
+        return store.get(id)
+
+    def get_many_fn(ids: list[int]):
+        return [store[i] for i in ids if i in store]
+
+    def create_fn(data):
+        new_id = max(store, default=0) + 1
+        store[new_id] = model(id=new_id, **data.model_dump())
+        return store[new_id]
+
+    def update_fn(id: int, data):
+        store[id] = model(id=id, **data.model_dump())
+        return store[id]
+
+    list_fn.__annotations__["return"] = Page[model]
+    get_fn.__annotations__["return"] = model
+    get_many_fn.__annotations__["return"] = list[model]
+    create_fn.__annotations__.update({"data": create_model_cls, "return": model})
+    update_fn.__annotations__.update({"data": create_model_cls, "return": model})
+    fns = {"list": list_fn, "get": get_fn, "get_many": get_many_fn, "create": create_fn, "update": update_fn}
+    if not use_async:
+        return fns
+    return {op: _as_async(fn) for op, fn in fns.items()}
+
+
+def _as_async(fn):
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        return fn(*args, **kwargs)
+
+    return wrapper
+
+
+def build_site(shape: Shape, **site_kwargs) -> AdminSite:
+    """An AdminSite whose resources each have shape.fields fields and shape.relationships relationships."""
+    site = AdminSite(title="Bench", **site_kwargs)
+    for i in range(shape.resources):
+        fields = {f"f{j}": _plain_field(j) for j in range(shape.fields)}
+        for k, target in enumerate(shape.relationship_targets(i)):
+            fields[f"rel{k}_id"] = (Annotated[int, AdminField(relationship=target)], ...)
+        create_model_cls = create_model(f"Res{i}Create", **fields)
+        model = create_model(f"Res{i}", id=(int, ...), **fields)
+        store = {
+            row: model(
+                id=row,
+                **{f"f{j}": _sample_value(FIELD_KINDS[j % len(FIELD_KINDS)][0], row) for j in range(shape.fields)},
+                **{f"rel{k}_id": 1 + (row * 7 + k) % shape.rows for k in range(shape.relationships)},
+            )
+            for row in range(1, shape.rows + 1)
+        }
+        fns = _make_callables(model, create_model_cls, store, shape.use_async)
+        site.resource(shape.resource_id(i), **fns)
+    return site
@@ -0,0 +1,33 @@
+"""Wheel build hook: refuse to build without the vendored front-end assets.
+
+assets="local" serves typeboard/static, which isn't downloaded by the build
+itself. A wheel built before `python -m typeboard.assets` has run would
+install fine and then fail at startup on an offline network, so fail here.
+"""
+import importlib.util
+from pathlib import Path
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+def _load_assets_module(root: str):
+    # typeboard/__init__ imports fastapi, which the isolated build env lacks
+    spec = importlib.util.spec_from_file_location("_typeboard_assets", Path(root) / "typeboard" / "assets.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class VendoredAssetsHook(BuildHookInterface):
+    PLUGIN_NAME = "vendored-assets"
+
+    def initialize(self, version: str, build_data: dict) -> None:
+        if version == "editable":
+            return
+        assets = _load_assets_module(self.root)
+        missing = [asset.path for asset in assets.VENDORED if not (assets.STATIC_DIR / asset.path).is_file()]
+        if missing:
+            raise RuntimeError(
+                f"{len(missing)} vendored asset(s) missing from typeboard/static (e.g. {missing[0]}); "
+                "run `uv run python -m typeboard.assets` before building a wheel"
+            )
@@ -0,0 +1,76 @@
+import gzip
+
+import pytest
+from fastapi.testclient import TestClient
+
+from typeboard import assets
+from typeboard.site import AdminSite
+
+
+@pytest.fixture
+def static_dir(tmp_path, monkeypatch):
+    for asset in assets.VENDORED:
+        path = tmp_path / asset.path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(f"/* {asset.path} */".encode())
+    css = tmp_path / assets.PAGE_ASSETS["bootstrap.css"].path
+    css.with_name(css.name + ".gz").write_bytes(gzip.compress(css.read_bytes()))
+    monkeypatch.setattr(assets, "STATIC_DIR", tmp_path)
+    assets.assets_digest.cache_clear()
+    yield tmp_path
+    assets.assets_digest.cache_clear()
+
+
+def test_cdn_mode_is_default():
+    html = TestClient(AdminSite(title="Test").as_asgi()).get("/").text
+    assert "https://cdn.jsdelivr.net/npm/bootstrap@5.3.8" in html
+    assert "/_static/" not in html
+
+
+def test_local_mode_serves_fingerprinted_assets(static_dir):
+    client = TestClient(AdminSite(title="Test", assets="local").as_asgi())
+    html = client.get("/").text
+    digest = assets.assets_digest()
+    url = f"/_static/{digest}/bootstrap/bootstrap.min.css"
+    assert url in html and "cdn.jsdelivr.net" not in html
+
+    resp = client.get(url, headers={"Accept-Encoding": "gzip, br"})
+    assert resp.status_code == 200
+    assert resp.headers["cache-control"] == assets.IMMUTABLE
+    assert resp.headers["content-encoding"] == "gzip"
+    assert resp.headers["content-type"].startswith("text/css")
+    assert resp.text == "/* bootstrap/bootstrap.min.css */"
+
+    resp = client.get(f"/_static/{digest}/htmx/htmx.min.js", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in resp.headers
+    assert client.get(f"/_static/{digest}/fontawesome/webfonts/fa-solid-900.woff2").status_code == 200
+
+
+def test_local_mode_rejects_stale_digest_and_traversal(static_dir):
+    client = TestClient(AdminSite(title="Test", assets="local").as_asgi())
+    digest = assets.assets_digest()
+    assert client.get("/_static/000000000000/htmx/htmx.min.js").status_code == 404
+    assert client.get(f"/_static/{digest}/..%2F..%2Fetc%2Fpasswd").status_code == 404
+
+
+def test_local_mode_requires_vendored_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(assets, "STATIC_DIR", tmp_path)
+    assets.assets_digest.cache_clear()
+    with pytest.raises(RuntimeError, match="python -m typeboard.assets"):
+        AdminSite(title="Test", assets="local").as_asgi()
+    assets.assets_digest.cache_clear()
+
+
+@pytest.mark.skipif(
+    assets.assets_digest() is None,
+    reason="vendored assets not generated; run `python -m typeboard.assets`",
+)
+def test_packaged_assets_are_served():
+    client = TestClient(AdminSite(title="Test", assets="local").as_asgi())
+    digest = assets.assets_digest()
+    for asset in assets.VENDORED:
+        resp = client.get(f"/_static/{digest}/{asset.path}", headers={"Accept-Encoding": "gzip"})
+        assert resp.status_code == 200, asset.path
+        assert resp.content == (assets.STATIC_DIR / asset.path).read_bytes()
+        if asset.path.endswith(assets.COMPRESSIBLE):
+            assert resp.headers["content-encoding"] == "gzip"
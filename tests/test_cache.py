@@ -0,0 +1,62 @@
+import time
+
+from typeboard.cache import ChoicesCache, LabelCache
+
+
+def test_disabled_cache_misses_everything():
+    cache = LabelCache(max_size=0)
+    cache.set("users", 1, "Ada")
+    assert cache.get("users", 1) is None
+    assert len(cache) == 0
+
+
+def test_get_many_counts_hits_and_misses():
+    cache = LabelCache(max_size=10)
+    cache.set_many("users", {1: "Ada", 2: "Bob"})
+    found, missing = cache.get_many("users", [1, "2", 3])
+    assert found == {"1": "Ada", "2": "Bob"}
+    assert missing == [3]
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 1
+
+
+def test_lru_eviction():
+    cache = LabelCache(max_size=2)
+    cache.set("users", 1, "Ada")
+    cache.set("users", 2, "Bob")
+    cache.get("users", 1)
+    cache.set("users", 3, "Cy")
+    assert cache.get("users", 2) is None
+    assert cache.get("users", 1) == "Ada"
+
+
+def test_ttl_expiry():
+    cache = LabelCache(max_size=10, ttl=0.01)
+    cache.set("users", 1, "Ada")
+    time.sleep(0.02)
+    assert cache.get("users", 1) is None
+    assert len(cache) == 0
+
+
+def test_invalidate_single_and_resource():
+    cache = LabelCache(max_size=10)
+    cache.set_many("users", {1: "Ada", 2: "Bob"})
+    cache.set("orgs", 1, "Acme")
+    cache.invalidate("users", 1)
+    assert cache.get("users", 1) is None
+    assert cache.get("users", 2) == "Bob"
+    cache.invalidate("users")
+    assert cache.get("users", 2) is None
+    assert cache.get("orgs", 1) == "Acme"
+
+
+def test_choices_cache_ttl_and_value_keys():
+    cache = ChoicesCache(max_size=2)
+    key = cache.key(len, {"tenant": "a"})
+    assert cache.get(key) == (False, None)
+    cache.set(key, [("1", "One")], ttl=0.01)
+    assert cache.get(key) == (True, [("1", "One")])
+    time.sleep(0.02)
+    assert cache.get(key) == (False, None)
+    # Non-value arguments (sessions, lists) are left out of the key
+    assert cache.key(len, {"db": [], "tenant": "a", "session": object()}) == key
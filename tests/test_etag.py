@@ -0,0 +1,78 @@
+from typing import Annotated
+
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from typeboard.etag import compute_etag
+from typeboard.fields import AdminField
+from typeboard.site import AdminSite
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    revision: Annotated[int, AdminField(version=True)] = 1
+
+
+def test_compute_etag_is_strong_and_stable():
+    etag = compute_etag("items", (("page", "1"),), 3)
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == compute_etag("items", (("page", "1"),), 3)
+    assert etag != compute_etag("items", (("page", "1"),), 4)
+
+
+def test_version_hook_skips_list_fn():
+    state = {"version": 1, "list_calls": 0, "get_calls": 0}
+
+    def list_items() -> list[Item]:
+        state["list_calls"] += 1
+        return [Item(id=1, name="Alpha")]
+
+    def get_item(id: int) -> Item:
+        state["get_calls"] += 1
+        return Item(id=id, name="Alpha")
+
+    def items_version(id: int | None = None) -> int:
+        return state["version"]
+
+    site = AdminSite(title="Test")
+    site.resource("items", list=list_items, get=get_item, version=items_version)
+    client = TestClient(site.as_asgi())
+
+    first = client.get("/items/rows?sort=name")
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+    resp = client.get("/items/rows?sort=name", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert state["list_calls"] == 1
+    # Different query params -> different ETag
+    assert client.get("/items/rows?sort=id").headers["etag"] != etag
+
+    detail = client.get("/items/1")
+    assert client.get("/items/1", headers={"If-None-Match": detail.headers["etag"]}).status_code == 304
+    assert state["get_calls"] == 1
+
+    state["version"] = 2
+    assert client.get("/items/rows?sort=name", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_version_column_skips_rendering():
+    items = [Item(id=1, name="Alpha")]
+
+    def list_items() -> list[Item]:
+        return items
+
+    site = AdminSite(title="Test")
+    site.resource("items", list=list_items)
+    client = TestClient(site.as_asgi())
+
+    etag = client.get("/items/rows").headers["etag"]
+    assert client.get("/items/rows", headers={"If-None-Match": etag}).status_code == 304
+    items[0] = Item(id=1, name="Alpha 2", revision=2)
+    assert client.get("/items/rows", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_no_etag_without_version():
+    site = AdminSite(title="Test")
+    site.resource("items", list=lambda: [])
+    assert "etag" not in TestClient(site.as_asgi()).get("/items/rows").headers
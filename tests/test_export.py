@@ -0,0 +1,95 @@
+import json
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Annotated
+
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from typeboard.fields import AdminField
+from typeboard.pagination import CursorPage, Page
+from typeboard.site import AdminSite
+
+
+class Item(BaseModel):
+    id: int
+    name: Annotated[str, AdminField(filter="search")]
+    updated_at: Annotated[datetime, AdminField(updated_at=True)]
+
+
+ITEMS = [Item(id=i, name=f"Item {i}", updated_at=datetime(2024, 1, i)) for i in range(1, 11)]
+
+
+def test_export_csv_walks_pages():
+    calls = []
+
+    def list_items(page: int = 1, page_size: int = 25, name: Annotated[str | None, AdminField(filter="search")] = None) -> Page[Item]:
+        calls.append(page)
+        rows = [i for i in ITEMS if not name or name in i.name]
+        start = (page - 1) * page_size
+        return Page(items=rows[start:start + page_size], total=len(rows), page=page, page_size=page_size)
+
+    site = AdminSite(title="Test", export_page_size=3)
+    site.resource("items", list=list_items)
+    resp = TestClient(site.as_asgi()).get("/items/export?format=csv")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+    assert 'filename="items.csv"' in resp.headers["content-disposition"]
+    lines = resp.text.strip().splitlines()
+    assert lines[0] == "id,name,updated_at"
+    assert lines[1] == "1,Item 1,2024-01-01T00:00:00"
+    assert len(lines) == 11
+    assert calls == [1, 2, 3, 4]
+
+
+def test_export_ndjson_follows_cursor_with_prefetch():
+    def list_items(cursor: str | None = None, page_size: int = 25) -> CursorPage[Item]:
+        start = int(cursor or 0)
+        nxt = start + page_size
+        return CursorPage(items=ITEMS[start:nxt], next_cursor=str(nxt) if nxt < len(ITEMS) else None)
+
+    site = AdminSite(title="Test", export_page_size=4, export_prefetch=True)
+    site.resource("items", list=list_items)
+    resp = TestClient(site.as_asgi()).get("/items/export?format=ndjson")
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert [r["id"] for r in rows] == list(range(1, 11))
+    assert rows[0] == {"id": 1, "name": "Item 1", "updated_at": "2024-01-01T00:00:00"}
+
+
+def test_export_since_and_filters():
+    def list_items(name: Annotated[str | None, AdminField(filter="search")] = None) -> Iterator[Item]:
+        return (i for i in ITEMS if not name or name in i.name)
+
+    site = AdminSite(title="Test")
+    site.resource("items", list=list_items)
+    client = TestClient(site.as_asgi())
+    resp = client.get("/items/export?format=ndjson&since=2024-01-08")
+    assert [json.loads(line)["id"] for line in resp.text.splitlines()] == [8, 9, 10]
+    resp = client.get("/items/export?format=ndjson&name=Item 1")
+    assert [json.loads(line)["id"] for line in resp.text.splitlines()] == [1, 10]
+
+
+def test_export_rejects_bad_requests():
+    class Plain(BaseModel):
+        id: int
+
+    site = AdminSite(title="Test")
+    site.resource("items", list=lambda: ITEMS)
+    site.resource("plain", list=lambda: [Plain(id=1)])
+    client = TestClient(site.as_asgi())
+    assert client.get("/items/export?format=xml").status_code == 400
+    assert client.get("/plain/export?since=2024-01-01").status_code == 400
+    assert client.get("/items/export?page_size=abc").status_code == 400
+    assert client.get("/items/export?page_size=0").status_code == 400
+
+
+def test_export_since_mixes_naive_and_aware_datetimes():
+    def list_items() -> list[Item]:
+        return ITEMS
+
+    site = AdminSite(title="Test")
+    site.resource("items", list=list_items)
+    client = TestClient(site.as_asgi())
+    # Naive rows are taken as UTC; 2024-01-08T12:00+12:00 is 2024-01-08T00:00Z
+    resp = client.get("/items/export", params={"format": "ndjson", "since": "2024-01-08T12:00:00+12:00"})
+    assert [json.loads(line)["id"] for line in resp.text.splitlines()] == [8, 9, 10]
@@ -4,6 +4,7 @@ from typing import Annotated
 
 from typeboard.fields import (
     AdminField,
+    compile_coercer,
     extract_admin_field,
     get_enum_choices,
     infer_widget,
@@ -73,3 +74,38 @@ def test_get_enum_choices():
 def test_label_from_name():
     assert label_from_name("iam_org_id") == "Iam Org Id"
     assert label_from_name("name") == "Name"
+
+
+class Priority(enum.Enum):
+    LOW = 1
+    HIGH = 2
+
+
+def test_compile_coercer_scalars():
+    assert compile_coercer(int)("3") == 3
+    assert compile_coercer(float)("1.5") == 1.5
+    assert compile_coercer(bool)("on") is True
+    assert compile_coercer(bool)("off") is False
+    assert compile_coercer(date)("2024-01-02") == date(2024, 1, 2)
+    assert compile_coercer(datetime)("2024-01-02T03:04") == datetime(2024, 1, 2, 3, 4)
+    assert compile_coercer(str)(5) == "5"
+    assert compile_coercer(int)("") is None
+
+
+def test_compile_coercer_optional():
+    assert compile_coercer(int | None)("7") == 7
+
+
+def test_compile_coercer_enum_lookup():
+    assert compile_coercer(Color)("red") is Color.RED
+    # Form values arrive as strings, even for non-string enum values
+    assert compile_coercer(Priority)("2") is Priority.HIGH
+    assert compile_coercer(Priority)(1) is Priority.LOW
+
+
+def test_compile_coercer_list():
+    coerce = compile_coercer(list[int])
+    assert coerce(["1", "2"]) == [1, 2]
+    assert coerce("3") == [3]
+    assert coerce("") == []
+    assert compile_coercer(list[Color])(["red", "blue"]) == [Color.RED, Color.BLUE]
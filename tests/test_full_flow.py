@@ -1,7 +1,11 @@
+from collections.abc import AsyncIterator, Iterator
+from typing import Annotated
+
 from fastapi.testclient import TestClient
 from pydantic import BaseModel
 
-from typeboard.pagination import Page
+from typeboard.fields import AdminField
+from typeboard.pagination import CursorPage, Page
 from typeboard.site import AdminSite
 
 
@@ -47,3 +51,107 @@ def test_detail_page():
     resp = client.get("/items/1")
     assert resp.status_code == 200
     assert "Alpha" in resp.text
+
+
+def list_items_cursor(
+    after: Annotated[str | None, AdminField(pagination="cursor")] = None,
+    page_size: int = 25,
+) -> CursorPage[Item]:
+    start = int(after) if after else 0
+    items = ITEMS[start:start + 1]
+    next_cursor = str(start + 1) if start + 1 < len(ITEMS) else None
+    prev_cursor = str(start - 1) if start > 0 else None
+    return CursorPage(items=items, next_cursor=next_cursor, prev_cursor=prev_cursor)
+
+
+def test_rows_cursor_pagination():
+    site = AdminSite(title="Test")
+    site.resource("items", list=list_items_cursor, get=get_item)
+    client = TestClient(site.as_asgi())
+    resp = client.get("/items/rows?sort=name")
+    assert "Alpha" in resp.text and "Beta" not in resp.text
+    # Next link carries the opaque token and keeps the current query
+    assert "/items/rows?sort=name&amp;cursor=1" in resp.text
+    resp = client.get("/items/rows?cursor=1")
+    assert "Beta" in resp.text and "Alpha" not in resp.text
+    assert "cursor=0" in resp.text
+
+
+def list_items_no_count(page: int = 1, page_size: int = 1) -> Page[Item]:
+    return Page(items=ITEMS[page - 1:page], total=None, page=page, page_size=page_size)
+
+
+def count_items() -> int:
+    return 1_234_567
+
+
+def test_rows_defers_count():
+    site = AdminSite(title="Test")
+    site.resource("items", list=list_items_no_count, get=get_item, count=count_items)
+    client = TestClient(site.as_asgi())
+    resp = client.get("/items/rows?page=1&page_size=1")
+    assert "Page 1" in resp.text
+    assert 'hx-get="/items/rows/count?page_size=1"' in resp.text
+    resp = client.get("/items/rows/count")
+    assert "1,234,567 records" in resp.text
+
+
+def test_unknown_count_leaves_the_footer_alone():
+    site = AdminSite(title="Test")
+    site.resource("items", list=list_items_no_count, get=get_item, lazy_count=True)
+    site.resource("others", list=list_items_no_count, count=lambda: None)
+    client = TestClient(site.as_asgi())
+    assert 'hx-get="/items/rows/count' in client.get("/items/rows?page_size=1").text
+    # A Page without total has nothing to count, and neither does a count hook returning None
+    assert client.get("/items/rows/count").status_code == 204
+    assert client.get("/others/rows/count").status_code == 204
+
+def test_rows_approximate_total():
+    def list_estimated(page: int = 1, page_size: int = 1) -> Page[Item]:
+        return Page(items=ITEMS[page - 1:page], total=1_200_000, page=page, page_size=page_size, approximate=True)
+
+    site = AdminSite(title="Test")
+    site.resource("items", list=list_estimated, get=get_item)
+    client = TestClient(site.as_asgi())
+    assert "about 1.2M records" in client.get("/items/rows?page_size=1").text
+
+
+def test_streaming_render_matches_buffered():
+    buffered = AdminSite(title="Test")
+    buffered.resource("items", list=list_items, get=get_item)
+    streamed = AdminSite(title="Test", streaming={"_table_rows.html"})
+    streamed.resource("items", list=list_items, get=get_item)
+
+    expected = TestClient(buffered.as_asgi()).get("/items/rows")
+    resp = TestClient(streamed.as_asgi()).get("/items/rows")
+    assert resp.status_code == 200
+    assert "text/html" in resp.headers["content-type"]
+    assert "content-length" not in resp.headers
+    assert resp.text == expected.text
+
+
+def test_rows_from_generator():
+    def list_lines() -> Iterator[Item]:
+        for i in range(1, 1001):
+            yield Item(id=i, name=f"Line {i}")
+
+    site = AdminSite(title="Test")
+    site.resource("lines", list=list_lines, lazy_count=True)
+    client = TestClient(site.as_asgi())
+    resp = client.get("/lines/rows?page=3&page_size=10")
+    assert "Line 21" in resp.text and "Line 30" in resp.text
+    assert "Line 31" not in resp.text
+    assert "Page 3" in resp.text
+    assert "/lines/rows/count" in resp.text
+    assert "1,000 records" in client.get("/lines/rows/count").text
+
+
+def test_rows_from_async_generator():
+    async def list_lines() -> AsyncIterator[Item]:
+        for i in range(1, 6):
+            yield Item(id=i, name=f"Line {i}")
+
+    site = AdminSite(title="Test")
+    site.resource("lines", list=list_lines)
+    resp = TestClient(site.as_asgi()).get("/lines/rows?page_size=10")
+    assert "Line 5" in resp.text
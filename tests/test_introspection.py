@@ -1,6 +1,10 @@
+import dataclasses
+import gc
+from collections.abc import AsyncIterator, Iterator
 from typing import Annotated
 
-from pydantic import BaseModel
+import pytest
+from pydantic import BaseModel, create_model
 
 from typeboard.fields import AdminField
 from typeboard.introspection import (
@@ -9,8 +13,10 @@ from typeboard.introspection import (
     extract_fields_from_model,
     extract_page_item_type,
     extract_return_type,
+    find_cursor_param,
+    invalidate_introspection,
 )
-from typeboard.pagination import Page
+from typeboard.pagination import CursorPage, Page
 
 
 class ItemSchema(BaseModel):
@@ -195,3 +201,76 @@ def test_find_sort_param_convention():
 
 def test_find_sort_param_annotation():
     assert find_sort_param(fn_with_annotated_sort) == "order_by"
+
+
+def sample_cursor_list(
+    after: Annotated[str | None, AdminField(pagination="cursor")] = None,
+    page_size: int = 25,
+) -> CursorPage[ItemSchema]:
+    ...
+
+
+def test_cursor_page_columns():
+    assert extract_page_item_type(extract_return_type(sample_cursor_list)) is ItemSchema
+    assert [c.name for c in extract_columns(sample_cursor_list)] == ["id", "name", "description"]
+
+
+def test_find_cursor_param():
+    assert find_cursor_param(sample_cursor_list) == "after"
+    assert find_cursor_param(sample_list) is None
+
+
+def sample_iter_list() -> Iterator[ItemSchema]:
+    yield from ()
+
+
+async def sample_async_iter_list() -> AsyncIterator[ItemSchema]:
+    if False:
+        yield
+
+
+def test_iterator_columns():
+    assert [c.name for c in extract_columns(sample_iter_list)] == ["id", "name", "description"]
+    assert [c.name for c in extract_columns(sample_async_iter_list)] == ["id", "name", "description"]
+
+
+def test_model_introspection_is_memoised_and_frozen():
+    first = extract_fields_from_model(ItemSchema)
+    second = extract_columns(sample_get)
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first[0].label = "Changed"
+    # Callers get their own lists
+    first.pop()
+    assert len(extract_fields_from_model(ItemSchema)) == 3
+
+
+def test_function_introspection_is_memoised_per_skip_id():
+    with_id = extract_fields_from_function(sample_create)
+    assert extract_fields_from_function(sample_create)[0] is with_id[0]
+    assert [f.name for f in extract_fields_from_function(sample_get, skip_id=True)] == []
+    assert [f.name for f in extract_fields_from_function(sample_get)] == ["id"]
+
+
+def test_invalidate_introspection():
+    before = extract_fields_from_model(ItemSchema)[0]
+    invalidate_introspection(ItemSchema)
+    after = extract_fields_from_model(ItemSchema)[0]
+    assert after is not before and after == before
+
+    fn_before = extract_fields_from_function(sample_list)[0]
+    invalidate_introspection()
+    assert extract_fields_from_function(sample_list)[0] is not fn_before
+
+
+def test_introspection_cache_does_not_keep_models_alive():
+    from typeboard import introspection
+
+    model = create_model("Temporary", id=(int, ...))
+    extract_fields_from_model(model)
+    assert model in introspection._model_fields
+    count = len(introspection._model_fields)
+    del model
+    gc.collect()
+    assert len(introspection._model_fields) == count - 1
@@ -0,0 +1,104 @@
+import threading
+
+from fastapi import HTTPException, Request
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from typeboard.site import AdminSite
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+def list_items() -> list[Item]:
+    return [Item(id=1, name="Alpha")]
+
+
+def get_item(id: int) -> Item:
+    return Item(id=id, name="Alpha")
+
+
+def _site(**kwargs) -> AdminSite:
+    site = AdminSite(title="Test", lazy_routes=True, **kwargs)
+    site.resource("items", list=list_items, get=get_item)
+    site.resource("others", list=list_items, get=get_item)
+    return site
+
+
+def test_routes_are_built_on_first_request():
+    site = _site()
+    client = TestClient(site.as_asgi())
+    items, others = site.resources["items"], site.resources["others"]
+    # Nothing introspected at build time
+    assert items._columns is None and others._columns is None
+
+    resp = client.get("/items/rows")
+    assert resp.status_code == 200
+    assert "Alpha" in resp.text
+    assert site._lazy_routes["items"].built
+    assert not site._lazy_routes["others"].built
+    assert others._columns is None
+
+    assert client.get("/items/1").status_code == 200
+    assert client.get("/items/1/nope").status_code == 404
+    assert client.get("/nothing").status_code == 404
+    # Sidebar links to unbuilt resources still render
+    assert "Others" in client.get("/").text
+
+
+def test_lazy_routes_keep_auth_dependency():
+    def require_token(request: Request):
+        if request.headers.get("x-token") != "secret":
+            raise HTTPException(403)
+
+    site = _site(auth_dependency=require_token)
+    client = TestClient(site.as_asgi())
+    assert client.get("/items/rows").status_code == 403
+    assert client.get("/items/rows", headers={"x-token": "secret"}).status_code == 200
+
+
+def test_warmup_builds_selected_resources():
+    site = _site()
+    site.as_asgi()
+    site.warmup("others")
+    assert site._lazy_routes["others"].built
+    assert not site._lazy_routes["items"].built
+    site.warmup()
+    assert site._lazy_routes["items"].built
+
+
+def test_warmup_without_lazy_routes_introspects():
+    site = AdminSite(title="Test")
+    site.resource("items", list=list_items, get=get_item)
+    site.warmup()
+    assert site.resources["items"]._columns is not None
+    assert "get" in site.resources["items"]._plans
+
+
+def test_concurrent_first_requests_build_once():
+    site = _site()
+    app = site.as_asgi()
+    route = site._lazy_routes["items"]
+    builds = []
+    original = route._build
+
+    def counting_build(resource):
+        builds.append(resource.id)
+        return original(resource)
+
+    route._build = counting_build
+    barrier = threading.Barrier(8)
+
+    def hit():
+        barrier.wait()
+        route.build()
+
+    threads = [threading.Thread(target=hit) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert builds == ["items"]
+    assert TestClient(app).get("/items/rows").status_code == 200
@@ -0,0 +1,177 @@
+import enum
+from typing import Annotated
+
+from fastapi import Depends
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from typeboard import introspection
+from typeboard.fields import AdminField
+from typeboard.introspection import invalidate_introspection
+from typeboard.manifest import main, signature_fingerprint
+from typeboard.pagination import Page
+from typeboard.site import AdminSite
+
+
+class Kind(enum.Enum):
+    BOOK = "book"
+    FILM = "film"
+
+
+class Item(BaseModel):
+    id: int
+    name: Annotated[str, AdminField(display_name=True)]
+    kind: Kind = Kind.BOOK
+
+
+class ItemCreate(BaseModel):
+    name: str
+    kind: Kind = Kind.BOOK
+
+
+def get_tenant() -> str:
+    return "acme"
+
+
+def list_items(
+    tenant: Annotated[str, Depends(get_tenant)],
+    page: int = 1,
+    page_size: int = 25,
+    name: Annotated[str | None, AdminField(filter="search")] = None,
+) -> Page[Item]:
+    items = [Item(id=1, name="Dune")]
+    return Page(items=items, total=1, page=page, page_size=page_size)
+
+
+def get_item(id: int, tenant: Annotated[str, Depends(get_tenant)]) -> Item:
+    return Item(id=id, name="Dune")
+
+
+def create_item(data: ItemCreate) -> Item:
+    return Item(id=2, **data.model_dump())
+
+
+def _site(**kwargs) -> AdminSite:
+    site = AdminSite(title="Test", **kwargs)
+    site.resource("items", list=list_items, get=get_item, create=create_item)
+    return site
+
+
+site = _site()
+
+
+def _count_hint_evaluations(monkeypatch) -> list:
+    calls = []
+    original = introspection.get_type_hints
+
+    def counting(*args, **kwargs):
+        calls.append(args[0])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(introspection, "get_type_hints", counting)
+    return calls
+
+
+def test_manifest_skips_introspection(tmp_path, monkeypatch):
+    path = tmp_path / "manifest.pickle"
+    _site().export_manifest(path)
+    invalidate_introspection()
+
+    calls = _count_hint_evaluations(monkeypatch)
+    fresh = _site(manifest=path)
+    client = TestClient(fresh.as_asgi())
+    assert calls == []
+
+    resp = client.get("/items/rows?name=Du")
+    assert resp.status_code == 200
+    assert "Dune" in resp.text
+    assert client.get("/items/1").status_code == 200
+    assert "Book" in client.get("/items/new").text
+    assert calls == []
+    res = fresh.resources["items"]
+    assert res.plans["list"].page_param == "page"
+    assert res.plans["list"].depends_names == ("tenant",)
+    assert res.plans["create"].model_cls is ItemCreate
+    assert res.plans["get"].coerce_id("3") == 3
+
+
+def test_changed_signature_is_introspected_again(tmp_path, monkeypatch):
+    path = tmp_path / "manifest.pickle"
+    _site().export_manifest(path)
+    invalidate_introspection()
+
+    def get_item(id: str) -> Item:
+        return Item(id=1, name="Dune")
+
+    fresh = _site()
+    fresh.resources["items"]._register("get", get_item)
+    assert fresh.load_manifest(path) == 2
+    calls = _count_hint_evaluations(monkeypatch)
+    assert fresh.resources["items"].plans["get"].coerce_id("3") == "3"
+    assert calls
+
+
+def test_fingerprint_tracks_model_fields():
+    class Before(BaseModel):
+        name: str
+
+    class After(BaseModel):
+        name: str
+        extra: int = 0
+
+    def before(data: Before) -> None: ...
+
+    def after(data: After) -> None: ...
+
+    after.__qualname__ = before.__qualname__
+    After.__qualname__ = Before.__qualname__
+    assert signature_fingerprint(before) == signature_fingerprint(before)
+    assert signature_fingerprint(before) != signature_fingerprint(after)
+
+
+def test_fingerprint_tracks_enum_members():
+    class Before(enum.Enum):
+        A = "a"
+
+    class After(enum.Enum):
+        A = "a"
+        B = "b"
+
+    After.__name__, After.__qualname__ = Before.__name__, Before.__qualname__
+
+    def make(status_enum):
+        class Row(BaseModel):
+            status: status_enum
+
+        def list_rows(status: status_enum | None = None) -> list[Row]: ...
+
+        return list_rows
+
+    def by_param(status: Before | None = None) -> None: ...
+
+    def by_param_after(status: After | None = None) -> None: ...
+
+    by_param_after.__qualname__ = by_param.__qualname__
+    # Same repr (<enum 'Before'>) before and after, but different members
+    assert signature_fingerprint(by_param) != signature_fingerprint(by_param_after)
+    # Also through a model field of the returned rows
+    assert signature_fingerprint(make(Before)) == signature_fingerprint(make(Before))
+    assert signature_fingerprint(make(Before)) != signature_fingerprint(make(After))
+
+
+def test_incompatible_manifest_is_ignored(tmp_path):
+    import pickle
+
+    path = tmp_path / "manifest.pickle"
+    _site().export_manifest(path)
+    manifest = pickle.loads(path.read_bytes())
+    manifest["compatibility"] = ("old",)
+    path.write_bytes(pickle.dumps(manifest))
+    assert _site().load_manifest(path) == 0
+
+
+def test_cli_writes_manifest(tmp_path, capsys):
+    path = tmp_path / "out.pickle"
+    assert main(["tests.test_manifest:site", "-o", str(path)]) == 0
+    assert "1 resources, 3 operations" in capsys.readouterr().out
+    assert _site().load_manifest(path) == 3
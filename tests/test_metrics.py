@@ -0,0 +1,109 @@
+import threading
+
+from fastapi import HTTPException, Request
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from typeboard.metrics import Metrics
+from typeboard.site import AdminSite
+from typeboard.timing import RequestTiming
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+def _samples(text: str) -> dict[str, float]:
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, _, value = line.rpartition(" ")
+            samples[name] = float(value)
+    return samples
+
+
+def test_metrics_endpoint_is_opt_in():
+    site = AdminSite(title="Test")
+    assert TestClient(site.as_asgi()).get("/_metrics").status_code == 404
+
+
+def test_metrics_endpoint_is_behind_auth_unless_disabled():
+    def require_token(request: Request):
+        if request.headers.get("authorization") != "Bearer admin":
+            raise HTTPException(status_code=401)
+
+    client = TestClient(AdminSite(title="Test", metrics=True, auth_dependency=require_token).as_asgi())
+    assert client.get("/_metrics").status_code == 401
+    assert client.get("/_metrics", headers={"authorization": "Bearer admin"}).status_code == 200
+
+    site = AdminSite(title="Test", metrics=True, metrics_auth=False, auth_dependency=require_token)
+    client = TestClient(site.as_asgi())
+    assert client.get("/_metrics").status_code == 200
+    assert client.get("/").status_code == 401
+
+def test_metrics_endpoint_counts_requests_rows_and_errors():
+    items = [Item(id=i, name=f"Item {i}") for i in range(1, 8)]
+
+    def list_items() -> list[Item]:
+        return items
+
+    def get_item(id: int) -> Item:
+        if id == 99:
+            raise RuntimeError("boom")
+        return items[id - 1]
+
+    site = AdminSite(title="Test", metrics=True)
+    site.resource("items", list=list_items, get=get_item)
+    client = TestClient(site.as_asgi(), raise_server_exceptions=False)
+
+    client.get("/items/rows")
+    client.get("/items/rows")
+    client.get("/items/1")
+    assert client.get("/items/99").status_code == 500
+
+    resp = client.get("/_metrics")
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    samples = _samples(resp.text)
+    rows = 'resource="items",operation="rows"'
+    detail = 'resource="items",operation="get"'
+    assert samples[f"typeboard_requests_total{{{rows}}}"] == 2
+    assert samples[f"typeboard_request_errors_total{{{rows}}}"] == 0
+    assert samples[f"typeboard_requests_total{{{detail}}}"] == 2
+    assert samples[f"typeboard_request_errors_total{{{detail}}}"] == 1
+    assert samples[f'typeboard_request_duration_seconds_bucket{{{rows},le="+Inf"}}'] == 2
+    assert samples[f"typeboard_request_duration_seconds_count{{{rows}}}"] == 2
+    # 7 rows per page lands in the le="10" bucket, not le="5"
+    assert samples[f'typeboard_rows_returned_bucket{{{rows},le="5"}}'] == 0
+    assert samples[f'typeboard_rows_returned_bucket{{{rows},le="10"}}'] == 2
+    assert samples[f"typeboard_rows_returned_sum{{{rows}}}"] == 14
+    assert samples["typeboard_thread_pool_size"] == 40
+    assert "typeboard_label_cache_hits_total" in samples
+    # Scrapes themselves aren't counted
+    assert not any("_metrics" in name for name in samples)
+
+
+def test_observations_from_many_threads_are_merged():
+    metrics = Metrics()
+
+    def work():
+        for _ in range(500):
+            metrics.observe(RequestTiming(resource="items", operation="rows", total=3.0, status=200, rows=25))
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    series = metrics.snapshot()[("items", "rows")]
+    assert series.requests == 2000
+    assert series.errors == 0
+    assert series.rows_sum == 2000 * 25
+    assert sum(series.latency) == 2000
+
+
+def test_label_values_are_escaped():
+    metrics = Metrics()
+    metrics.observe(RequestTiming(resource='we"ird\\', operation="rows", status=200))
+    assert 'resource="we\\"ird\\\\"' in metrics.exposition()
@@ -1,4 +1,6 @@
-from typeboard.pagination import Page
+import anyio
+
+from typeboard.pagination import CursorPage, Page, count_iterator, paginate_iterator
 
 
 def test_page_total_pages():
@@ -19,3 +21,62 @@ def test_page_has_prev():
 def test_page_no_prev_on_first():
     p = Page(items=[1], total=10, page=1, page_size=5)
     assert p.has_prev is False
+
+
+def test_cursor_page_navigation():
+    p = CursorPage(items=[1], next_cursor="abc")
+    assert p.has_next is True
+    assert p.has_prev is False
+    assert p.total is None
+
+
+def test_page_unknown_total():
+    p = Page(items=[1, 2], total=None, page=3, page_size=2)
+    assert p.total_pages is None
+    assert p.has_next is True
+    assert Page(items=[1], total=None, page=3, page_size=2).has_next is False
+
+
+def test_page_approximate_total_uses_page_fill():
+    p = Page(items=[1, 2], total=2, page=1, page_size=2, approximate=True)
+    assert p.has_next is True
+
+
+def test_paginate_iterator_reads_one_page():
+    consumed = []
+
+    def rows():
+        for i in range(100):
+            consumed.append(i)
+            yield i
+
+    page = anyio.run(paginate_iterator, rows(), 2, 10)
+    assert page.items == list(range(10, 20))
+    assert page.total is None and page.has_next is True
+    # Skipped rows plus one row of lookahead, never the rest
+    assert len(consumed) == 21
+
+
+def test_paginate_iterator_last_page_knows_total():
+    page = anyio.run(paginate_iterator, iter(range(25)), 3, 10)
+    assert page.items == list(range(20, 25))
+    assert page.total == 25 and page.has_next is False
+
+
+def test_paginate_async_iterator():
+    async def rows():
+        for i in range(30):
+            yield i
+
+    page = anyio.run(paginate_iterator, rows(), 1, 10)
+    assert page.items == list(range(10))
+    assert page.has_next is True
+
+
+def test_count_iterator():
+    async def rows():
+        for i in range(7):
+            yield i
+
+    assert anyio.run(count_iterator, iter(range(12))) == 12
+    assert anyio.run(count_iterator, rows()) == 7
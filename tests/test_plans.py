@@ -0,0 +1,93 @@
+from typing import Annotated
+
+from fastapi import Depends
+from pydantic import BaseModel
+
+from typeboard.fields import AdminField
+from typeboard.pagination import Page
+from typeboard.site import AdminSite
+
+
+def fake_db():
+    yield "db"
+
+
+class Item(BaseModel):
+    id: int
+    name: Annotated[str | None, AdminField(filter="search")] = None
+
+
+class ItemCreate(BaseModel):
+    name: str
+
+
+def list_items(
+    db: Annotated[str, Depends(fake_db)],
+    page: Annotated[int, AdminField(pagination="page")] = 1,
+    size: Annotated[int, AdminField(pagination="page_size")] = 25,
+    order: Annotated[str | None, AdminField(sort=True)] = None,
+    name: Annotated[str | None, AdminField(filter="search")] = None,
+) -> Page[Item]:
+    ...
+
+
+def get_item(db: Annotated[str, Depends(fake_db)], item_id: Annotated[int, AdminField(is_id=True)]) -> Item:
+    ...
+
+
+def create_item(data: ItemCreate) -> Item:
+    ...
+
+
+def test_list_plan():
+    site = AdminSite(title="Test")
+    res = site.resource("items", list=list_items, get=get_item)
+    plan = res.plans["list"]
+    assert plan.page_param == "page"
+    assert plan.page_size_param == "size"
+    assert plan.sort_param == "order"
+    assert plan.filter_params == {"name"}
+    assert plan.depends_names == ("db",)
+    assert plan.accepted == {"db", "page", "size", "order", "name"}
+
+
+def test_get_plan_coerces_id():
+    site = AdminSite(title="Test")
+    res = site.resource("items", get=get_item)
+    plan = res.plans["get"]
+    assert plan.id_param == "item_id"
+    assert plan.coerce_id("42") == 42
+
+
+def test_create_plan_model_param():
+    site = AdminSite(title="Test")
+    res = site.resource("items", create=create_item)
+    plan = res.plans["create"]
+    assert plan.model_param == "data"
+    assert plan.model_cls is ItemCreate
+
+
+def test_plans_only_cover_registered_ops():
+    site = AdminSite(title="Test")
+    res = site.resource("items", get=get_item)
+    assert set(res.plans) == {"get"}
+
+
+def test_plan_rebuilt_on_reregistration():
+    site = AdminSite(title="Test")
+    res = site.resource("items", get=get_item)
+    first = res.call_plan("get")
+
+    @res.get
+    def other_get(id: str) -> Item:
+        ...
+
+    assert res.call_plan("get") is not first
+    assert res.call_plan("get").fn is other_get
+
+
+def test_plan_bind_drops_unaccepted_kwargs():
+    site = AdminSite(title="Test")
+    res = site.resource("items", list=list_items)
+    plan = res.plans["list"]
+    assert plan.bind({"page": 2, "bogus": 1}) == {"page": 2}
@@ -0,0 +1,49 @@
+from typing import Annotated
+
+from pydantic import BaseModel
+
+from typeboard.fields import AdminField
+from typeboard.introspection import extract_fields_from_model
+from typeboard.projection import RowProjector
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    secret: Annotated[str, AdminField(hidden=True)] = ""
+    notes: Annotated[str, AdminField(column=False)] = ""
+    price: float = 0.0
+
+
+COLUMNS = extract_fields_from_model(Item)
+
+
+def test_projects_visible_columns_of_models():
+    projector = RowProjector(COLUMNS, "id")
+    assert projector.names == ("id", "name", "price")
+    rows = projector.project([Item(id=1, name="A", secret="x", price=2.5), Item(id=2, name="B")])
+    assert rows == [(1, (1, "A", 2.5)), (2, (2, "B", 0.0))]
+
+
+def test_dicts_with_missing_keys_fall_back_to_blanks():
+    projector = RowProjector(COLUMNS, "id")
+    rows = projector.project([{"id": 1, "name": "A", "price": 1.0}, {"id": 2}])
+    assert rows == [(1, (1, "A", 1.0)), (2, (2, "", ""))]
+
+
+def test_objects_missing_attributes_and_pk_ids():
+    class Legacy:
+        def __init__(self, pk, name):
+            self.pk = pk
+            self.name = name
+
+    projector = RowProjector(COLUMNS, None)
+    rows = projector.project([Legacy(7, "Old"), Legacy(8, "Older")])
+    assert rows == [(7, ("", "Old", "")), (8, ("", "Older", ""))]
+    assert projector.project([{"pk": 3, "name": "D"}]) == [(3, ("", "D", ""))]
+
+
+def test_mixed_shapes_get_their_own_accessors():
+    projector = RowProjector(COLUMNS, "id")
+    rows = projector.project([Item(id=1, name="A"), {"id": 2, "name": "B", "price": 3.0}])
+    assert rows == [(1, (1, "A", 0.0)), (2, (2, "B", 3.0))]
@@ -0,0 +1,160 @@
+import enum
+import json
+from typing import Annotated
+
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from typeboard.fields import AdminField
+from typeboard.introspection import extract_columns, extract_fields_from_function
+from typeboard.query import MemoryQueryEngine, Query, parse_sort
+from typeboard.site import AdminSite
+
+
+class Status(enum.Enum):
+    ACTIVE = "active"
+    RETIRED = "retired"
+
+
+class Product(BaseModel):
+    id: int
+    name: str
+    status: Status
+    price: float | None = None
+
+
+PRODUCTS = [
+    Product(id=1, name="Widget", status=Status.ACTIVE, price=3.0),
+    Product(id=2, name="Gadget", status=Status.RETIRED, price=1.0),
+    Product(id=3, name="widget pro", status=Status.ACTIVE, price=None),
+    Product(id=4, name="Gizmo", status=Status.ACTIVE, price=1.0),
+]
+calls = []
+
+
+def list_products(
+    name: Annotated[str | None, AdminField(filter="search")] = None,
+    status: Annotated[Status | None, AdminField(filter="select")] = None,
+) -> list[Product]:
+    calls.append(1)
+    return PRODUCTS
+
+
+def _engine(cache_size: int = 0) -> MemoryQueryEngine:
+    filters = [f for f in extract_fields_from_function(list_products) if f.filter]
+    return MemoryQueryEngine(filters, extract_columns(list_products), cache_size)
+
+
+def _ids(items) -> list:
+    return [item["id"] if isinstance(item, dict) else item.id for item in items]
+
+
+def test_parse_sort():
+    assert parse_sort("name, -price,") == (("name", False), ("price", True))
+    assert parse_sort(None) == ()
+
+
+def test_search_is_case_insensitive_substring_and_select_is_equality():
+    engine = _engine()
+    assert _ids(engine.apply(PRODUCTS, engine.query({"name": "WIDGET"}))) == [1, 3]
+    assert _ids(engine.apply(PRODUCTS, engine.query({"status": "retired"}))) == [2]
+    assert engine.apply(PRODUCTS, engine.query({"status": "unknown"})) == []
+    # Unknown parameters and empty values are ignored
+    assert engine.query({"page": "2", "name": "", "sort": "nope"}) == Query()
+
+
+def test_multi_key_sort_places_none_last():
+    engine = _engine()
+    assert _ids(engine.apply(PRODUCTS, engine.query({"sort": "price,-name"}))) == [4, 2, 1, 3]
+    assert _ids(engine.apply(PRODUCTS, engine.query({"sort": "-price"}))) == [1, 2, 4, 3]
+    assert _ids(engine.apply(PRODUCTS, engine.query({"sort": "status,name"}))) == [4, 1, 3, 2]
+    # The source list is left as it was
+    assert _ids(PRODUCTS) == [1, 2, 3, 4]
+
+
+def test_dict_items_and_mixed_types():
+    engine = _engine()
+    rows = [{"id": 1, "name": "b", "price": "n/a"}, {"id": 2, "name": "a", "price": 2.0}, {"id": 3}]
+    assert _ids(engine.apply(rows, engine.query({"sort": "price"}))) == [2, 1, 3]
+    assert _ids(engine.apply(rows, engine.query({"name": "A"}))) == [2]
+
+
+def test_cache_reuses_arranged_rows_per_source_list():
+    engine = _engine(cache_size=2)
+    query = engine.query({"sort": "name"})
+    first = engine.apply(PRODUCTS, query)
+    assert engine.apply(PRODUCTS, query) is first
+    # A different list (even with equal contents) is arranged again
+    assert engine.apply(list(PRODUCTS), query) is not first
+    # With a version the key is the version, not the list
+    versioned = engine.apply(list(PRODUCTS), query, version=7)
+    assert engine.apply(list(PRODUCTS), query, version=7) is versioned
+    assert len(engine._cache) == 2
+
+
+def test_cache_rearranges_rows_replaced_in_place():
+    engine = _engine(cache_size=2)
+    query = engine.query({"sort": "-name"})
+    rows = list(PRODUCTS)
+    assert _ids(engine.apply(rows, query)) == [3, 1, 4, 2]
+    # Same list object and length, one row swapped for a new object
+    rows[2] = Product(id=3, name="Anvil", status=Status.ACTIVE)
+    assert _ids(engine.apply(rows, query)) == [1, 4, 2, 3]
+    rows.append(Product(id=5, name="Zoom", status=Status.ACTIVE))
+    assert _ids(engine.apply(rows, query))[0] == 5
+
+def test_rows_count_and_export_use_the_engine():
+    site = AdminSite(title="Test")
+    site.resource("products", list=list_products, lazy_count=True, memory_query=True, memory_query_cache=8)
+    client = TestClient(site.as_asgi())
+
+    calls.clear()
+    page_one = client.get("/products/rows?sort=-name&page_size=2")
+    page_two = client.get("/products/rows?sort=-name&page_size=2&page=2")
+    assert page_one.text.index("widget pro") < page_one.text.index("Widget")
+    assert "Gizmo" in page_two.text and "Gadget" in page_two.text
+    assert "Widget" not in page_two.text
+    assert len(calls) == 2
+
+    filtered = client.get("/products/rows?name=widget")
+    assert "Gadget" not in filtered.text and "Gizmo" not in filtered.text
+    assert "2 records" in client.get("/products/rows/count?name=widget").text
+
+    export = client.get("/products/export?format=ndjson&status=active&sort=name")
+    assert [json.loads(line)["id"] for line in export.text.splitlines()] == [4, 1, 3]
+
+
+DB = [Product(id=1, name="Anvil", status=Status.ACTIVE), Product(id=2, name="Bucket", status=Status.ACTIVE)]
+
+
+def list_db() -> list[Product]:
+    return DB
+
+
+def get_db(id: int) -> Product:
+    return next(p for p in DB if p.id == id)
+
+
+class ProductUpdate(BaseModel):
+    name: str
+    status: Status
+
+
+def update_db(id: int, data: ProductUpdate) -> Product:
+    i = next(i for i, p in enumerate(DB) if p.id == id)
+    DB[i] = Product(id=id, **data.model_dump())
+    return DB[i]
+
+
+def test_writes_clear_the_arranged_rows_cache():
+    site = AdminSite(title="Test")
+    site.resource("products", list=list_db, get=get_db, update=update_db, memory_query=True, memory_query_cache=8)
+    client = TestClient(site.as_asgi())
+
+    resp = client.get("/products/rows?sort=name")
+    assert resp.text.index("Anvil") < resp.text.index("Bucket")
+    # Replaces DB[0] in place: same list object, same length
+    client.post("/products/1/edit", data={"name": "Zither", "status": "active"}, follow_redirects=False)
+    resp = client.get("/products/rows?sort=name")
+    assert "Anvil" not in resp.text
+    assert resp.text.index("Bucket") < resp.text.index("Zither")
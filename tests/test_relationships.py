@@ -0,0 +1,268 @@
+from typing import Annotated
+
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from typeboard.fields import AdminField
+from typeboard.pagination import Page
+from typeboard.site import AdminSite
+
+
+class Tag(BaseModel):
+    id: int
+    name: str
+
+
+class Post(BaseModel):
+    id: int
+    title: str
+    tag_ids: Annotated[list[int], AdminField(relationship="tags")] = []
+
+
+TAGS = {i: Tag(id=i, name=f"tag-{i}") for i in range(1, 6)}
+POSTS = {1: Post(id=1, title="Hello", tag_ids=[2, 4])}
+CALLS: list[str] = []
+
+
+def list_tags(
+    page: int = 1,
+    page_size: int = 25,
+    name: Annotated[str | None, AdminField(filter="search")] = None,
+) -> Page[Tag]:
+    CALLS.append(f"list:{page_size}")
+    matches = [t for t in TAGS.values() if not name or name in t.name]
+    items = matches[(page - 1) * page_size:page * page_size]
+    return Page(items=items, total=len(TAGS), page=page, page_size=page_size)
+
+
+def get_tag(id: int) -> Tag:
+    CALLS.append(f"get:{id}")
+    return TAGS[id]
+
+
+def get_many_tags(ids: list[int]) -> list[Tag]:
+    CALLS.append(f"get_many:{sorted(ids)}")
+    return [TAGS[i] for i in ids if i in TAGS]
+
+
+def list_posts(page: int = 1, page_size: int = 25) -> Page[Post]:
+    return Page(items=list(POSTS.values()), total=len(POSTS), page=page, page_size=page_size)
+
+
+def get_post(id: int) -> Post:
+    return POSTS[id]
+
+
+def update_post(id: int, title: str, tag_ids: list[int]) -> Post:
+    POSTS[id] = Post(id=id, title=title, tag_ids=tag_ids)
+    return POSTS[id]
+
+
+def setup_function():
+    CALLS.clear()
+
+
+def make_site(**tag_fns) -> AdminSite:
+    site = AdminSite(title="Test")
+    site.resource("tags", list=list_tags, **tag_fns)
+    site.resource("posts", list=list_posts, get=get_post, update=update_post)
+    return site
+
+
+def test_detail_uses_get_many():
+    client = TestClient(make_site(get=get_tag, get_many=get_many_tags).as_asgi())
+    resp = client.get("/posts/1")
+    assert resp.status_code == 200
+    assert "tag-2" in resp.text and "tag-4" in resp.text
+    assert CALLS == ["get_many:[2, 4]"]
+
+
+def test_detail_falls_back_to_targeted_gets():
+    client = TestClient(make_site(get=get_tag).as_asgi())
+    resp = client.get("/posts/1")
+    assert "tag-2" in resp.text and "tag-4" in resp.text
+    assert sorted(CALLS) == ["get:2", "get:4"]
+
+
+def test_targeted_gets_run_concurrently():
+    import asyncio
+
+    in_flight = {"now": 0, "max": 0}
+
+    async def get_tag_slowly(id: int) -> Tag:
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            in_flight["now"] -= 1
+        return TAGS[id]
+
+    client = TestClient(make_site(get=get_tag_slowly).as_asgi())
+    resp = client.get("/posts/1")
+    assert "tag-2" in resp.text and "tag-4" in resp.text
+    assert in_flight["max"] == 2
+
+def test_detail_list_fallback_walks_until_ids_are_found(monkeypatch):
+    monkeypatch.setattr("typeboard.routing.RELATED_SCAN_PAGE_SIZE", 2)
+    client = TestClient(make_site().as_asgi())
+    resp = client.get("/posts/1")
+    assert "tag-2" in resp.text and "tag-4" in resp.text
+    # Tag 4 is on the second page; the third is never read
+    assert CALLS == ["list:2", "list:2"]
+
+
+def test_detail_list_fallback_is_bounded(monkeypatch):
+    monkeypatch.setattr("typeboard.routing.RELATED_SCAN_PAGE_SIZE", 1)
+    monkeypatch.setattr("typeboard.routing.MAX_RELATED_SCAN_ROWS", 3)
+    client = TestClient(make_site().as_asgi())
+    resp = client.get("/posts/1")
+    assert "tag-2" in resp.text and "tag-4" not in resp.text
+    assert CALLS == ["list:1", "list:1", "list:1"]
+
+
+def test_options_resolves_missing_selected_with_get_many():
+    client = TestClient(make_site(get=get_tag, get_many=get_many_tags).as_asgi())
+    CALLS.clear()
+    resp = client.get("/posts/options/tag_ids", params={"q": "tag-1", "selected": "5,99"})
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data[0] == {"value": "5", "text": "tag-5"}
+    # Unknown IDs keep their raw value so the selection isn't lost
+    assert data[1] == {"value": "99", "text": "99"}
+    assert data[2] == {"value": "1", "text": "tag-1"}
+    assert "get_many:[5, 99]" in CALLS
+
+
+def update_tag(id: int, name: str) -> Tag:
+    TAGS[id] = Tag(id=id, name=name)
+    return TAGS[id]
+
+
+def test_label_cache_serves_repeat_views_and_invalidates_on_edit():
+    site = AdminSite(title="Test", label_cache_size=100)
+    site.resource("tags", list=list_tags, get=get_tag, get_many=get_many_tags, update=update_tag)
+    site.resource("posts", list=list_posts, get=get_post)
+    client = TestClient(site.as_asgi())
+
+    client.get("/posts/1")
+    client.get("/posts/1")
+    assert CALLS == ["get_many:[2, 4]"]
+    assert site.label_cache.stats()["hits"] == 2
+
+    try:
+        client.post("/tags/2/edit", data={"name": "renamed"}, follow_redirects=False)
+        CALLS.clear()
+        resp = client.get("/posts/1")
+        assert "renamed" in resp.text
+        assert CALLS == ["get_many:[2]"]
+    finally:
+        TAGS[2] = Tag(id=2, name="tag-2")
+
+
+class Person(BaseModel):
+    id: int
+    name: str
+
+
+class Team(BaseModel):
+    id: int
+    name: str
+
+
+class Ticket(BaseModel):
+    id: int
+    author_id: Annotated[int, AdminField(relationship="people")]
+    team_id: Annotated[int, AdminField(relationship="teams")]
+
+
+def make_ticket_site(people_delay: float, teams_delay: float, in_flight: dict | None = None,
+                     fail_teams: bool = False, **site_kwargs) -> AdminSite:
+    import asyncio
+
+    in_flight = {"now": 0, "max": 0} if in_flight is None else in_flight
+
+    async def lookup(delay: float):
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            in_flight["now"] -= 1
+
+    def list_people() -> list[Person]:
+        return []
+
+    async def get_many_people(ids: list[int]) -> list[Person]:
+        await lookup(people_delay)
+        return [Person(id=i, name=f"person-{i}") for i in ids]
+
+    def list_teams() -> list[Team]:
+        return []
+
+    async def get_many_teams(ids: list[int]) -> list[Team]:
+        await lookup(teams_delay)
+        if fail_teams:
+            raise RuntimeError("teams backend down")
+        return [Team(id=i, name=f"team-{i}") for i in ids]
+
+    def get_ticket(id: int) -> Ticket:
+        return Ticket(id=id, author_id=7, team_id=9)
+
+    site = AdminSite(title="Test", **site_kwargs)
+    site.resource("people", list=list_people, get_many=get_many_people)
+    site.resource("teams", list=list_teams, get_many=get_many_teams)
+    site.resource("tickets", get=get_ticket)
+    return site
+
+
+def test_detail_lookups_run_concurrently():
+    in_flight = {"now": 0, "max": 0}
+    client = TestClient(make_ticket_site(0.05, 0.05, in_flight).as_asgi())
+    resp = client.get("/tickets/1")
+    assert in_flight["max"] == 2
+    assert "person-7" in resp.text and "team-9" in resp.text
+
+
+def test_detail_lookup_timeout_falls_back_to_raw_id():
+    client = TestClient(make_ticket_site(0.0, 1.0, relationship_timeout=0.1).as_asgi())
+    resp = client.get("/tickets/1")
+    assert resp.status_code == 200
+    assert "person-7" in resp.text
+    assert "team-9" not in resp.text
+
+
+def test_detail_lookup_error_falls_back_to_raw_id():
+    for site_kwargs in ({}, {"relationship_timeout": 1.0}):
+        client = TestClient(make_ticket_site(0.0, 0.0, fail_teams=True, **site_kwargs).as_asgi())
+        resp = client.get("/tickets/1")
+        assert resp.status_code == 200
+        assert "person-7" in resp.text
+        assert "team-9" not in resp.text
+
+
+class PostUpdate(BaseModel):
+    title: str
+    tag_ids: Annotated[list[int], AdminField(relationship="tags")] = []
+
+
+def update_post_model(id: int, data: PostUpdate) -> Post:
+    return Post(id=id, **data.model_dump())
+
+
+def test_sites_sharing_a_model_keep_their_own_relationship_choices():
+    def other_tags(page: int = 1, page_size: int = 25) -> Page[Tag]:
+        return Page(items=[Tag(id=9, name="elsewhere")], total=1, page=page, page_size=page_size)
+
+    first = AdminSite(title="First")
+    first.resource("tags", list=list_tags, get=get_tag)
+    first.resource("posts", list=list_posts, get=get_post, update=update_post_model)
+    second = AdminSite(title="Second")
+    second.resource("tags", list=other_tags)
+    second.resource("posts", list=list_posts, get=get_post, update=update_post_model)
+    first_client, second_client = TestClient(first.as_asgi()), TestClient(second.as_asgi())
+
+    assert "tag-1" in first_client.get("/posts/1/edit").text
+    resp = second_client.get("/posts/1/edit")
+    assert "elsewhere" in resp.text
+    assert "tag-1" not in resp.text
@@ -0,0 +1,37 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from typeboard.rendering import TEMPLATE_DIR, create_renderer
+from typeboard.site import AdminSite
+
+
+def test_development_mode_reloads_and_compiles_lazily():
+    render = create_renderer(AdminSite(title="Test"))
+    assert render.env.auto_reload is True
+    assert len(render.env.cache) == 0
+
+
+def test_production_mode_precompiles_everything():
+    render = create_renderer(AdminSite(title="Test", template_mode="production"))
+    assert render.env.auto_reload is False
+    assert len(render.env.cache) == len(list(TEMPLATE_DIR.glob("*.html")))
+
+
+def test_bytecode_cache_dir(tmp_path):
+    create_renderer(AdminSite(title="Test", template_mode="production", template_cache_dir=tmp_path / "jinja"))
+    assert any((tmp_path / "jinja").iterdir())
+
+
+def test_invalid_template_mode():
+    with pytest.raises(ValueError):
+        AdminSite(title="Test", template_mode="fast")
+
+
+def test_extra_template_dir_overrides_and_is_precompiled(tmp_path):
+    (tmp_path / "index.html").write_text("custom index for {{ site.title }}")
+    (tmp_path / "extra.html").write_text("extra")
+    site = AdminSite(title="Test", template_mode="production")
+    site.add_template_dir(tmp_path)
+    render = create_renderer(site)
+    assert len(render.env.cache) == len(list(TEMPLATE_DIR.glob("*.html"))) + 1
+    assert TestClient(site.as_asgi()).get("/").text == "custom index for Test"
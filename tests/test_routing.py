@@ -110,3 +110,150 @@ def test_get_with_depends_and_custom_id():
     resp = client.get("/orgs/42")
     assert resp.status_code == 200
     assert "Acme" in resp.text
+
+
+async def list_orgs_async(page: int = 1, page_size: int = 25) -> Page[OrgRead]:
+    return Page(items=[OrgRead(id=1, name="Async Acme")], total=1, page=page, page_size=page_size)
+
+
+async def get_org_async(id: int) -> OrgRead:
+    return OrgRead(id=id, name="Async Acme")
+
+
+def test_async_callables_are_awaited():
+    site = AdminSite(title="Test")
+    res = site.resource("orgs", list=list_orgs_async, get=get_org_async)
+    assert res.is_async("list") and res.is_async("get")
+    client = TestClient(site.as_asgi())
+    assert "Async Acme" in client.get("/orgs/rows").text
+    assert "Async Acme" in client.get("/orgs/7").text
+
+
+def test_sync_callables_run_in_worker_thread():
+    import threading
+
+    seen_threads = []
+
+    def list_orgs(page: int = 1, page_size: int = 25) -> Page[OrgRead]:
+        seen_threads.append(threading.current_thread())
+        return Page(items=[OrgRead(id=1, name="Sync Acme")], total=1, page=page, page_size=page_size)
+
+    site = AdminSite(title="Test", thread_pool_size=2)
+    res = site.resource("orgs", list=list_orgs)
+    assert not res.is_async("list")
+    assert site.thread_limiter.total_tokens == 2
+    client = TestClient(site.as_asgi())
+    resp = client.get("/orgs/rows")
+    assert "Sync Acme" in resp.text
+    assert seen_threads and seen_threads[0] is not threading.main_thread()
+
+
+def test_choices_are_request_scoped():
+    from fastapi import Request
+
+    def current_tenant(request: Request) -> str:
+        return request.headers.get("x-tenant", "a")
+
+    def team_choices(tenant: Annotated[str, Depends(current_tenant)]) -> list[tuple[str, str]]:
+        return [(f"{tenant}-1", f"Team {tenant.upper()}")]
+
+    class MemberCreate(BaseModel):
+        name: str
+        team: Annotated[str, AdminField(widget="select", choices=team_choices)]
+
+    def create_member(data: MemberCreate) -> dict:
+        return {"id": 1}
+
+    site = AdminSite(title="Test")
+    res = site.resource("members", list=my_list, create=create_member)
+    client = TestClient(site.as_asgi())
+    assert "Team A" in client.get("/members/new", headers={"x-tenant": "a"}).text
+    resp = client.get("/members/new", headers={"x-tenant": "b"})
+    assert "Team B" in resp.text and "Team A" not in resp.text
+    # Shared field metadata is never written to
+    assert next(f for f in res.create_fields if f.name == "team").enum_choices is None
+
+
+def test_choices_resolve_concurrently_and_memoise():
+    import asyncio
+
+    calls = {"colors": 0, "sizes": 0}
+    in_flight = {"now": 0, "max": 0}
+
+    async def overlap():
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.05)
+        in_flight["now"] -= 1
+
+    async def colors() -> list[tuple[str, str]]:
+        calls["colors"] += 1
+        await overlap()
+        return [("red", "Red")]
+
+    async def sizes() -> list[tuple[str, str]]:
+        calls["sizes"] += 1
+        await overlap()
+        return [("xl", "Extra Large")]
+
+    class ShirtCreate(BaseModel):
+        color: Annotated[str, AdminField(widget="select", choices=colors, choices_ttl=60)]
+        size: Annotated[str, AdminField(widget="select", choices=sizes)]
+
+    def create_shirt(data: ShirtCreate) -> dict:
+        return {"id": 1}
+
+    site = AdminSite(title="Test")
+    site.resource("shirts", list=my_list, create=create_shirt)
+    client = TestClient(site.as_asgi())
+    resp = client.get("/shirts/new")
+    assert in_flight["max"] == 2
+    assert "Red" in resp.text and "Extra Large" in resp.text
+    client.get("/shirts/new")
+    assert calls == {"colors": 1, "sizes": 2}
+
+
+def test_choices_memo_keys_on_value_arguments_only():
+    import gc
+    import weakref
+
+    from fastapi import Request
+
+    class Session:
+        pass
+
+    sessions = []
+    calls = []
+
+    def get_session() -> Session:
+        session = Session()
+        sessions.append(weakref.ref(session))
+        return session
+
+    def current_tenant(request: Request) -> str:
+        return request.headers.get("x-tenant", "a")
+
+    def team_choices(
+        db: Annotated[Session, Depends(get_session)],
+        tenant: Annotated[str, Depends(current_tenant)],
+    ) -> list[tuple[str, str]]:
+        calls.append(tenant)
+        return [(f"{tenant}-1", f"Team {tenant.upper()}")]
+
+    class MemberCreate(BaseModel):
+        name: str
+        team: Annotated[str, AdminField(widget="select", choices=team_choices, choices_ttl=60)]
+
+    def create_member(data: MemberCreate) -> dict:
+        return {"id": 1}
+
+    site = AdminSite(title="Test")
+    site.resource("members", list=my_list, create=create_member)
+    client = TestClient(site.as_asgi())
+    client.get("/members/new")
+    client.get("/members/new")
+    assert "Team B" in client.get("/members/new", headers={"x-tenant": "b"}).text
+    # A fresh session per request doesn't defeat the memo, and none is kept alive by it
+    assert calls == ["a", "b"]
+    gc.collect()
+    assert all(ref() is None for ref in sessions)
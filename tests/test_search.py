@@ -0,0 +1,135 @@
+import asyncio
+from typing import Annotated
+
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from typeboard.fields import AdminField
+from typeboard.pagination import Page
+from typeboard.search import LabelIndex
+from typeboard.site import AdminSite
+
+NAMES = ["John Smith", "Jane Doe", "Johanna Smithers", "Bob Jones", "Alice O'Brien"]
+
+
+def _index() -> LabelIndex:
+    index = LabelIndex()
+    index.build((str(i), name) for i, name in enumerate(NAMES, 1))
+    return index
+
+
+def test_words_match_label_word_prefixes():
+    index = _index()
+    assert index.search("jo")[0] == [("4", "Bob Jones"), ("3", "Johanna Smithers"), ("1", "John Smith")]
+    assert index.search("SMITH jo")[0] == [("3", "Johanna Smithers"), ("1", "John Smith")]
+    assert index.search("smithe")[0] == [("3", "Johanna Smithers")]
+    assert index.search("o brien")[0] == [("5", "Alice O'Brien")]
+    assert index.search("oe") == ([], False)
+    assert index.label("2") == "Jane Doe"
+
+
+def test_paging_through_matches():
+    index = _index()
+    first, more = index.search("", 0, 2)
+    assert first == [("5", "Alice O'Brien"), ("4", "Bob Jones")] and more
+    assert index.search("", 4, 2) == ([("1", "John Smith")], False)
+    assert index.search("j", 1, 1) == ([("2", "Jane Doe")], True)
+
+
+def test_invalidate_during_load_keeps_index_stale():
+    index = LabelIndex(ttl=None)
+    loads = []
+
+    async def load():
+        loads.append(1)
+        if len(loads) == 1:
+            index.invalidate()
+        return [("1", f"Name {len(loads)}")]
+
+    async def run():
+        await index.ensure(load)
+        assert not index.fresh
+        await index.ensure(load)
+        assert index.fresh
+        await index.ensure(load)
+
+    asyncio.run(run())
+    assert len(loads) == 2
+    assert index.search("name")[0] == [("1", "Name 2")]
+
+
+class Author(BaseModel):
+    id: int
+    name: str
+
+
+class Book(BaseModel):
+    id: int
+    title: str
+    author_id: Annotated[int, AdminField(relationship="authors")]
+
+
+AUTHORS = {i: Author(id=i, name=name) for i, name in enumerate(NAMES, 1)}
+CALLS: list[int] = []
+
+
+def list_authors(page: int = 1, page_size: int = 25) -> Page[Author]:
+    CALLS.append(page)
+    items = list(AUTHORS.values())[(page - 1) * page_size:page * page_size]
+    return Page(items=items, total=len(AUTHORS), page=page, page_size=page_size)
+
+
+def create_author(name: str) -> Author:
+    author = Author(id=len(AUTHORS) + 1, name=name)
+    AUTHORS[author.id] = author
+    return author
+
+
+def list_books() -> list[Book]:
+    return []
+
+
+def create_book(title: str, author_id: int) -> Book:
+    return Book(id=1, title=title, author_id=author_id)
+
+
+def test_options_are_served_from_the_index():
+    site = AdminSite(title="Test")
+    site.resource("authors", list=list_authors, create=create_author, options_index=True)
+    site.resource("books", list=list_books, create=create_book)
+    client = TestClient(site.as_asgi())
+
+    CALLS.clear()
+    resp = client.get("/books/options/author_id", params={"q": "jo"})
+    assert [r["text"] for r in resp.json()] == ["Bob Jones", "Johanna Smithers", "John Smith"]
+    assert "x-next-page" not in resp.headers
+    # Every page was read once to build the index; later keystrokes don't call list_authors
+    assert CALLS == [1]
+    resp = client.get("/books/options/author_id", params={"q": "jane", "selected": "4"})
+    assert resp.json() == [{"value": "4", "text": "Bob Jones"}, {"value": "2", "text": "Jane Doe"}]
+    assert CALLS == [1]
+
+    # Writes through typeboard rebuild the index on the next lookup
+    client.post("/authors/new", data={"name": "Joan Jett"}, follow_redirects=False)
+    resp = client.get("/books/options/author_id", params={"q": "joan"})
+    assert [r["text"] for r in resp.json()] == ["Joan Jett"]
+    assert CALLS == [1, 1]
+    del AUTHORS[6]
+
+
+def test_options_index_pages(monkeypatch):
+    monkeypatch.setattr("typeboard.routing.OPTIONS_PAGE_SIZE", 2)
+    site = AdminSite(title="Test")
+    site.resource("authors", list=list_authors, options_index=True)
+    site.resource("books", list=list_books, create=create_book)
+    client = TestClient(site.as_asgi())
+
+    resp = client.get("/books/options/author_id")
+    assert resp.headers["x-next-page"] == "2"
+    resp = client.get("/books/options/author_id", params={"page": "3"})
+    assert [r["text"] for r in resp.json()] == ["John Smith"]
+    assert "x-next-page" not in resp.headers
+    # A malformed page falls back to the first
+    resp = client.get("/books/options/author_id", params={"page": "abc"})
+    assert resp.status_code == 200
+    assert resp.headers["x-next-page"] == "2"
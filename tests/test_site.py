@@ -75,3 +75,15 @@ def test_resource_resolves_id_param():
     site = AdminSite(title="Test")
     res = site.resource("orgs", get=get_with_db)
     assert res.id_param_name == "org_id"
+
+
+def test_decorator_detects_async_callable():
+    site = AdminSite(title="Test")
+    items = site.resource("items")
+
+    @items.get
+    async def get_item(id: int) -> dict:
+        return {"id": id}
+
+    assert items.is_async("get")
+    assert not items.is_async("list")
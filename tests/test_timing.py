@@ -0,0 +1,103 @@
+from typing import Annotated
+
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from typeboard.fields import AdminField
+from typeboard.site import AdminSite
+from typeboard.timing import RequestTiming, phase
+
+
+class Team(BaseModel):
+    id: int
+    name: str
+
+
+class Person(BaseModel):
+    id: int
+    name: str
+    team_id: Annotated[int, AdminField(relationship="teams")]
+
+
+class PersonUpdate(BaseModel):
+    name: str
+    team_id: Annotated[int, AdminField(relationship="teams")]
+
+
+def _site(**kwargs) -> AdminSite:
+    teams = {1: Team(id=1, name="Core")}
+    people = {1: Person(id=1, name="Ada", team_id=1)}
+
+    def list_teams() -> list[Team]:
+        return list(teams.values())
+
+    def get_team(id: int) -> Team | None:
+        return teams.get(id)
+
+    def list_people() -> list[Person]:
+        return list(people.values())
+
+    def get_person(id: int) -> Person | None:
+        return people.get(id)
+
+    def update_person(id: int, data: PersonUpdate) -> Person:
+        people[id] = Person(id=id, **data.model_dump())
+        return people[id]
+
+    site = AdminSite(title="Test", compression=False, **kwargs)
+    site.resource("teams", list=list_teams, get=get_team)
+    site.resource("people", list=list_people, get=get_person, update=update_person)
+    return site
+
+
+def _phases(header: str) -> dict[str, float]:
+    metrics = {}
+    for metric in header.split(", "):
+        name, _, dur = metric.partition(";dur=")
+        metrics[name] = float(dur)
+    return metrics
+
+
+def test_phase_is_noop_without_active_timing():
+    with phase("call"):
+        pass
+
+
+def test_server_timing_header_breaks_down_phases():
+    client = TestClient(_site(server_timing=True).as_asgi())
+
+    detail = _phases(client.get("/people/1").headers["server-timing"])
+    assert {"call", "relationships", "render", "total"} <= detail.keys()
+    assert detail["total"] >= detail["call"]
+
+    edit = _phases(client.get("/people/1/edit").headers["server-timing"])
+    assert {"call", "choices", "render"} <= edit.keys()
+
+
+def test_no_header_by_default():
+    client = TestClient(_site().as_asgi())
+    assert "server-timing" not in client.get("/people/1").headers
+
+
+def test_hook_receives_labelled_timings():
+    seen: list[RequestTiming] = []
+    client = TestClient(_site(on_request_timing=seen.append).as_asgi())
+
+    resp = client.get("/people/rows")
+    assert "server-timing" not in resp.headers
+    client.get("/teams/1")
+
+    assert [(t.resource, t.operation) for t in seen] == [("people", "rows"), ("teams", "get")]
+    assert "call" in seen[0].phases and "render" in seen[0].phases
+    assert seen[0].total >= seen[0].phases["call"]
+
+
+def test_async_hook():
+    seen: list[RequestTiming] = []
+
+    async def record(timing: RequestTiming) -> None:
+        seen.append(timing)
+
+    client = TestClient(_site(on_request_timing=record).as_asgi())
+    client.post("/people/1/edit", data={"name": "Grace", "team_id": "1"}, follow_redirects=False)
+    assert [(t.resource, t.operation) for t in seen] == [("people", "update")]
@@ -1,7 +1,7 @@
 from typeboard.fields import AdminField
-from typeboard.pagination import Page
+from typeboard.pagination import CursorPage, Page
 from typeboard.resource import Resource
 from typeboard.site import AdminSite
 from typeboard.theme import DARK, LIGHT, Theme
 
-__all__ = ["AdminField", "AdminSite", "DARK", "LIGHT", "Page", "Resource", "Theme"]
+__all__ = ["AdminField", "AdminSite", "CursorPage", "DARK", "LIGHT", "Page", "Resource", "Theme"]
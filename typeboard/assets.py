@@ -0,0 +1,116 @@
+"""Front-end assets (Bootstrap, Font Awesome, Tom Select, htmx): CDN or self-hosted.
+
+Self-hosted copies live in typeboard/static and are served under
+/_static/<digest>/<path>, where the digest covers every vendored file so the
+URLs can be cached forever. Refresh them with:
+
+    uv run python -m typeboard.assets
+"""
+import gzip
+import hashlib
+import mimetypes
+import sys
+import urllib.request
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+
+STATIC_DIR = Path(__file__).parent / "static"
+ASSET_MODES = ("cdn", "local")
+IMMUTABLE = "public, max-age=31536000, immutable"
+# Precompressed variants, in order of preference
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+# woff2 is already compressed
+COMPRESSIBLE = (".css", ".js", ".ttf")
+
+
+@dataclass(frozen=True)
+class Asset:
+    path: str  # relative to STATIC_DIR, and the URL path under /_static/<digest>/
+    cdn_url: str
+
+
+_FA = "https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.7.2"
+
+# Assets referenced from base.html
+PAGE_ASSETS = {
+    "bootstrap.css": Asset("bootstrap/bootstrap.min.css", "https://cdn.jsdelivr.net/npm/bootstrap@5.3.8/dist/css/bootstrap.min.css"),
+    "bootstrap.js": Asset("bootstrap/bootstrap.bundle.min.js", "https://cdn.jsdelivr.net/npm/bootstrap@5.3.8/dist/js/bootstrap.bundle.min.js"),
+    "fontawesome.css": Asset("fontawesome/css/all.min.css", f"{_FA}/css/all.min.css"),
+    "tom-select.css": Asset("tom-select/tom-select.bootstrap5.min.css", "https://cdn.jsdelivr.net/npm/tom-select@2.4.3/dist/css/tom-select.bootstrap5.min.css"),
+    "tom-select.js": Asset("tom-select/tom-select.complete.min.js", "https://cdn.jsdelivr.net/npm/tom-select@2.4.3/dist/js/tom-select.complete.min.js"),
+    "htmx.js": Asset("htmx/htmx.min.js", "https://unpkg.com/htmx.org@2.0.4"),
+}
+
+# Fonts loaded by fontawesome/css/all.min.css through ../webfonts/ URLs
+FONT_ASSETS = tuple(
+    Asset(f"fontawesome/webfonts/{name}{ext}", f"{_FA}/webfonts/{name}{ext}")
+    for name in ("fa-brands-400", "fa-regular-400", "fa-solid-900", "fa-v4compatibility")
+    for ext in (".woff2", ".ttf")
+)
+
+VENDORED = (*PAGE_ASSETS.values(), *FONT_ASSETS)
+
+
+@cache
+def assets_digest() -> str | None:
+    """Content hash over all vendored files, or None if any is missing."""
+    h = hashlib.sha256()
+    for asset in VENDORED:
+        path = STATIC_DIR / asset.path
+        if not path.is_file():
+            return None
+        h.update(asset.path.encode())
+        h.update(path.read_bytes())
+    return h.hexdigest()[:12]
+
+
+def asset_url(name: str, mode: str, base_path: str = "") -> str:
+    """URL of a page asset for the site's asset mode."""
+    asset = PAGE_ASSETS[name]
+    if mode == "cdn":
+        return asset.cdn_url
+    return f"{base_path}/_static/{assets_digest()}/{asset.path}"
+
+
+def resolve_static(path: str, accept_encoding: str) -> tuple[Path, str, str | None] | None:
+    """Find the file for a vendored path: (file, media type, content encoding).
+
+    Returns the smallest precompressed variant the client accepts, or None if
+    the path isn't a vendored file.
+    """
+    target = (STATIC_DIR / path).resolve()
+    if not target.is_relative_to(STATIC_DIR.resolve()) or not target.is_file():
+        return None
+    media_type = mimetypes.guess_type(target.name)[0] or "application/octet-stream"
+    accepted = {part.split(";")[0].strip() for part in accept_encoding.split(",")}
+    for encoding, suffix in ENCODINGS:
+        variant = target.with_name(target.name + suffix)
+        if encoding in accepted and variant.is_file():
+            return variant, media_type, encoding
+    return target, media_type, None
+
+
+def vendor(dest: Path = STATIC_DIR) -> None:
+    """Download every asset from its CDN and write gzip (and brotli, if installed) variants."""
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+        print("brotli not installed; writing gzip variants only", file=sys.stderr)
+    for asset in VENDORED:
+        target = dest / asset.path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with urllib.request.urlopen(asset.cdn_url) as resp:
+            data = resp.read()
+        target.write_bytes(data)
+        if target.suffix in COMPRESSIBLE:
+            target.with_name(target.name + ".gz").write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+            if brotli is not None:
+                target.with_name(target.name + ".br").write_bytes(brotli.compress(data))
+        print(f"{asset.path} ({len(data):,} bytes)")
+    assets_digest.cache_clear()
+
+
+if __name__ == "__main__":
+    vendor()
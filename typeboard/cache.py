@@ -0,0 +1,159 @@
+import enum
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from datetime import date, time as dt_time
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+
+class LabelCache:
+    """Per-site LRU + TTL cache of relationship labels keyed by (resource_id, id).
+
+    IDs are normalised with str() so path parameters and typed item IDs share
+    entries. A max_size of 0 disables the cache entirely.
+    """
+
+    def __init__(self, max_size: int = 0, ttl: float | None = 60.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str], tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _expiry(self) -> float:
+        return time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+
+    def get_many(self, resource_id: str, ids: Iterable[Any]) -> tuple[dict[str, str], list]:
+        """Return ({str(id): label} for cached IDs, [IDs that missed])."""
+        if not self.enabled:
+            return {}, list(ids)
+        found: dict[str, str] = {}
+        missing = []
+        now = time.monotonic()
+        with self._lock:
+            for raw_id in ids:
+                key = (resource_id, str(raw_id))
+                entry = self._entries.get(key)
+                if entry is not None and entry[1] > now:
+                    self._entries.move_to_end(key)
+                    found[key[1]] = entry[0]
+                    continue
+                if entry is not None:
+                    del self._entries[key]
+                missing.append(raw_id)
+            self.hits += len(found)
+            self.misses += len(missing)
+        return found, missing
+
+    def get(self, resource_id: str, id: Any) -> str | None:
+        found, _ = self.get_many(resource_id, [id])
+        return found.get(str(id))
+
+    def set_many(self, resource_id: str, labels: Mapping[Any, str]) -> None:
+        if not self.enabled or not labels:
+            return
+        expires = self._expiry()
+        with self._lock:
+            for raw_id, label in labels.items():
+                key = (resource_id, str(raw_id))
+                self._entries[key] = (label, expires)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def set(self, resource_id: str, id: Any, label: str) -> None:
+        self.set_many(resource_id, {id: label})
+
+    def invalidate(self, resource_id: str, id: Any = None) -> None:
+        """Drop one entry, or every entry of a resource when id is None."""
+        if not self.enabled:
+            return
+        with self._lock:
+            if id is not None:
+                self._entries.pop((resource_id, str(id)), None)
+                return
+            for key in [k for k in self._entries if k[0] == resource_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+        }
+
+
+# Argument types that identify a choices call by value
+_KEY_TYPES = (str, int, float, bytes, type(None), enum.Enum, date, dt_time, UUID, Decimal)
+
+
+def _key_value(value: Any) -> bool:
+    if isinstance(value, tuple):
+        return all(_key_value(v) for v in value)
+    return isinstance(value, _KEY_TYPES)
+
+
+class ChoicesCache:
+    """Bounded TTL memo for choices callables opted in with AdminField(choices_ttl=...).
+
+    Keyed by the callable and its value-typed arguments (strings, numbers, enums,
+    dates, UUIDs), so a tenant ID or user name dependency gets separate entries.
+    Other arguments, such as database sessions, are left out of the key and never
+    retained: scope per-tenant choices through a value-typed dependency.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._entries: OrderedDict[Any, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(fn: Any, kwargs: Mapping[str, Any]) -> Any:
+        """Cache key for a call: the callable and its value-typed arguments."""
+        return (fn, tuple(sorted((name, value) for name, value in kwargs.items() if _key_value(value))))
+
+    def get(self, key: Any) -> tuple[bool, Any]:
+        """(True, value) for a live entry, (False, None) otherwise."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            if entry[1] <= now:
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, entry[0]
+
+    def set(self, key: Any, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
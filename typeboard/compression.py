@@ -0,0 +1,219 @@
+import zlib
+from collections.abc import Callable, Mapping
+from typing import Any
+
+# Optional codecs: brotli ("brotli" package) and zstd ("zstandard" package)
+try:
+    import brotli
+except ImportError:
+    brotli = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Media types worth compressing; everything else (images, fonts, precompressed files) passes through
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/x-ndjson", "application/javascript", "image/svg+xml")
+
+
+class _Gzip:
+    def __init__(self, level: int):
+        self._z = zlib.compressobj(max(1, min(level, 9)), zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        # Sync flush so each streamed chunk is decodable as soon as it arrives
+        return self._z.compress(data) + self._z.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._z.flush()
+
+
+class _Brotli:
+    def __init__(self, level: int):
+        self._c = brotli.Compressor(quality=max(0, min(level, 11)))
+
+    def compress(self, data: bytes) -> bytes:
+        return self._c.process(data) + self._c.flush()
+
+    def finish(self) -> bytes:
+        return self._c.finish()
+
+
+class _Zstd:
+    def __init__(self, level: int):
+        self._c = zstandard.ZstdCompressor(level=max(1, min(level, 22))).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._c.compress(data) + self._c.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._c.flush()
+
+
+def available_encodings() -> tuple[str, ...]:
+    """Content codings this process can produce, in order of preference."""
+    encodings = []
+    if zstandard is not None:
+        encodings.append("zstd")
+    if brotli is not None:
+        encodings.append("br")
+    encodings.append("gzip")
+    return tuple(encodings)
+
+
+_CODECS: dict[str, Callable[[int], Any]] = {"gzip": _Gzip, "br": _Brotli, "zstd": _Zstd}
+
+# The three codecs use different level scales (gzip 1-9, brotli 0-11, zstd 1-22).
+# A single level is read on gzip's scale and mapped to the roughly comparable
+# speed/ratio trade-off of the others; index = gzip level - 1.
+_EQUIVALENT_LEVELS = {
+    "br": (1, 2, 3, 4, 4, 5, 6, 8, 9),
+    "zstd": (1, 1, 2, 2, 3, 3, 5, 9, 12),
+}
+
+
+def codec_level(encoding: str, level: int | Mapping[str, int]) -> int:
+    """The level for one codec: taken as-is from a per-codec mapping, else mapped from gzip's 1-9 scale."""
+    if isinstance(level, Mapping):
+        if encoding in level:
+            return level[encoding]
+        level = 6
+    level = max(1, min(level, 9))
+    if encoding == "gzip":
+        return level
+    return _EQUIVALENT_LEVELS[encoding][level - 1]
+
+
+def negotiate(accept_encoding: str, encodings: tuple[str, ...]) -> str | None:
+    """Pick the first of encodings the client accepts (honouring q=0)."""
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip()] = q
+    for encoding in encodings:
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing text responses with zstd, brotli or gzip.
+
+    Single-message bodies smaller than minimum_size are left alone. Streaming
+    bodies are compressed chunk by chunk, flushing after each one, so they stay
+    streamed. Responses that already carry a Content-Encoding pass through.
+    Every compressible response gets Vary: Accept-Encoding, compressed or not,
+    so caches never hand one client's representation to another.
+
+    level is on gzip's 1-9 scale and mapped per codec, or a mapping such as
+    {"zstd": 3, "br": 5, "gzip": 6} giving each codec its own level.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, level: int | Mapping[str, int] = 6,
+                 encodings: tuple[str, ...] | None = None):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.level = level
+        self.encodings = tuple(e for e in (encodings or available_encodings()) if e in available_encodings())
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = dict(scope.get("headers") or ())
+        encoding = negotiate(headers.get(b"accept-encoding", b"").decode("latin-1"), self.encodings)
+        await _CompressingResponder(self.app, encoding, self.level, self.minimum_size)(scope, receive, send)
+
+
+def _with_vary(headers, extra: list) -> list:
+    """headers (minus any Vary) plus extra, with Accept-Encoding appended to Vary."""
+    out = []
+    vary = None
+    for key, value in headers:
+        if key.lower() == b"vary":
+            vary = value
+            continue
+        out.append((key, value))
+    out.extend(extra)
+    if vary and b"accept-encoding" in vary.lower():
+        out.append((b"vary", vary))
+    else:
+        out.append((b"vary", vary + b", Accept-Encoding" if vary else b"Accept-Encoding"))
+    return out
+
+
+class _CompressingResponder:
+    """Compresses one response; with encoding None (nothing acceptable) it only adds Vary."""
+
+    def __init__(self, app, encoding: str | None, level: int | Mapping[str, int], minimum_size: int):
+        self.app = app
+        self.encoding = encoding
+        self.level = level
+        self.minimum_size = minimum_size
+        self.start_message: dict | None = None
+        self.compressor = None
+        self.passthrough = False
+
+    async def __call__(self, scope, receive, send):
+        self.send = send
+        await self.app(scope, receive, self.wrapped_send)
+
+    async def wrapped_send(self, message):
+        if message["type"] == "http.response.start":
+            # Hold the headers until the first body chunk shows how big the response is
+            self.start_message = message
+            headers = {k.lower(): v for k, v in message.get("headers", ())}
+            content_type = headers.get(b"content-type", b"").decode("latin-1")
+            self.passthrough = (
+                b"content-encoding" in headers
+                or message["status"] in (204, 304)
+                or not content_type.startswith(COMPRESSIBLE_TYPES)
+            )
+            if self.passthrough:
+                await self.send(message)
+            elif self.encoding is None:
+                self.passthrough = True
+                await self.send(self._identity_start())
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.compressor is None:
+            if not more_body and len(body) < self.minimum_size:
+                self.passthrough = True
+                await self.send(self._identity_start())
+                await self.send(message)
+                return
+            self.compressor = _CODECS[self.encoding](codec_level(self.encoding, self.level))
+            await self.send(self._compressed_start())
+
+        data = self.compressor.compress(body) if body else b""
+        if not more_body:
+            data += self.compressor.finish()
+        await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+    def _identity_start(self) -> dict:
+        return {**self.start_message, "headers": _with_vary(self.start_message.get("headers", ()), [])}
+
+    def _compressed_start(self) -> dict:
+        headers = []
+        for key, value in self.start_message.get("headers", ()):
+            lower = key.lower()
+            if lower == b"content-length":
+                continue
+            if lower == b"etag" and not value.startswith(b"W/"):
+                # The compressed bytes differ from the identity representation
+                value = b"W/" + value
+            headers.append((key, value))
+        headers = _with_vary(headers, [(b"content-encoding", self.encoding.encode())])
+        return {**self.start_message, "headers": headers}
@@ -0,0 +1,48 @@
+import hashlib
+from collections.abc import Iterable
+from typing import Any
+
+from fastapi import Request
+from fastapi.responses import Response
+
+
+def compute_etag(*parts: Any) -> str:
+    """Strong ETag over the repr of parts (query params, resource version, ...)."""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match header lists etag (or is *)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # Weak comparison, as RFC 9110 requires for If-None-Match
+    candidates = (tag.strip().removeprefix("W/") for tag in header.split(","))
+    return etag in candidates
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+
+def with_etag(response: Response, etag: str) -> Response:
+    """Tag a rendered response; no-cache makes browsers revalidate instead of reusing it blindly."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+def query_key(request: Request) -> tuple[tuple[str, str], ...]:
+    """Order-independent identity of the request's query parameters."""
+    return tuple(sorted(request.query_params.multi_items()))
+
+
+def items_version(items: Iterable[Any], id_field: str, version_field: str) -> tuple:
+    """(id, version) pairs for rows carrying an AdminField(version=True) column."""
+    def get(item, name):
+        return item.get(name) if isinstance(item, dict) else getattr(item, name, None)
+
+    return tuple((get(item, id_field), get(item, version_field)) for item in items)
@@ -0,0 +1,43 @@
+import functools
+import inspect
+from collections.abc import Callable
+from typing import Any
+
+import anyio
+import anyio.to_thread
+
+
+def is_async_callable(fn: Callable) -> bool:
+    """Check whether calling fn returns an awaitable (coroutine function or async __call__)."""
+    while isinstance(fn, functools.partial):
+        fn = fn.func
+    if inspect.iscoroutinefunction(fn):
+        return True
+    call = getattr(fn, "__call__", None)
+    return call is not None and inspect.iscoroutinefunction(call)
+
+
+def create_thread_limiter(size: int) -> anyio.CapacityLimiter:
+    """Create the limiter that bounds how many sync callables run in worker threads at once."""
+    if size < 1:
+        raise ValueError("thread_pool_size must be at least 1")
+    return anyio.CapacityLimiter(size)
+
+
+async def run_callable(
+    fn: Callable,
+    kwargs: dict[str, Any],
+    *,
+    is_async: bool | None = None,
+    limiter: anyio.CapacityLimiter | None = None,
+) -> Any:
+    """Call a user callable without blocking the event loop.
+
+    Coroutine functions are awaited directly; sync callables run in a worker
+    thread bounded by ``limiter`` (anyio's default limiter when None).
+    """
+    if is_async is None:
+        is_async = is_async_callable(fn)
+    if is_async:
+        return await fn(**kwargs)
+    return await anyio.to_thread.run_sync(functools.partial(fn, **kwargs), limiter=limiter)
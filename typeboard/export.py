@@ -0,0 +1,191 @@
+import asyncio
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Callable, Iterator
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any
+
+import anyio.to_thread
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+from typeboard.fields import FieldInfo
+from typeboard.pagination import CursorPage, Page
+from typeboard.plans import CallPlan
+
+# format -> media type
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def _take(it: Iterator, n: int) -> list:
+    return list(islice(it, n))
+
+
+async def _iterator_batches(it: Iterator | AsyncIterator, size: int, limiter=None) -> AsyncIterator[list]:
+    """Re-chunk a lazy row iterator into lists of at most size rows."""
+    if isinstance(it, AsyncIterator):
+        batch = []
+        async for row in it:
+            batch.append(row)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+        return
+    try:
+        while batch := await anyio.to_thread.run_sync(_take, it, size, limiter=limiter):
+            yield batch
+    finally:
+        close = getattr(it, "close", None)
+        if close is not None:
+            close()
+
+
+def _next_call(plan: CallPlan, kwargs: dict[str, Any], result: Any, items: list, page_size: int) -> dict[str, Any] | None:
+    """kwargs for the page after result, or None when result was the last one."""
+    if not items:
+        return None
+    if plan.cursor_param and isinstance(result, CursorPage):
+        return {**kwargs, plan.cursor_param: result.next_cursor} if result.next_cursor else None
+    if plan.page_param:
+        more = result.has_next if isinstance(result, Page) else len(items) >= page_size
+        return {**kwargs, plan.page_param: kwargs[plan.page_param] + 1} if more else None
+    return None
+
+
+async def iter_batches(
+    plan: CallPlan,
+    kwargs: dict[str, Any],
+    *,
+    page_size: int,
+    limiter=None,
+    prefetch: bool = False,
+    arrange: Callable[[list], list] | None = None,
+) -> AsyncIterator[list]:
+    """Walk a list function page by page, yielding each page's items.
+
+    Follows next_cursor for keyset pagination, otherwise increments the page
+    parameter; functions that don't paginate are read in page_size chunks.
+    With prefetch, the next page is requested while the current one is being
+    consumed, so at most two pages are in memory. arrange, if given, filters
+    and sorts a plain list result before it is chunked.
+    """
+    kwargs = dict(kwargs)
+    if plan.page_param:
+        kwargs[plan.page_param] = 1
+    if plan.page_size_param:
+        kwargs[plan.page_size_param] = page_size
+
+    pending: asyncio.Task | None = None
+    try:
+        result = await plan.call(kwargs, limiter)
+        while True:
+            if isinstance(result, (Iterator, AsyncIterator)):
+                async for batch in _iterator_batches(result, page_size, limiter):
+                    yield batch
+                return
+            if isinstance(result, (Page, CursorPage)):
+                items = result.items
+            else:
+                items = result if isinstance(result, list) else []
+            next_kwargs = _next_call(plan, kwargs, result, items, page_size)
+            if next_kwargs is not None and prefetch:
+                pending = asyncio.ensure_future(plan.call(next_kwargs, limiter))
+            if not (plan.page_param or plan.cursor_param):
+                if arrange is not None and isinstance(result, list):
+                    items = arrange(items)
+                # Everything came back at once: hand it out in bounded chunks
+                for start in range(0, len(items), page_size):
+                    yield items[start:start + page_size]
+            elif items:
+                yield items
+            if next_kwargs is None:
+                return
+            kwargs = next_kwargs
+            if pending is not None:
+                result, pending = await pending, None
+            else:
+                result = await plan.call(kwargs, limiter)
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+def _get(item: Any, name: str) -> Any:
+    return item.get(name) if isinstance(item, dict) else getattr(item, name, None)
+
+
+def _row_dict(item: Any, names: list[str]) -> dict[str, Any]:
+    """JSON-ready values of the exported columns, in column order."""
+    if isinstance(item, BaseModel):
+        data = item.model_dump(mode="json", include=set(names))
+    else:
+        data = jsonable_encoder({name: _get(item, name) for name in names})
+    return {name: data.get(name) for name in names}
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    return value
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Aware datetimes in UTC; naive ones are taken to be UTC already."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def since_filter(field: FieldInfo, since: Any) -> Callable[[Any], bool]:
+    """Predicate keeping rows whose updated-at value is at or after since.
+
+    Datetimes are compared in UTC, so naive and aware values can be mixed.
+    """
+    name = field.name
+    if isinstance(since, datetime):
+        since = _as_utc(since)
+
+        def keep(item: Any) -> bool:
+            value = _get(item, name)
+            return value is not None and _as_utc(value) >= since
+    else:
+        def keep(item: Any) -> bool:
+            value = _get(item, name)
+            return value is not None and value >= since
+
+    return keep
+
+
+async def serialize(
+    batches: AsyncIterator[list],
+    columns: list[FieldInfo],
+    fmt: str,
+    keep: Callable[[Any], bool] | None = None,
+) -> AsyncIterator[str]:
+    """Encode batches of items as CSV (with a header row) or NDJSON, one chunk per batch."""
+    names = [col.name for col in columns]
+    if fmt == "csv":
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(names)
+        yield buf.getvalue()
+    async for batch in batches:
+        rows = [_row_dict(item, names) for item in batch if keep is None or keep(item)]
+        if not rows:
+            continue
+        if fmt == "csv":
+            buf = io.StringIO()
+            writer = csv.writer(buf)
+            writer.writerows([_csv_value(row[name]) for name in names] for row in rows)
+            yield buf.getvalue()
+        else:
+            yield "".join(json.dumps(row) + "\n" for row in rows)
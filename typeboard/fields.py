@@ -16,17 +16,29 @@ class AdminField:
     column: bool = True
     order: int | None = None
     is_id: bool = False
-    pagination: str | None = None  # "page" or "page_size"
+    pagination: str | None = None  # "page", "page_size" or "cursor"
     sort: bool = False
     choices: Callable | None = None
+    # Seconds to memoise the choices callable's result (per argument set); None = every request
+    choices_ttl: float | None = None
     display_name: bool = False
     relationship: str | None = None
     relationship_search: str | None = None
+    # On a model field: the last-modified timestamp used by incremental export.
+    # On a list function parameter: receives the export's since= value.
+    updated_at: bool = False
+    # Row version (revision counter, updated-at, hash) used for ETags
+    version: bool = False
 
 
-@dataclass
+@dataclass(frozen=True)
 class FieldInfo:
-    """Resolved field metadata for rendering."""
+    """Resolved field metadata for rendering.
+
+    Frozen: introspection results are memoised per model and function and
+    shared by every resource using them. Use dataclasses.replace() to derive
+    a variant.
+    """
     name: str
     python_type: type
     widget: str
@@ -38,11 +50,28 @@ class FieldInfo:
     filter: str | None = None
     column: bool = True
     order: int | None = None
-    enum_choices: list[tuple[str, str]] | None = None
+    enum_choices: tuple[tuple[str, str], ...] | None = None
     choices_callable: Callable | None = None
+    choices_ttl: float | None = None
     display_name: bool = False
     relationship: str | None = None
     relationship_search: str | None = None
+    updated_at: bool = False
+    version: bool = False
+    # Converter from submitted form values to python_type (see compile_coercer)
+    coerce: Callable[[Any], Any] | None = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.coerce is None:
+            object.__setattr__(self, "coerce", compile_coercer(self.python_type))
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The coercer is a closure; it is rebuilt from python_type when unpickled
+        return {**self.__dict__, "coerce": None}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.__post_init__()
 
 
 def _unwrap_optional(python_type: type) -> type:
@@ -105,3 +134,79 @@ def get_enum_choices(python_type: type) -> list[tuple[str, str]] | None:
 def label_from_name(name: str) -> str:
     """Convert snake_case to Title Case."""
     return name.replace("_", " ").title()
+
+
+_TRUTHY = frozenset(("true", "1", "on", "yes"))
+
+
+def _empty_to_none(convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def coerce(value: Any) -> Any:
+        if value is None or value == "":
+            return None
+        return convert(value)
+    return coerce
+
+
+def _enum_converter(enum_cls: type[enum.Enum]) -> Callable[[Any], Any]:
+    """Map submitted values to members via a value -> member table (raw and stringified)."""
+    lookup: dict[Any, enum.Enum] = {}
+    for member in enum_cls:
+        lookup.setdefault(str(member.value), member)
+    for member in enum_cls:
+        try:
+            lookup[member.value] = member
+        except TypeError:  # unhashable value
+            pass
+
+    def convert(value: Any) -> Any:
+        try:
+            return lookup[value]
+        except (KeyError, TypeError):
+            return enum_cls(value)
+    return convert
+
+
+def _scalar_converter(python_type: Any) -> Callable[[Any], Any]:
+    if python_type is bool:
+        return lambda value: str(value).lower() in _TRUTHY
+    if python_type is int:
+        return int
+    if python_type is float:
+        return float
+    if isinstance(python_type, type):
+        if issubclass(python_type, datetime):
+            return lambda value: datetime.fromisoformat(str(value))
+        if issubclass(python_type, date):
+            return lambda value: date.fromisoformat(str(value))
+        if issubclass(python_type, enum.Enum):
+            return _enum_converter(python_type)
+    return str
+
+
+def compile_coercer(python_type: Any) -> Callable[[Any], Any]:
+    """Build a converter from submitted form values to python_type.
+
+    The type dispatch happens once here; the returned closure only converts.
+    Empty values become None (or [] for list types).
+    """
+    if get_origin(python_type) is types.UnionType:
+        non_none = [a for a in get_args(python_type) if a is not type(None)]
+        if non_none:
+            python_type = non_none[0]
+    if get_origin(python_type) is list:
+        args = get_args(python_type)
+        inner = compile_coercer(args[0] if args else str)
+
+        def coerce_list(value: Any) -> list:
+            if isinstance(value, list):
+                return [inner(v) for v in value]
+            if value is None or value == "":
+                return []
+            return [inner(value)]
+        return coerce_list
+    return _empty_to_none(_scalar_converter(python_type))
+
+
+def coerce_value(value: Any, python_type: type) -> Any:
+    """Coerce a form string value to the target Python type."""
+    return compile_coercer(python_type)(value)
@@ -1,5 +1,8 @@
+import collections.abc
+import functools
 import inspect
 import types
+import weakref
 from dataclasses import dataclass
 from typing import Annotated, Any, get_args, get_origin, get_type_hints
 
@@ -8,6 +11,7 @@ from pydantic import BaseModel
 from typeboard.fields import (
     AdminField,
     FieldInfo,
+    compile_coercer,
     extract_admin_field,
     get_enum_choices,
     infer_widget,
@@ -78,16 +82,94 @@ def _build_field_info(
         filter=admin.filter if admin else None,
         column=admin.column if admin else True,
         order=admin.order if admin else None,
-        enum_choices=get_enum_choices(base_type),
+        enum_choices=tuple(enum_choices) if (enum_choices := get_enum_choices(base_type)) else None,
         choices_callable=admin.choices if admin else None,
+        choices_ttl=admin.choices_ttl if admin else None,
         display_name=admin.display_name if admin else False,
         relationship=admin.relationship if admin else None,
         relationship_search=admin.relationship_search if admin else None,
+        updated_at=admin.updated_at if admin else False,
+        version=admin.version if admin else False,
+        coerce=compile_coercer(base_type),
     )
 
 
+# Process-wide memo of introspection results. Weakly keyed, so reloaded
+# models and functions drop their entries once the old objects are collected.
+# Function entries map (helper name, *args) -> result; lists are kept as tuples.
+_model_fields: "weakref.WeakKeyDictionary[type, tuple[FieldInfo, ...]]" = weakref.WeakKeyDictionary()
+_function_memo: "weakref.WeakKeyDictionary[Any, dict[tuple, Any]]" = weakref.WeakKeyDictionary()
+
+
+def _per_function(compute):
+    """Memoise an introspection helper per inspected function (and its other arguments).
+
+    List results are stored as tuples and handed out as fresh lists. Callables
+    that can't be weakly referenced (e.g. some builtins) are never memoised.
+    """
+    @functools.wraps(compute)
+    def wrapper(fn, *args, **kwargs):
+        try:
+            entries = _function_memo.get(fn)
+        except TypeError:
+            return compute(fn, *args, **kwargs)
+        if entries is None:
+            entries = _function_memo[fn] = {}
+        key = (compute.__name__, *args, *sorted(kwargs.items()))
+        if key not in entries:
+            value = compute(fn, *args, **kwargs)
+            entries[key] = (True, tuple(value)) if isinstance(value, list) else (False, value)
+        is_list, value = entries[key]
+        return list(value) if is_list else value
+
+    return wrapper
+
+
+def introspection_entries(fn) -> dict[tuple, Any]:
+    """A copy of everything memoised for fn (see typeboard.manifest)."""
+    try:
+        return dict(_function_memo.get(fn) or {})
+    except TypeError:
+        return {}
+
+
+def seed_introspection(fn, entries: dict[tuple, Any]) -> None:
+    """Prime fn's memo with previously computed entries (see typeboard.manifest)."""
+    _function_memo.setdefault(fn, {}).update(entries)
+
+
+def invalidate_introspection(*targets: Any) -> None:
+    """Forget memoised introspection results, e.g. after hot-reloading schemas.
+
+    With no arguments everything is forgotten. Given models or functions, only
+    their entries are dropped; a model also drops every function entry, since
+    those may have expanded its fields. Resources keep the field lists they
+    already hold, so rebuild the app afterwards.
+    """
+    if not targets:
+        _model_fields.clear()
+        _function_memo.clear()
+        return
+    for target in targets:
+        if isinstance(target, type):
+            _model_fields.pop(target, None)
+            _function_memo.clear()
+        else:
+            try:
+                _function_memo.pop(target, None)
+            except TypeError:  # not weak-referenceable, so never cached
+                pass
+
+
 def extract_fields_from_model(model: type[BaseModel]) -> list[FieldInfo]:
-    """Extract FieldInfo list from a Pydantic model."""
+    """Extract FieldInfo list from a Pydantic model (memoised per model class)."""
+    cached = _model_fields.get(model)
+    if cached is None:
+        cached = _model_fields[model] = tuple(_introspect_model(model))
+    return list(cached)
+
+
+def _introspect_model(model: type[BaseModel]) -> list[FieldInfo]:
     hints = get_type_hints(model, include_extras=True)
     model_fields = model.model_fields
     result: list[FieldInfo] = []
@@ -100,8 +182,9 @@ def extract_fields_from_model(model: type[BaseModel]) -> list[FieldInfo]:
     return result
 
 
+@_per_function
 def extract_fields_from_function(fn, skip_id: bool = False) -> list[FieldInfo]:
-    """Extract FieldInfo list from a function's parameters."""
+    """Extract FieldInfo list from a function's parameters (memoised per function)."""
     hints = get_type_hints(fn, include_extras=True)
     sig = inspect.signature(fn)
     result: list[FieldInfo] = []
@@ -140,31 +223,43 @@ def extract_return_type(fn) -> type | None:
 
 
 def extract_page_item_type(return_type) -> type | None:
-    """Extract T from Page[T]."""
-    from typeboard.pagination import Page
+    """Extract T from Page[T] or CursorPage[T]."""
+    from typeboard.pagination import CursorPage, Page
 
     origin = get_origin(return_type)
-    if origin is Page:
+    if origin is Page or origin is CursorPage:
         args = get_args(return_type)
         return args[0] if args else None
     return None
 
 
+_ROW_ITERATOR_ORIGINS = (
+    collections.abc.Iterator,
+    collections.abc.Iterable,
+    collections.abc.Generator,
+    collections.abc.AsyncIterator,
+    collections.abc.AsyncIterable,
+    collections.abc.AsyncGenerator,
+)
+
+
+@_per_function
 def extract_columns(fn) -> list[FieldInfo]:
     """Extract column FieldInfo from a list function's return type.
 
-    Supports Page[T], list[T], and direct model return types.
+    Supports Page[T], CursorPage[T], list[T], Iterator[T] / AsyncIterator[T]
+    (and the Iterable/Generator variants), and direct model return types.
     """
     rt = extract_return_type(fn)
     if rt is None:
         return []
-    # Page[T]
+    # Page[T] / CursorPage[T]
     item_type = extract_page_item_type(rt)
     if item_type and isinstance(item_type, type) and issubclass(item_type, BaseModel):
         return extract_fields_from_model(item_type)
-    # list[T]
+    # list[T] / Iterator[T] / AsyncIterator[T]
     origin = get_origin(rt)
-    if origin is list:
+    if origin is list or origin in _ROW_ITERATOR_ORIGINS:
         args = get_args(rt)
         if args and isinstance(args[0], type) and issubclass(args[0], BaseModel):
             return extract_fields_from_model(args[0])
@@ -174,7 +269,7 @@ def extract_columns(fn) -> list[FieldInfo]:
     return []
 
 
-@dataclass
+@dataclass(frozen=True)
 class DependsParam:
     """A parameter that should be forwarded to FastAPI as a dependency."""
     name: str
@@ -182,6 +277,7 @@ class DependsParam:
     default: Any
 
 
+@_per_function
 def extract_depends_params(fn) -> list[DependsParam]:
     """Extract Depends() params from a function signature."""
     hints = get_type_hints(fn, include_extras=True)
@@ -195,6 +291,7 @@ def extract_depends_params(fn) -> list[DependsParam]:
     return result
 
 
+@_per_function
 def find_id_param(fn) -> str | None:
     """Find the ID parameter name. Resolution: AdminField(is_id=True) > 'id' > first non-DI param."""
     hints = get_type_hints(fn, include_extras=True)
@@ -227,6 +324,7 @@ def find_id_param(fn) -> str | None:
     return None
 
 
+@_per_function
 def find_pagination_params(fn) -> tuple[str | None, str | None]:
     """Find page and page_size param names. Resolution: AdminField(pagination=...) > convention."""
     hints = get_type_hints(fn, include_extras=True)
@@ -258,6 +356,7 @@ def find_pagination_params(fn) -> tuple[str | None, str | None]:
     return page_param, page_size_param
 
 
+@_per_function
 def find_sort_param(fn) -> str | None:
     """Find the sort param name. Resolution: AdminField(sort=True) > named 'sort'."""
     hints = get_type_hints(fn, include_extras=True)
@@ -279,3 +378,69 @@ def find_sort_param(fn) -> str | None:
             return "sort"
 
     return None
+
+
+@_per_function
+def find_cursor_param(fn) -> str | None:
+    """Find the cursor param name. Resolution: AdminField(pagination="cursor") > named 'cursor'."""
+    hints = get_type_hints(fn, include_extras=True)
+    sig = inspect.signature(fn)
+
+    # Pass 1: AdminField(pagination="cursor")
+    for param_name, param in sig.parameters.items():
+        annotation = hints.get(param_name, param.annotation)
+        if _is_depends(annotation, param.default):
+            continue
+        admin = extract_admin_field(annotation)
+        if admin and admin.pagination == "cursor":
+            return param_name
+
+    # Pass 2: named 'cursor'
+    if "cursor" in sig.parameters:
+        ann = hints.get("cursor", sig.parameters["cursor"].annotation)
+        if not _is_depends(ann, sig.parameters["cursor"].default):
+            return "cursor"
+
+    return None
+
+
+@_per_function
+def find_since_param(fn) -> str | None:
+    """Find the incremental-export param name. Resolution: AdminField(updated_at=True) > named 'since'."""
+    hints = get_type_hints(fn, include_extras=True)
+    sig = inspect.signature(fn)
+
+    # Pass 1: AdminField(updated_at=True)
+    for param_name, param in sig.parameters.items():
+        annotation = hints.get(param_name, param.annotation)
+        if _is_depends(annotation, param.default):
+            continue
+        admin = extract_admin_field(annotation)
+        if admin and admin.updated_at:
+            return param_name
+
+    # Pass 2: named 'since'
+    if "since" in sig.parameters:
+        ann = hints.get("since", sig.parameters["since"].annotation)
+        if not _is_depends(ann, sig.parameters["since"].default):
+            return "since"
+
+    return None
+
+
+@_per_function
+def find_model_param(fn) -> tuple[str, type[BaseModel]] | tuple[None, None]:
+    """Find the first parameter annotated with a Pydantic model."""
+    hints = inspect.get_annotations(fn, eval_str=True)
+    for name in inspect.signature(fn).parameters:
+        ann = hints.get(name)
+        if ann and isinstance(ann, type) and issubclass(ann, BaseModel):
+            return name, ann
+    return None, None
+
+
+@_per_function
+def find_param_type(fn, name: str) -> Any:
+    """The type of fn's parameter name, without Annotated metadata (str when unannotated)."""
+    hints = inspect.get_annotations(fn, eval_str=True)
+    return unwrap_annotated(hints.get(name, str))
@@ -0,0 +1,178 @@
+"""Introspection manifests: resolved fields and parameters saved at build time.
+
+Short-lived workers otherwise repeat every annotation evaluation on start.
+Generate a manifest while building the image:
+
+    typeboard-manifest myapp.admin:site -o admin-manifest.pickle
+
+and pass AdminSite(manifest="admin-manifest.pickle"). Each resource operation
+whose callable still has the same signature fingerprint reuses its saved
+results; anything else is introspected as usual.
+
+Manifests are pickles: only load ones your own build produced.
+"""
+import argparse
+import dataclasses
+import enum
+import hashlib
+import importlib
+import inspect
+import pickle
+import re
+import sys
+from pathlib import Path
+from typing import Any, get_args
+
+from pydantic import BaseModel
+
+from typeboard.fields import FieldInfo
+from typeboard.introspection import introspection_entries, seed_introspection
+
+MANIFEST_VERSION = 1
+
+# Object reprs embed memory addresses, which differ between processes
+_ADDRESS = re.compile(r" at 0x[0-9a-fA-F]+")
+_DOTTED_NAME = re.compile(r"[A-Za-z_][\w.]*")
+
+
+def _compatibility() -> tuple:
+    """What a manifest must agree on with this process to be usable at all."""
+    return (
+        MANIFEST_VERSION,
+        sys.version_info[:2],
+        tuple(f.name for f in dataclasses.fields(FieldInfo)),
+    )
+
+
+def _referenced_types(fn) -> list[type]:
+    """Pydantic models and enums reachable from fn's annotations, including through model fields.
+
+    String annotations are resolved by name in fn's module without evaluating them.
+    """
+    found: list[type] = []
+    stack = list(inspect.get_annotations(fn).values())
+    namespace = getattr(fn, "__globals__", {})
+    while stack:
+        ann = stack.pop()
+        if isinstance(ann, str):
+            for dotted in _DOTTED_NAME.findall(ann):
+                head, *rest = dotted.split(".")
+                obj = namespace.get(head)
+                for attr in rest:
+                    obj = getattr(obj, attr, None)
+                if obj is not None:
+                    stack.append(obj)
+        elif isinstance(ann, type) and issubclass(ann, (BaseModel, enum.Enum)):
+            if ann not in found:
+                found.append(ann)
+                if issubclass(ann, BaseModel):
+                    stack.extend(field.annotation for field in ann.model_fields.values())
+        else:
+            stack.extend(get_args(ann))
+    return found
+
+
+def signature_fingerprint(fn) -> str:
+    """Hash of everything fn's FieldInfos are derived from.
+
+    Covers fn's identity and signature, the fields of the models it references
+    (annotation, metadata, default, whether required) and the members of every
+    enum involved, which become FieldInfo.enum_choices.
+    """
+    name = getattr(fn, "__qualname__", type(fn).__qualname__)
+    parts = [f"{getattr(fn, '__module__', '')}:{name}{inspect.signature(fn)}"]
+    for cls in _referenced_types(fn):
+        parts.append(f"{cls.__module__}:{cls.__qualname__}")
+        if issubclass(cls, enum.Enum):
+            parts.extend(f"{member.name}={member.value!r}" for member in cls)
+            continue
+        for field_name, field in cls.model_fields.items():
+            parts.append(
+                f"{field_name}:{field.annotation!r}:{field.metadata!r}:{field.default!r}:"
+                f"{field.default_factory!r}:{field.is_required()}"
+            )
+    digest = hashlib.blake2b(_ADDRESS.sub("", "\n".join(parts)).encode(), digest_size=16)
+    return digest.hexdigest()
+
+
+def build_manifest(site) -> dict[str, Any]:
+    """Introspect every resource of site and collect the results per operation.
+
+    Operations whose results can't be pickled (e.g. a lambda choices callable)
+    are left out and will be introspected at startup.
+    """
+    resources: dict[str, dict[str, Any]] = {}
+    for resource in site.resources.values():
+        resource.introspect()
+        ops = {}
+        for op in resource.OPERATIONS:
+            fn = resource._fn_for_op(op)
+            if fn is None:
+                continue
+            try:
+                entries = pickle.dumps(introspection_entries(fn))
+            except Exception:
+                continue
+            ops[op] = {"fingerprint": signature_fingerprint(fn), "entries": entries}
+        resources[resource.id] = ops
+    return {"compatibility": _compatibility(), "resources": resources}
+
+
+def export_manifest(site, path: str | Path) -> None:
+    Path(path).write_bytes(pickle.dumps(build_manifest(site)))
+
+
+def load_manifest(site, path: str | Path) -> int:
+    """Seed the introspection memo from a manifest; returns how many operations were reused.
+
+    A manifest from another typeboard layout or Python version is ignored, as
+    is any operation whose callable's fingerprint no longer matches.
+    """
+    manifest = pickle.loads(Path(path).read_bytes())
+    if manifest.get("compatibility") != _compatibility():
+        return 0
+    reused = 0
+    for resource_id, ops in manifest["resources"].items():
+        resource = site.resources.get(resource_id)
+        if resource is None:
+            continue
+        for op, saved in ops.items():
+            fn = resource._fn_for_op(op)
+            if fn is None or saved["fingerprint"] != signature_fingerprint(fn):
+                continue
+            try:
+                entries = pickle.loads(saved["entries"])
+            except Exception:  # e.g. a referenced class was renamed
+                continue
+            seed_introspection(fn, entries)
+            reused += 1
+    return reused
+
+
+def _import_site(target: str):
+    module_name, _, attr = target.partition(":")
+    if not attr:
+        raise SystemExit(f"expected module:attribute, got {target!r}")
+    obj = importlib.import_module(module_name)
+    for part in attr.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="typeboard-manifest", description="Write an introspection manifest for an AdminSite.")
+    parser.add_argument("site", help="the AdminSite to introspect, as module:attribute")
+    parser.add_argument("-o", "--output", type=Path, default=Path("typeboard-manifest.pickle"))
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, str(Path.cwd()))
+    site = _import_site(args.site)
+    manifest = build_manifest(site)
+    args.output.write_bytes(pickle.dumps(manifest))
+    ops = sum(len(ops) for ops in manifest["resources"].values())
+    print(f"wrote {args.output}: {len(manifest['resources'])} resources, {ops} operations")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
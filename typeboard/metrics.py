@@ -0,0 +1,155 @@
+import threading
+from bisect import bisect_left
+
+from typeboard.timing import RequestTiming
+
+# Histogram upper bounds: request latency in seconds, rows returned per request
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+ROWS_BUCKETS = (0, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _Series:
+    """Counters for one (resource, operation) pair within one thread's shard."""
+
+    __slots__ = ("requests", "errors", "latency", "latency_sum", "rows", "rows_sum", "rows_count")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        # Per-bucket (not cumulative) counts; the last slot is +Inf
+        self.latency = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+        self.rows = [0] * (len(ROWS_BUCKETS) + 1)
+        self.rows_sum = 0
+        self.rows_count = 0
+
+    def merge(self, other: "_Series") -> None:
+        self.requests += other.requests
+        self.errors += other.errors
+        self.latency = [a + b for a, b in zip(self.latency, other.latency)]
+        self.latency_sum += other.latency_sum
+        self.rows = [a + b for a, b in zip(self.rows, other.rows)]
+        self.rows_sum += other.rows_sum
+        self.rows_count += other.rows_count
+
+
+class Metrics:
+    """Per-resource, per-operation request metrics in Prometheus text format.
+
+    Each thread records into its own shard, so observing a request never takes
+    a lock; a scrape merges the shards. Fed by TimingMiddleware with the
+    RequestTiming of every labelled request.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: list[dict[tuple[str, str], _Series]] = []
+        self._shards_lock = threading.Lock()
+
+    def _shard(self) -> dict[tuple[str, str], _Series]:
+        shard = getattr(self._local, "series", None)
+        if shard is None:
+            shard = self._local.series = {}
+            # Only taken once per thread
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def observe(self, timing: RequestTiming) -> None:
+        shard = self._shard()
+        key = (timing.resource or "", timing.operation)
+        series = shard.get(key)
+        if series is None:
+            series = shard[key] = _Series()
+        series.requests += 1
+        if timing.status is None or timing.status >= 500:
+            series.errors += 1
+        seconds = timing.total / 1e3
+        series.latency[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        series.latency_sum += seconds
+        if timing.rows is not None:
+            series.rows[bisect_left(ROWS_BUCKETS, timing.rows)] += 1
+            series.rows_sum += timing.rows
+            series.rows_count += 1
+
+    def snapshot(self) -> dict[tuple[str, str], _Series]:
+        """Merged counters of every thread, keyed by (resource, operation)."""
+        with self._shards_lock:
+            shards = list(self._shards)
+        merged: dict[tuple[str, str], _Series] = {}
+        for shard in shards:
+            # dict.copy() is atomic, so a concurrent first request can't break iteration
+            for key, series in shard.copy().items():
+                merged.setdefault(key, _Series()).merge(series)
+        return dict(sorted(merged.items()))
+
+    def exposition(self, site=None) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines: list[str] = []
+
+        def header(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        header("typeboard_requests_total", "counter", "Admin requests handled.")
+        for key, series in snapshot.items():
+            lines.append(f"typeboard_requests_total{{{_labels(key)}}} {series.requests}")
+        header("typeboard_request_errors_total", "counter", "Admin requests that failed with a 5xx status.")
+        for key, series in snapshot.items():
+            lines.append(f"typeboard_request_errors_total{{{_labels(key)}}} {series.errors}")
+
+        header("typeboard_request_duration_seconds", "histogram", "Admin request latency.")
+        for key, series in snapshot.items():
+            _histogram(lines, "typeboard_request_duration_seconds", _labels(key),
+                       LATENCY_BUCKETS, series.latency, series.latency_sum, series.requests)
+        header("typeboard_rows_returned", "histogram", "Rows shown per admin request.")
+        for key, series in snapshot.items():
+            if series.rows_count:
+                _histogram(lines, "typeboard_rows_returned", _labels(key),
+                           ROWS_BUCKETS, series.rows, series.rows_sum, series.rows_count)
+
+        if site is not None:
+            _site_gauges(lines, header, site)
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(key: tuple[str, str]) -> str:
+    resource, operation = key
+    return f'resource="{_escape(resource)}",operation="{_escape(operation)}"'
+
+
+def _histogram(lines: list[str], name: str, labels: str, bounds: tuple, counts: list[int], total: float, count: int) -> None:
+    cumulative = 0
+    for bound, bucket_count in zip(bounds, counts):
+        cumulative += bucket_count
+        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {count}')
+    lines.append(f"{name}_sum{{{labels}}} {total}")
+    lines.append(f"{name}_count{{{labels}}} {count}")
+
+
+def _site_gauges(lines: list[str], header, site) -> None:
+    label_stats = site.label_cache.stats()
+    header("typeboard_label_cache_hits_total", "counter", "Relationship label cache hits.")
+    lines.append(f"typeboard_label_cache_hits_total {label_stats['hits']}")
+    header("typeboard_label_cache_misses_total", "counter", "Relationship label cache misses.")
+    lines.append(f"typeboard_label_cache_misses_total {label_stats['misses']}")
+    header("typeboard_label_cache_entries", "gauge", "Entries in the relationship label cache.")
+    lines.append(f"typeboard_label_cache_entries {label_stats['size']}")
+    header("typeboard_choices_cache_entries", "gauge", "Entries in the choices cache.")
+    lines.append(f"typeboard_choices_cache_entries {len(site.choices_cache)}")
+
+    limiter = site.thread_limiter
+    header("typeboard_thread_pool_size", "gauge", "Worker threads available to sync callables.")
+    lines.append(f"typeboard_thread_pool_size {limiter.total_tokens}")
+    header("typeboard_thread_pool_busy", "gauge", "Worker threads running sync callables.")
+    lines.append(f"typeboard_thread_pool_busy {limiter.borrowed_tokens}")
+    header("typeboard_thread_pool_waiting", "gauge", "Sync callables waiting for a worker thread.")
+    lines.append(f"typeboard_thread_pool_waiting {limiter.statistics().tasks_waiting}")
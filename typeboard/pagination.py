@@ -1,26 +1,139 @@
+from collections.abc import AsyncIterator, Iterator
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from itertools import islice
+from typing import Any, Generic, TypeVar
+
+import anyio.to_thread
 
 T = TypeVar("T")
 
 
 @dataclass
 class Page(Generic[T]):
+    """Offset-paginated page.
+
+    ``total`` may be None when the count is deferred (see ``@resource.count``),
+    or an estimate when ``approximate`` is set.
+    """
     items: list[T]
-    total: int
+    total: int | None
     page: int
     page_size: int
+    approximate: bool = False
 
     @property
-    def total_pages(self) -> int:
+    def total_pages(self) -> int | None:
+        if self.total is None:
+            return None
         if self.page_size <= 0:
             return 0
         return (self.total + self.page_size - 1) // self.page_size
 
     @property
     def has_next(self) -> bool:
+        if self.total is None or self.approximate:
+            # Unknown/estimated total: a full page suggests there is more
+            return len(self.items) >= self.page_size > 0
         return self.page < self.total_pages
 
     @property
     def has_prev(self) -> bool:
         return self.page > 1
+
+
+@dataclass
+class CursorPage(Generic[T]):
+    """Keyset-paginated page: navigation uses opaque cursor tokens instead of offsets.
+
+    ``total`` is optional so list functions can skip the COUNT(*) entirely.
+    """
+    items: list[T]
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+    total: int | None = None
+    page_size: int | None = None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    @property
+    def has_prev(self) -> bool:
+        return self.prev_cursor is not None
+
+
+def is_row_iterator(result: Any) -> bool:
+    """Whether a list function returned a lazy (sync or async) iterator of rows."""
+    return isinstance(result, (Iterator, AsyncIterator))
+
+
+def _close(it: Any) -> None:
+    close = getattr(it, "close", None)
+    if close is not None:
+        close()
+
+
+def _slice_sync(it: Iterator, start: int, stop: int) -> list:
+    try:
+        return list(islice(it, start, stop))
+    finally:
+        _close(it)
+
+
+async def _slice_async(it: AsyncIterator, start: int, stop: int) -> list:
+    items = []
+    index = 0
+    try:
+        async for item in it:
+            if index >= stop:
+                break
+            if index >= start:
+                items.append(item)
+            index += 1
+    finally:
+        aclose = getattr(it, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    return items
+
+
+async def slice_rows(it: Iterator | AsyncIterator, start: int, stop: int, limiter=None) -> list:
+    """Collect rows[start:stop] from an iterator, discarding skipped rows as it goes.
+
+    Sync iterators are advanced in a worker thread (reading a file or a server-side
+    cursor may block). The iterator is closed afterwards.
+    """
+    if isinstance(it, AsyncIterator):
+        return await _slice_async(it, start, stop)
+    return await anyio.to_thread.run_sync(_slice_sync, it, start, stop, limiter=limiter)
+
+
+async def paginate_iterator(it: Iterator | AsyncIterator, page: int, page_size: int, limiter=None) -> Page:
+    """Build a Page from an iterator while holding at most page_size + 1 rows.
+
+    One row of lookahead tells whether another page exists. When the iterator
+    runs out on this page the exact total is known; otherwise it stays None.
+    """
+    start = (max(page, 1) - 1) * page_size
+    rows = await slice_rows(it, start, start + page_size + 1, limiter)
+    if len(rows) > page_size:
+        return Page(items=rows[:page_size], total=None, page=page, page_size=page_size)
+    total = start + len(rows) if rows or page == 1 else None
+    return Page(items=rows, total=total, page=page, page_size=page_size)
+
+
+def _count_sync(it: Iterator) -> int:
+    try:
+        return sum(1 for _ in it)
+    finally:
+        _close(it)
+
+
+async def count_iterator(it: Iterator | AsyncIterator, limiter=None) -> int:
+    """Count an iterator's rows without keeping them."""
+    if isinstance(it, AsyncIterator):
+        n = 0
+        async for _ in it:
+            n += 1
+        return n
+    return await anyio.to_thread.run_sync(_count_sync, it, limiter=limiter)
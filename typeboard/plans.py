@@ -0,0 +1,107 @@
+import inspect
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import BaseModel
+
+from typeboard.execution import run_callable
+from typeboard.fields import compile_coercer
+from typeboard.introspection import (
+    DependsParam,
+    extract_depends_params,
+    find_cursor_param,
+    find_id_param,
+    find_model_param,
+    find_pagination_params,
+    find_param_type,
+    find_since_param,
+    find_sort_param,
+)
+
+
+@dataclass(frozen=True)
+class CallPlan:
+    """Precompiled calling convention for one resource operation.
+
+    Built once when the router is constructed so request handlers only do
+    dict/set lookups instead of re-running signature and annotation introspection.
+    """
+    op: str
+    fn: Callable
+    is_async: bool
+    accepted: frozenset[str]
+    depends: tuple[DependsParam, ...] = ()
+    depends_names: tuple[str, ...] = ()
+    page_param: str | None = None
+    page_size_param: str | None = None
+    cursor_param: str | None = None
+    sort_param: str | None = None
+    since_param: str | None = None
+    filter_params: frozenset[str] = frozenset()
+    id_param: str | None = None
+    id_coercer: Callable[[str], Any] | None = None
+    model_param: str | None = None
+    model_cls: type[BaseModel] | None = None
+
+    def bind(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Keep only the kwargs the callable accepts."""
+        accepted = self.accepted
+        return {k: v for k, v in kwargs.items() if k in accepted}
+
+    def coerce_id(self, raw: str) -> Any:
+        return self.id_coercer(raw) if self.id_coercer else raw
+
+    async def call(self, kwargs: dict[str, Any], limiter=None) -> Any:
+        """Call the operation with the accepted subset of kwargs."""
+        return await run_callable(self.fn, self.bind(kwargs), is_async=self.is_async, limiter=limiter)
+
+
+def accepted_params(fn: Callable) -> frozenset[str]:
+    """Names of the parameters fn can be called with by keyword."""
+    return frozenset(
+        name for name, p in inspect.signature(fn).parameters.items()
+        if p.kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+    )
+
+
+def _build_id_coercer(fn: Callable, id_param_name: str | None) -> Callable[[str], Any]:
+    """Build a converter from the raw path ID to the type of fn's ID parameter."""
+    return compile_coercer(find_param_type(fn, id_param_name or "id"))
+
+
+def build_call_plan(resource, op: str) -> CallPlan | None:
+    """Compile the CallPlan for a resource operation, or None if it isn't registered."""
+    fn = resource._fn_for_op(op)
+    if fn is None:
+        return None
+    accepted = accepted_params(fn)
+    depends = tuple(extract_depends_params(fn))
+    plan: dict[str, Any] = {
+        "op": op,
+        "fn": fn,
+        "is_async": resource.is_async(op),
+        "accepted": accepted,
+        "depends": depends,
+        "depends_names": tuple(dp.name for dp in depends),
+    }
+    if op == "list":
+        plan["page_param"], plan["page_size_param"] = find_pagination_params(fn)
+        plan["cursor_param"] = find_cursor_param(fn)
+        plan["sort_param"] = find_sort_param(fn)
+        plan["since_param"] = find_since_param(fn)
+    if op in ("list", "count", "version"):
+        plan["filter_params"] = frozenset(f.name for f in resource.filter_fields if f.name in accepted)
+    if op == "version" and (resource.id_param_name or "id") in accepted:
+        plan["id_param"] = resource.id_param_name or "id"
+        plan["id_coercer"] = _build_id_coercer(fn, resource.id_param_name)
+    if op in ("get", "update", "delete"):
+        plan["id_param"] = resource.id_param_name or "id"
+        plan["id_coercer"] = _build_id_coercer(fn, resource.id_param_name)
+    if op == "get_many":
+        ids_param = find_id_param(fn)
+        plan["id_param"] = ids_param
+        plan["id_coercer"] = _build_id_coercer(fn, ids_param)
+    if op in ("create", "update"):
+        plan["model_param"], plan["model_cls"] = find_model_param(fn)
+    return CallPlan(**plan)
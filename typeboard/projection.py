@@ -0,0 +1,70 @@
+from collections.abc import Callable, Iterable
+from operator import attrgetter, itemgetter
+from typing import Any
+
+from typeboard.fields import FieldInfo
+
+Row = tuple[Any, tuple[Any, ...]]
+
+
+class RowProjector:
+    """Turns list items into (id, cells) tuples holding only the visible column values.
+
+    Accessors are compiled once per item type with itemgetter (mappings) or
+    attrgetter (objects), so a page costs one C-level call per row instead of
+    a template-side lookup per cell. Missing keys/attributes render as "",
+    as item_value and item_id do.
+    """
+
+    def __init__(self, columns: Iterable[FieldInfo], id_field: str | None = None):
+        self.names = tuple(col.name for col in columns if col.column and not col.hidden)
+        self.id_field = id_field
+        self._getters: dict[type, Callable[[Any], tuple]] = {}
+
+    def project(self, items: Iterable[Any]) -> list[Row]:
+        rows = []
+        getters = self._getters
+        for item in items:
+            shape = type(item)
+            getter = getters.get(shape)
+            if getter is None:
+                getter = getters[shape] = self._compile(shape)
+            values = getter(item)
+            rows.append((values[0], values[1:]))
+        return rows
+
+    def _compile(self, shape: type) -> Callable[[Any], tuple]:
+        is_mapping = issubclass(shape, dict)
+        fast = self._fast_getter(is_mapping)
+        slow = self._slow_getter(is_mapping)
+
+        def getter(item):
+            try:
+                return fast(item)
+            except (KeyError, AttributeError):
+                if not is_mapping:
+                    # Attributes are fixed per class, so don't retry the fast path
+                    self._getters[shape] = slow
+                return slow(item)
+
+        return getter
+
+    def _fast_getter(self, is_mapping: bool) -> Callable[[Any], tuple]:
+        make = itemgetter if is_mapping else attrgetter
+        fetch = make(self.id_field or "id", *self.names)
+        if self.names:
+            # itemgetter/attrgetter with several names already return a tuple
+            return fetch
+        return lambda item: (fetch(item),)
+
+    def _slow_getter(self, is_mapping: bool) -> Callable[[Any], tuple]:
+        names, id_field = self.names, self.id_field
+        if is_mapping:
+            def get(item):
+                row_id = item.get(id_field, "") if id_field else item.get("id", item.get("pk", ""))
+                return (row_id, *(item.get(name, "") for name in names))
+        else:
+            def get(item):
+                row_id = getattr(item, id_field, "") if id_field else getattr(item, "id", getattr(item, "pk", ""))
+                return (row_id, *(getattr(item, name, "") for name in names))
+        return get
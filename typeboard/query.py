@@ -0,0 +1,150 @@
+import enum
+import operator
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+from typeboard.fields import FieldInfo, _unwrap_optional
+
+
+@dataclass(frozen=True)
+class Query:
+    """Filters and sort keys applied to a plain list result."""
+    filters: tuple[tuple[str, str], ...] = ()
+    # (column name, descending)
+    sort: tuple[tuple[str, bool], ...] = ()
+
+
+def parse_sort(raw: str | None) -> tuple[tuple[str, bool], ...]:
+    """"name,-created" -> (("name", False), ("created", True))."""
+    if not raw:
+        return ()
+    keys = []
+    for part in raw.split(","):
+        part = part.strip()
+        if part:
+            keys.append((part[1:], True) if part.startswith("-") else (part, False))
+    return tuple(keys)
+
+
+def _value_key(python_type: Any) -> Callable[[Any], Any]:
+    """Key making (non-None) values of python_type orderable among themselves."""
+    python_type = _unwrap_optional(python_type)
+    if isinstance(python_type, type) and issubclass(python_type, enum.Enum):
+        return lambda v: getattr(v, "value", v)
+    if isinstance(python_type, type) and issubclass(python_type, (int, float, str, date, Decimal)):
+        return lambda v: v
+    return str
+
+
+def _order_key(read: Callable[[Any], Any], value_key: Callable[[Any], Any], descending: bool) -> Callable[[Any], tuple]:
+    """Sort key for one column that places None last in either direction."""
+    def key(item):
+        v = read(item)
+        if v is None:
+            return (not descending, None)
+        return (descending, value_key(v))
+    return key
+
+
+def _matcher(field: FieldInfo, raw: str) -> Callable[[Any], bool]:
+    """Predicate for one filter value: search is a case-insensitive substring, anything else equality."""
+    if field.filter == "search":
+        needle = raw.casefold()
+        return lambda v: v is not None and needle in str(v).casefold()
+    try:
+        wanted = field.coerce(raw)
+    except (ValueError, TypeError):
+        return lambda v: False
+    return lambda v: v == wanted or (v is not None and str(v) == raw)
+
+
+def _same_rows(snapshot: tuple, items: list) -> bool:
+    """Whether items still holds exactly the snapshot's objects, in order."""
+    return len(snapshot) == len(items) and all(map(operator.is_, snapshot, items))
+
+
+def _reader(name: str, mapping: bool) -> Callable[[Any], Any]:
+    if mapping:
+        return lambda item: item.get(name)
+    return lambda item: getattr(item, name, None)
+
+
+class MemoryQueryEngine:
+    """Filters and sorts the plain list a list function returned, before pagination.
+
+    For list functions that return every row and ignore their filter and sort
+    arguments. Filters follow the resource's filter fields (search: case-
+    insensitive substring, select and others: equality); sort accepts several
+    comma-separated columns, "-" prefixed for descending.
+
+    With cache_size > 0 the arranged rows of recent queries are kept, keyed by
+    the query and either the resource's version (when it has a version hook)
+    or the identity of the returned list, so paging doesn't re-sort. Without a
+    version, an entry is only reused while the list still holds the same row
+    objects, so rows replaced in place are arranged again.
+    """
+
+    def __init__(self, filter_fields: Iterable[FieldInfo], columns: Iterable[FieldInfo], cache_size: int = 0):
+        self.filter_fields = {f.name: f for f in filter_fields}
+        self.sort_keys = {col.name: _value_key(col.python_type) for col in columns}
+        self.cache_size = cache_size
+        # key -> (source list, snapshot of its rows, arranged rows)
+        self._cache: OrderedDict[Any, tuple[Any, tuple, list]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def query(self, params: Mapping[str, str]) -> Query:
+        """The Query for request parameters; unknown filters and sort columns are dropped."""
+        filters = tuple(sorted(
+            (name, value) for name, value in params.items() if value and name in self.filter_fields
+        ))
+        sort = tuple(key for key in parse_sort(params.get("sort")) if key[0] in self.sort_keys)
+        return Query(filters, sort)
+
+    def apply(self, items: list, query: Query, version: Any = None) -> list:
+        if not items or not (query.filters or query.sort):
+            return items
+        if not self.cache_size:
+            return self._arrange(items, query)
+        # Without a version, the same list object holding the same rows must come back
+        key = (query, version) if version is not None else (query, id(items))
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and (version is not None or (entry[0] is items and _same_rows(entry[1], items))):
+                self._cache.move_to_end(key)
+                return entry[2]
+        arranged = self._arrange(items, query)
+        with self._lock:
+            # Keep the source list alive so its id can't be reused while cached
+            if version is not None:
+                self._cache[key] = (None, (), arranged)
+            else:
+                self._cache[key] = (items, tuple(items), arranged)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return arranged
+
+    def _arrange(self, items: list, query: Query) -> list:
+        mapping = isinstance(items[0], dict)
+        rows = items
+        for name, raw in query.filters:
+            read, match = _reader(name, mapping), _matcher(self.filter_fields[name], raw)
+            rows = [item for item in rows if match(read(item))]
+        if query.sort:
+            # Stable sorts applied from the last key to the first give a multi-key order
+            for name, descending in reversed(query.sort):
+                read = _reader(name, mapping)
+                try:
+                    rows = sorted(rows, key=_order_key(read, self.sort_keys[name], descending), reverse=descending)
+                except TypeError:  # values the annotation didn't promise; compare as text
+                    rows = sorted(rows, key=_order_key(read, str, descending), reverse=descending)
+        return rows
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
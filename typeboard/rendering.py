@@ -1,18 +1,70 @@
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
-from fastapi.responses import HTMLResponse
-from jinja2 import Environment, FileSystemLoader
+from fastapi.responses import HTMLResponse, StreamingResponse
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+from typeboard import timing
 
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 
+# Streamed output is flushed in chunks of roughly this many characters
+STREAM_CHUNK_SIZE = 16 * 1024
 
-def create_renderer(site):
-    env = Environment(
-        loader=FileSystemLoader(str(TEMPLATE_DIR)),
+
+def _chunked(pieces: Iterator[str], size: int = STREAM_CHUNK_SIZE) -> Iterator[str]:
+    """Coalesce Jinja's many small generate() pieces into ~size-character chunks."""
+    buf: list[str] = []
+    buffered = 0
+    for piece in pieces:
+        buf.append(piece)
+        buffered += len(piece)
+        if buffered >= size:
+            yield "".join(buf)
+            buf.clear()
+            buffered = 0
+    if buf:
+        yield "".join(buf)
+
+
+def _should_stream(site, template_name: str) -> bool:
+    streaming = getattr(site, "streaming", False)
+    if isinstance(streaming, bool):
+        return streaming
+    return template_name in streaming
+
+
+def create_environment(site) -> Environment:
+    """Build the Jinja environment for a site.
+
+    Site template directories come before the built-in ones so they can
+    override individual templates. In production mode templates are never
+    re-checked on disk after loading.
+    """
+    template_dirs = [*getattr(site, "template_dirs", ()), TEMPLATE_DIR]
+    cache_dir = getattr(site, "template_cache_dir", None)
+    if cache_dir is not None:
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+    return Environment(
+        loader=FileSystemLoader([str(d) for d in template_dirs]),
         autoescape=True,
+        auto_reload=getattr(site, "template_mode", "development") != "production",
+        bytecode_cache=FileSystemBytecodeCache(str(cache_dir)) if cache_dir is not None else None,
     )
 
+
+def precompile(env: Environment) -> int:
+    """Load (and so compile) every HTML template up front; returns how many."""
+    names = env.list_templates(extensions=["html"])
+    for name in names:
+        env.get_template(name)
+    return len(names)
+
+
+def create_renderer(site):
+    env = create_environment(site)
+
     def item_value(item, field_name):
         if isinstance(item, dict):
             return item.get(field_name, "")
@@ -27,18 +79,49 @@ def create_renderer(site):
             return item.get("id", item.get("pk", ""))
         return getattr(item, "id", getattr(item, "pk", ""))
 
+    def record_count(total, approximate=False):
+        """Format a record count: exact with separators, or "about 1.2M" for estimates."""
+        if not approximate:
+            return f"{total:,} records"
+        for threshold, suffix in ((1_000_000_000, "B"), (1_000_000, "M"), (1_000, "K")):
+            if total >= threshold:
+                return f"about {total / threshold:.1f}".rstrip("0").rstrip(".") + f"{suffix} records"
+        return f"about {total} records"
+
+    def site_asset_url(name: str, base_path: str = "") -> str:
+        from typeboard.assets import asset_url
+        return asset_url(name, getattr(site, "assets", "cdn"), base_path)
+
     env.globals["item_value"] = item_value
+    env.globals["asset_url"] = site_asset_url
     env.globals["item_id"] = item_id
+    env.filters["record_count"] = record_count
+
+    def render(template_name: str, *, request: Any, stream: bool | None = None, **context: Any) -> HTMLResponse | StreamingResponse:
+        """Render a template to a response.
 
-    def render(template_name: str, *, request: Any, **context: Any) -> HTMLResponse:
-        template = env.get_template(template_name)
-        base_path = request.scope.get("root_path", "")
-        html = template.render(
-            site=site,
-            base_path=base_path,
-            request=request,
-            **context,
-        )
-        return HTMLResponse(content=html)
+        When streaming (per ``site.streaming`` unless ``stream`` overrides it)
+        the body is produced incrementally with ``Template.generate()``, so
+        time-to-first-byte and peak memory don't grow with the page size.
+        """
+        with timing.phase("render"):
+            template = env.get_template(template_name)
+            base_path = request.scope.get("root_path", "")
+            if stream is None:
+                stream = _should_stream(site, template_name)
+            if stream:
+                pieces = template.generate(site=site, base_path=base_path, request=request, **context)
+                return StreamingResponse(_chunked(pieces), media_type="text/html")
+            html = template.render(
+                site=site,
+                base_path=base_path,
+                request=request,
+                **context,
+            )
+            return HTMLResponse(content=html)
 
+    if getattr(site, "template_mode", "development") == "production":
+        # Compile everything now so no request (or freshly forked worker) pays for it
+        precompile(env)
+    render.env = env
     return render
@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
-from typing import Callable
+from types import MappingProxyType
+from typing import Any, Callable
 
+from typeboard.execution import is_async_callable
 from typeboard.fields import FieldInfo
 from typeboard.introspection import (
     DependsParam,
@@ -9,10 +11,15 @@ from typeboard.introspection import (
     extract_fields_from_function,
     find_id_param,
 )
+from typeboard.plans import CallPlan, build_call_plan
+from typeboard.query import MemoryQueryEngine
+from typeboard.search import LabelIndex
 
 
 @dataclass
 class Resource:
+    OPERATIONS = ("list", "count", "version", "get", "get_many", "create", "update", "delete")
+
     id: str
     label: str = ""
     list_fn: Callable | None = None
@@ -20,10 +27,25 @@ class Resource:
     create_fn: Callable | None = None
     update_fn: Callable | None = None
     delete_fn: Callable | None = None
+    get_many_fn: Callable | None = None
+    count_fn: Callable | None = None
+    version_fn: Callable | None = None
+    # Without a count hook, count by walking the list function's iterator
+    lazy_count: bool = False
+    # Filter and sort plain list results in Python (see typeboard.query)
+    memory_query: bool = False
+    # Arranged results kept per query so paging doesn't re-sort; 0 disables
+    memory_query_cache: int = 0
+    # Answer relationship option lookups targeting this resource from a LabelIndex
+    options_index: bool = False
+    # Seconds before the index is rebuilt from the list function; None = only after writes
+    options_index_ttl: float | None = 300.0
 
     def __post_init__(self):
         if not self.label:
             self.label = self.id.replace("_", " ").title()
+        for op in self.OPERATIONS:
+            self._register(op, getattr(self, f"{op}_fn"))
 
     # Cached introspection results (populated lazily)
     _columns: list[FieldInfo] | None = field(default=None, repr=False)
@@ -34,6 +56,12 @@ class Resource:
     _depends_cache: dict[str, list[DependsParam]] = field(default_factory=dict, repr=False)
     _id_param_name: str | None = field(default=None, repr=False, init=False)
     _id_param_resolved: bool = field(default=False, repr=False, init=False)
+    # Operations whose registered callable is a coroutine function
+    _async_ops: set[str] = field(default_factory=set, repr=False, init=False)
+    # Compiled call plans per operation (None when the operation isn't registered)
+    _plans: dict[str, CallPlan | None] = field(default_factory=dict, repr=False, init=False)
+    _query_engine: MemoryQueryEngine | None = field(default=None, repr=False, init=False)
+    _label_index: LabelIndex | None = field(default=None, repr=False, init=False)
 
     @property
     def columns(self) -> list[FieldInfo]:
@@ -79,9 +107,81 @@ class Resource:
                 self._filter_fields = []
         return self._filter_fields
 
+    @property
+    def updated_at_field(self) -> FieldInfo | None:
+        """The column marked AdminField(updated_at=True), used by incremental export."""
+        return next((col for col in self.columns if col.updated_at), None)
+
+    @property
+    def version_field(self) -> FieldInfo | None:
+        """The column marked AdminField(version=True), used to derive ETags from fetched rows."""
+        return next((col for col in self.columns if col.version), None)
+
+    @property
+    def query_engine(self) -> MemoryQueryEngine | None:
+        """The in-memory filter/sort engine for plain list results, when memory_query is on."""
+        if not self.memory_query or self.list_fn is None:
+            return None
+        if self._query_engine is None:
+            self._query_engine = MemoryQueryEngine(self.filter_fields, self.columns, self.memory_query_cache)
+        return self._query_engine
+
+    @property
+    def label_index(self) -> LabelIndex | None:
+        """The search index over display labels, when options_index is on."""
+        if not self.options_index or self.list_fn is None:
+            return None
+        if self._label_index is None:
+            self._label_index = LabelIndex(ttl=self.options_index_ttl)
+        return self._label_index
+
+    @property
+    def has_count(self) -> bool:
+        """Whether the total is loaded by the separate /rows/count request."""
+        return self.count_fn is not None or (self.lazy_count and self.list_fn is not None)
+
     def _fn_for_op(self, op: str) -> Callable | None:
         return getattr(self, f"{op}_fn", None)
 
+    def _register(self, op: str, fn: Callable | None) -> None:
+        """Store the callable for an operation and record whether it must be awaited."""
+        setattr(self, f"{op}_fn", fn)
+        self._plans.pop(op, None)
+        if fn is not None and is_async_callable(fn):
+            self._async_ops.add(op)
+        else:
+            self._async_ops.discard(op)
+
+    def is_async(self, op: str) -> bool:
+        return op in self._async_ops
+
+    def call_plan(self, op: str) -> CallPlan | None:
+        """The compiled CallPlan for an operation, built on first use."""
+        if op not in self._plans:
+            self._plans[op] = build_call_plan(self, op)
+        return self._plans[op]
+
+    @property
+    def plans(self) -> MappingProxyType:
+        """Read-only view of the call plans for every registered operation."""
+        return MappingProxyType({
+            op: plan for op in self.OPERATIONS if (plan := self.call_plan(op)) is not None
+        })
+
+    def introspect(self) -> None:
+        """Run every lazily cached introspection step and compile all call plans now."""
+        self.plans
+        self.columns
+        self.detail_fields
+        self.create_fields
+        self.update_fields
+        self.filter_fields
+        self.id_param_name
+
+    async def call(self, op: str, kwargs: dict[str, Any], limiter=None) -> Any:
+        """Invoke an operation with the kwargs it accepts: awaited if async, else in a worker thread."""
+        return await self.call_plan(op).call(kwargs, limiter)
+
     def get_depends_params(self, op: str) -> list[DependsParam]:
         if op not in self._depends_cache:
             fn = self._fn_for_op(op)
@@ -119,34 +219,62 @@ class Resource:
     @property
     def list(self):
         def decorator(fn):
-            self.list_fn = fn
+            self._register("list", fn)
             return fn
         return decorator
 
     @property
     def get(self):
         def decorator(fn):
-            self.get_fn = fn
+            self._register("get", fn)
+            return fn
+        return decorator
+
+    @property
+    def get_many(self):
+        """Register a bulk lookup: takes a list of IDs, returns the matching items."""
+        def decorator(fn):
+            self._register("get_many", fn)
+            return fn
+        return decorator
+
+    @property
+    def count(self):
+        """Register a count hook: takes the list filters, returns the total number of records."""
+        def decorator(fn):
+            self._register("count", fn)
+            return fn
+        return decorator
+
+    @property
+    def version(self):
+        """Register a version hook: returns a value that changes whenever the resource's data does.
+
+        Called with the list filters (and the ID on detail pages) before any
+        data is fetched, so unchanged pages are answered with 304 Not Modified.
+        """
+        def decorator(fn):
+            self._register("version", fn)
             return fn
         return decorator
 
     @property
     def create(self):
         def decorator(fn):
-            self.create_fn = fn
+            self._register("create", fn)
             return fn
         return decorator
 
     @property
     def update(self):
         def decorator(fn):
-            self.update_fn = fn
+            self._register("update", fn)
             return fn
         return decorator
 
     @property
     def delete(self):
         def decorator(fn):
-            self.delete_fn = fn
+            self._register("delete", fn)
             return fn
         return decorator
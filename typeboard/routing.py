@@ -1,82 +1,47 @@
-import enum
+import asyncio
 import inspect
+import logging
 import mimetypes
-from datetime import date, datetime
+import threading
+from dataclasses import replace
 from pathlib import Path
-from typing import Any, get_args, get_origin
-
-from fastapi import APIRouter, Depends, FastAPI, Request
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, RedirectResponse
-
-from typeboard.fields import FieldInfo, unwrap_annotated
-from typeboard.introspection import (
-    DependsParam,
-    extract_depends_params,
-    find_pagination_params,
-    find_sort_param,
-)
+from typing import Any
+from urllib.parse import urlencode
+
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, RedirectResponse, Response, StreamingResponse
+from starlette.routing import BaseRoute, Match, NoMatchFound
+
+from typeboard import timing
+from typeboard.execution import run_callable
+from typeboard.fields import FieldInfo
+from typeboard.introspection import DependsParam, extract_depends_params
+from typeboard.plans import CallPlan, accepted_params
+from typeboard.projection import RowProjector
+from typeboard.query import Query
 from typeboard.rendering import create_renderer
 from typeboard.resource import Resource
 
-
-def _coerce(value: Any, python_type: type) -> Any:
-    """Coerce a form string value to the target Python type."""
-    import types as _types
-
-    origin = get_origin(python_type)
-    args = get_args(python_type)
-    if origin is _types.UnionType:
-        non_none = [a for a in args if a is not type(None)]
-        if non_none:
-            python_type = non_none[0]
-
-    if origin is list:
-        inner_type = args[0] if args else str
-        if isinstance(value, list):
-            return [_coerce(v, inner_type) for v in value]
-        if value is None or value == "":
-            return []
-        return [_coerce(value, inner_type)]
-
-    if value is None or value == "":
-        return None
-    if python_type is bool:
-        return str(value).lower() in ("true", "1", "on", "yes")
-    if python_type is int:
-        return int(value)
-    if python_type is float:
-        return float(value)
-    if isinstance(python_type, type) and issubclass(python_type, date) and not issubclass(python_type, datetime):
-        return date.fromisoformat(str(value))
-    if isinstance(python_type, type) and issubclass(python_type, datetime):
-        return datetime.fromisoformat(str(value))
-    if isinstance(python_type, type) and issubclass(python_type, enum.Enum):
-        return python_type(value)
-    return str(value)
-
-
-def _coerce_id(id_str: str, fn, id_param_name: str | None = None) -> Any:
-    """Coerce the ID string to match the function's ID parameter type."""
-    if fn is None:
-        return id_str
-    target_name = id_param_name or "id"
-    hints = inspect.get_annotations(fn, eval_str=True)
-    ann = hints.get(target_name, str)
-    base = unwrap_annotated(ann)
-    return _coerce(id_str, base)
+logger = logging.getLogger(__name__)
 
 
 def _inject_depends(handler, depends_params: list[DependsParam]):
     """Add DI params to a handler's __signature__ so FastAPI resolves them.
 
     Always strips **kwargs from the signature (FastAPI can't handle VAR_KEYWORD),
-    then appends explicit keyword-only parameters for each DI dependency.
+    as well as the underscore-prefixed parameters handlers use to bind build-time
+    state (FastAPI would otherwise expose them as query params and deep-copy their
+    defaults on every request), then appends explicit keyword-only parameters for
+    each DI dependency.
     """
     sig = inspect.signature(handler)
     existing_params = list(sig.parameters.values())
 
-    # Remove **kwargs from existing params (FastAPI doesn't support VAR_KEYWORD)
-    filtered = [p for p in existing_params if p.kind != inspect.Parameter.VAR_KEYWORD]
+    # Remove **kwargs and bound _private params from existing params
+    filtered = [
+        p for p in existing_params
+        if p.kind != inspect.Parameter.VAR_KEYWORD and not p.name.startswith("_")
+    ]
 
     for dp in depends_params:
         filtered.append(
@@ -92,13 +57,43 @@ def _inject_depends(handler, depends_params: list[DependsParam]):
     return handler
 
 
-def _resolve_choices(fields: list[FieldInfo], di_kwargs: dict[str, Any]) -> None:
-    """Call choices callables to populate enum_choices for multiselect fields."""
-    for f in fields:
-        if f.choices_callable:
-            sig = inspect.signature(f.choices_callable)
-            call_kwargs = {k: v for k, v in di_kwargs.items() if k in sig.parameters}
-            f.enum_choices = f.choices_callable(**call_kwargs)
+def _choices_specs(fields: list[FieldInfo]) -> list[tuple[FieldInfo, frozenset[str]]]:
+    """Pair each field that has a choices callable with the kwargs that callable accepts."""
+    return [(f, accepted_params(f.choices_callable)) for f in fields if f.choices_callable]
+
+
+async def _call_choices(f: FieldInfo, call_kwargs: dict[str, Any], limiter=None, cache=None) -> Any:
+    """Call one choices callable, going through the TTL memo when the field opts in."""
+    key = cache.key(f.choices_callable, call_kwargs) if cache is not None and f.choices_ttl else None
+    if key is not None:
+        hit, value = cache.get(key)
+        if hit:
+            return value
+    value = await run_callable(f.choices_callable, call_kwargs, limiter=limiter)
+    if key is not None:
+        cache.set(key, value, f.choices_ttl)
+    return value
+
+
+async def _resolve_choices(
+    specs: list[tuple[FieldInfo, frozenset[str]]],
+    di_kwargs: dict[str, Any],
+    limiter=None,
+    cache=None,
+) -> dict[str, Any]:
+    """Call every choices callable concurrently; returns {field name: choices} for this request.
+
+    Results are never written back to the FieldInfo objects, which are shared
+    across requests (and tenants).
+    """
+    if not specs:
+        return {}
+    with timing.phase("choices"):
+        results = await asyncio.gather(*(
+            _call_choices(f, {k: v for k, v in di_kwargs.items() if k in accepted}, limiter, cache)
+            for f, accepted in specs
+        ))
+    return {f.name: choices for (f, _), choices in zip(specs, results)}
 
 
 def _collect_choices_deps(fields: list[FieldInfo]) -> list[DependsParam]:
@@ -114,6 +109,88 @@ def _collect_choices_deps(fields: list[FieldInfo]) -> list[DependsParam]:
     return result
 
 
+def _result_items(result) -> list:
+    """Items from a list function result: Page, CursorPage or a plain list."""
+    from typeboard.pagination import CursorPage, Page
+
+    if isinstance(result, (Page, CursorPage)):
+        return result.items
+    return result if isinstance(result, list) else []
+
+
+async def _first_items(result, limit: int, limiter=None) -> list:
+    """Up to limit items from a list function result, reading iterators lazily."""
+    from typeboard.pagination import is_row_iterator, slice_rows
+
+    if is_row_iterator(result):
+        return await slice_rows(result, 0, limit, limiter)
+    return _result_items(result)[:limit]
+
+
+async def _count_rows(result, limiter=None) -> int | None:
+    """Total rows of a list function result, walking iterators without keeping them."""
+    from typeboard.pagination import CursorPage, Page, count_iterator, is_row_iterator
+
+    if is_row_iterator(result):
+        return await count_iterator(result, limiter)
+    if isinstance(result, (Page, CursorPage)):
+        return result.total
+    return len(result) if isinstance(result, list) else 0
+
+
+def _merge_deps(*groups: list[DependsParam]) -> list[DependsParam]:
+    """Concatenate dependency lists, keeping the first occurrence of each name."""
+    seen: set[str] = set()
+    result: list[DependsParam] = []
+    for group in groups:
+        for dp in group:
+            if dp.name not in seen:
+                seen.add(dp.name)
+                result.append(dp)
+    return result
+
+
+async def _call_version(plan: CallPlan, request: Request, di_kwargs: dict[str, Any], limiter, id: str | None = None) -> Any:
+    """Call a version hook with its DI params, the active filters and (on detail pages) the ID."""
+    fn_kwargs = {name: di_kwargs[name] for name in plan.depends_names if name in di_kwargs}
+    for name, val in request.query_params.items():
+        if val and name in plan.filter_params:
+            fn_kwargs[name] = val
+    if id is not None and plan.id_param:
+        fn_kwargs[plan.id_param] = plan.coerce_id(id)
+    return await plan.call(fn_kwargs, limiter)
+
+
+def _page_state(page_info) -> tuple:
+    """The parts of a page result besides its rows that show up in the footer."""
+    return tuple(getattr(page_info, attr, None) for attr in ("total", "approximate", "next_cursor", "prev_cursor"))
+
+
+def _page_query(request: Request) -> str:
+    """Current query string minus page/cursor, so pagination links keep filters and sort."""
+    params = [(k, v) for k, v in request.query_params.multi_items() if k not in ("page", "cursor")]
+    return urlencode(params)
+
+
+def _read_form_values(form_data, fields: list[FieldInfo]) -> dict[str, Any]:
+    """Coerce submitted form values for the editable fields."""
+    values = {}
+    for field in fields:
+        if field.hidden or field.read_only:
+            continue
+        if field.widget == "multiselect":
+            raw = form_data.getlist(field.name)
+            values[field.name] = field.coerce(raw) if raw else []
+            continue
+        raw = form_data.get(field.name)
+        if raw is None or raw == "":
+            if not field.required:
+                values[field.name] = field.default
+            continue
+        values[field.name] = field.coerce(raw)
+    return values
+
+
 # ---------------------------------------------------------------------------
 # Relationship helpers
 # ---------------------------------------------------------------------------
@@ -137,48 +214,53 @@ def _find_search_param(target_resource: Resource, field: FieldInfo) -> str | Non
 
 
 def _setup_relationships(fields: list[FieldInfo], site) -> None:
-    """For relationship fields, auto-generate choices callables from the target resource."""
+    """For relationship fields, auto-generate choices callables from the target resource.
+
+    FieldInfo is frozen and shared through the introspection memo, so fields
+    are replaced in the (per-resource) list rather than modified.
+    """
     if site is None:
         return
-    for f in fields:
+    for i, f in enumerate(fields):
         if not f.relationship or f.choices_callable:
             continue
         target = site.resources.get(f.relationship)
         if not target or not target.list_fn:
             continue
         display = target.display_name_field
-        f.choices_callable = _build_relationship_choices(target, display)
+        fields[i] = replace(f, choices_callable=_build_relationship_choices(target, display, site))
 
 
-def _build_relationship_choices(target_resource: Resource, display_field: str):
-    """Create a choices callable that fetches items from the target resource."""
-    from typeboard.pagination import Page
+def _build_relationship_choices(target_resource: Resource, display_field: str, site=None):
+    """Create a choices callable that fetches items from the target resource.
 
-    list_fn = target_resource.list_fn
+    The fetched labels also warm the site's label cache.
+    """
+    list_plan = target_resource.call_plan("list")
     id_field = target_resource.id_param_name or "id"
+    limiter = site.thread_limiter if site else None
 
-    def choices_fn(**kwargs):
-        sig = inspect.signature(list_fn)
-        call_kwargs = {k: v for k, v in kwargs.items() if k in sig.parameters}
+    async def choices_fn(**kwargs):
+        call_kwargs = dict(kwargs)
         # Use a reasonable page size to get items for the initial load
-        page_param, ps_param = find_pagination_params(list_fn)
-        if ps_param:
-            call_kwargs[ps_param] = 200
-        if page_param:
-            call_kwargs[page_param] = 1
-        result = list_fn(**call_kwargs)
-        items = result.items if isinstance(result, Page) else (result if isinstance(result, list) else [])
+        if list_plan.page_size_param:
+            call_kwargs[list_plan.page_size_param] = 200
+        if list_plan.page_param:
+            call_kwargs[list_plan.page_param] = 1
+        result = await list_plan.call(call_kwargs, limiter)
+        items = await _first_items(result, 200, limiter)
         out = []
         for item in items:
             item_id = item.get(id_field) if isinstance(item, dict) else getattr(item, id_field, None)
             item_label = item.get(display_field) if isinstance(item, dict) else getattr(item, display_field, None)
             out.append((str(item_id), str(item_label)))
+        if site:
+            site.label_cache.set_many(target_resource.id, dict(out))
         return out
 
     # Copy DI signature from target's list_fn so _collect_choices_deps works
-    di_params = extract_depends_params(list_fn)
     params = []
-    for dp in di_params:
+    for dp in list_plan.depends:
         params.append(
             inspect.Parameter(
                 dp.name,
@@ -193,8 +275,109 @@ def _build_relationship_choices(target_resource: Resource, display_field: str):
     return choices_fn
 
 
+# Upper bound on per-ID get_fn calls used to resolve related labels when the
+# target resource has no get_many hook.
+MAX_TARGETED_LOOKUPS = 50
+
+# Targets with only a list function are walked in pages of this size until
+# every wanted ID is found, reading at most MAX_RELATED_SCAN_ROWS rows.
+RELATED_SCAN_PAGE_SIZE = 500
+MAX_RELATED_SCAN_ROWS = 10_000
+
+# Options returned per /options/{field} response
+OPTIONS_PAGE_SIZE = 50
+
+
+def _related_lookup_plan(target: Resource) -> CallPlan | None:
+    """The plan used to resolve related IDs: get_many > get > list."""
+    return target.call_plan("get_many") or target.call_plan("get") or target.call_plan("list")
+
+
+async def _get_one(plan: CallPlan, raw_id, di_kwargs: dict[str, Any], limiter=None) -> Any:
+    """get_fn result for one related ID, or None if the lookup fails."""
+    call_kwargs = dict(di_kwargs)
+    try:
+        call_kwargs[plan.id_param] = plan.coerce_id(raw_id)
+        return await plan.call(call_kwargs, limiter)
+    except Exception:
+        return None
+
+
+async def _scan_for_ids(target: Resource, plan: CallPlan, ids: list, di_kwargs: dict[str, Any], limiter=None) -> list:
+    """Walk the target's list function until every ID is found (or the scan cap is hit)."""
+    from contextlib import aclosing
+
+    from typeboard.export import iter_batches
+
+    id_field = target.id_param_name or "id"
+    wanted = {str(i) for i in ids}
+    items = []
+    scanned = 0
+    async with aclosing(iter_batches(plan, di_kwargs, page_size=RELATED_SCAN_PAGE_SIZE, limiter=limiter)) as batches:
+        async for batch in batches:
+            for item in batch:
+                item_id = item.get(id_field) if isinstance(item, dict) else getattr(item, id_field, None)
+                if str(item_id) in wanted:
+                    wanted.discard(str(item_id))
+                    items.append(item)
+            scanned += len(batch)
+            if not wanted or scanned >= MAX_RELATED_SCAN_ROWS:
+                break
+    return items
+
+
+async def _fetch_related_items(target: Resource, ids: list, di_kwargs: dict[str, Any], limiter=None) -> list:
+    """Fetch the target resource's items for the given IDs.
+
+    Uses the bulk get_many hook when registered; otherwise makes at most
+    MAX_TARGETED_LOOKUPS concurrent get_fn calls, or walks the list function
+    until every ID is found. Lookups that fail are skipped so callers can show
+    the raw ID instead.
+    """
+    if not ids:
+        return []
+    many_plan = target.call_plan("get_many")
+    if many_plan:
+        call_kwargs = dict(di_kwargs)
+        call_kwargs[many_plan.id_param] = many_plan.coerce_id(list(ids))
+        return list(await many_plan.call(call_kwargs, limiter) or [])
+
+    get_plan = target.call_plan("get")
+    if get_plan:
+        found = await asyncio.gather(*(
+            _get_one(get_plan, raw_id, di_kwargs, limiter) for raw_id in ids[:MAX_TARGETED_LOOKUPS]
+        ))
+        return [item for item in found if item]
+
+    list_plan = target.call_plan("list")
+    if list_plan is None:
+        return []
+    return await _scan_for_ids(target, list_plan, ids, di_kwargs, limiter)
+
+
+def _label_map(items: list, id_field: str, display_field: str) -> dict[str, str]:
+    """Map str(item id) -> display label."""
+    labels = {}
+    for t in items:
+        t_id = t.get(id_field) if isinstance(t, dict) else getattr(t, id_field, None)
+        t_label = t.get(display_field) if isinstance(t, dict) else getattr(t, display_field, None)
+        labels[str(t_id)] = str(t_label)
+    return labels
+
+
+async def _resolve_labels(target: Resource, ids: list, di_kwargs: dict[str, Any], site) -> dict[str, str]:
+    """Map str(id) -> label for the given IDs, consulting the site's label cache first."""
+    labels, missing = site.label_cache.get_many(target.id, ids)
+    if missing:
+        items = await _fetch_related_items(target, missing, di_kwargs, site.thread_limiter)
+        fetched = _label_map(items, target.id_param_name or "id", target.display_name_field)
+        site.label_cache.set_many(target.id, fetched)
+        labels.update(fetched)
+    return labels
+
+
 def _collect_relationship_deps(fields: list[FieldInfo], site) -> list[DependsParam]:
-    """Extract DI params needed by relationship target list_fns."""
+    """Extract DI params needed to resolve relationship IDs on target resources."""
     if site is None:
         return []
     seen: set[str] = set()
@@ -203,30 +386,50 @@ def _collect_relationship_deps(fields: list[FieldInfo], site) -> list[DependsPar
         if not f.relationship:
             continue
         target = site.resources.get(f.relationship)
-        if not target or not target.list_fn:
+        lookup_plan = _related_lookup_plan(target) if target else None
+        if not lookup_plan:
             continue
-        for dp in extract_depends_params(target.list_fn):
+        for dp in lookup_plan.depends:
             if dp.name not in seen:
                 seen.add(dp.name)
                 result.append(dp)
     return result
 
 
-def _resolve_detail_relationships(item, fields: list[FieldInfo], site, di_kwargs: dict) -> tuple[Any, dict[str, str]]:
+async def _resolve_labels_within(target: Resource, ids: list, di_kwargs: dict[str, Any], site) -> dict[str, str]:
+    """_resolve_labels bounded by site.relationship_timeout.
+
+    A late or failing lookup yields no labels, so the page shows raw IDs.
+    """
+    try:
+        if site.relationship_timeout is None:
+            return await _resolve_labels(target, ids, di_kwargs, site)
+        return await asyncio.wait_for(_resolve_labels(target, ids, di_kwargs, site), site.relationship_timeout)
+    except asyncio.TimeoutError:
+        return {}
+    except Exception:
+        logger.exception("Related lookup on %s failed; showing raw IDs", target.id)
+        return {}
+
+
+async def _resolve_detail_relationships(item, fields: list[FieldInfo], site, di_kwargs: dict) -> tuple[Any, dict[str, str]]:
     """Replace relationship ID fields with (id, label) tuples for the detail view.
 
+    Lookups run concurrently, one per target resource. IDs whose lookup misses
+    site.relationship_timeout keep their raw value as the label.
+
     Returns the modified item and a dict mapping field names to target resource names
     (for building links in the template).
     """
-    from typeboard.pagination import Page
-
-    modifications = {}
     relationship_targets: dict[str, str] = {}
+    field_ids: dict[str, Any] = {}
+    # target resource id -> IDs referenced by any field pointing at it
+    wanted: dict[str, list] = {}
     for f in fields:
         if not f.relationship:
             continue
         target = site.resources.get(f.relationship)
-        if not target or not target.list_fn:
+        if not target or not _related_lookup_plan(target):
             continue
 
         # Get current IDs from item
@@ -234,33 +437,26 @@ def _resolve_detail_relationships(item, fields: list[FieldInfo], site, di_kwargs
         if ids is None:
             continue
 
-        display = target.display_name_field
         relationship_targets[f.name] = f.relationship
-
-        # Fetch items from target resource
-        sig = inspect.signature(target.list_fn)
-        call_kwargs = {k: v for k, v in di_kwargs.items() if k in sig.parameters}
-        page_param, ps_param = find_pagination_params(target.list_fn)
-        if ps_param:
-            call_kwargs[ps_param] = 10000
-        if page_param:
-            call_kwargs[page_param] = 1
-        result = target.list_fn(**call_kwargs)
-        items = result.items if isinstance(result, Page) else (result if isinstance(result, list) else [])
-
-        # Build ID → (id, label) map
-        id_field = target.id_param_name or "id"
-        id_map = {}
-        for t in items:
-            t_id = t.get(id_field) if isinstance(t, dict) else getattr(t, id_field, None)
-            t_label = t.get(display) if isinstance(t, dict) else getattr(t, display, None)
-            id_map[t_id] = (t_id, str(t_label))
-
-        # Replace IDs with (id, label) tuples
+        field_ids[f.name] = ids
+        wanted.setdefault(f.relationship, []).extend(ids if isinstance(ids, list) else [ids])
+
+    # Resolve only the referenced IDs (cache first, then the target resource)
+    with timing.phase("relationships"):
+        results = await asyncio.gather(*(
+            _resolve_labels_within(site.resources[target_id], list(dict.fromkeys(ids)), di_kwargs, site)
+            for target_id, ids in wanted.items()
+        ))
+    labels_by_target = dict(zip(wanted, results))
+
+    # Replace IDs with (id, label) tuples
+    modifications = {}
+    for name, ids in field_ids.items():
+        labels = labels_by_target[relationship_targets[name]]
         if isinstance(ids, list):
-            modifications[f.name] = [id_map.get(i, (i, str(i))) for i in ids]
+            modifications[name] = [(i, labels.get(str(i), str(i))) for i in ids]
         else:
-            modifications[f.name] = id_map.get(ids, (ids, str(ids)))
+            modifications[name] = (ids, labels.get(str(ids), str(ids)))
 
     if not modifications:
         return item, relationship_targets
@@ -279,10 +475,22 @@ def _resolve_detail_relationships(item, fields: list[FieldInfo], site, di_kwargs
     return new_item, relationship_targets
 
 
+async def _load_labels(plan: CallPlan, di_kwargs: dict[str, Any], id_field: str, display: str, limiter=None) -> list[tuple[str, str]]:
+    """Every (id, label) pair of a list function, walking its pages, for a LabelIndex."""
+    from typeboard.export import iter_batches
+
+    pairs = []
+    async for batch in iter_batches(plan, di_kwargs, page_size=500, limiter=limiter):
+        for item in batch:
+            if isinstance(item, dict):
+                pairs.append((str(item.get(id_field, "")), str(item.get(display, ""))))
+            else:
+                pairs.append((str(getattr(item, id_field, "")), str(getattr(item, display, ""))))
+    return pairs
+
+
 def _register_options_endpoints(router: APIRouter, resource: Resource, site, render) -> None:
     """Register GET /options/{field_name} for each relationship field."""
-    from typeboard.pagination import Page
-
     # Collect all relationship fields across update, create, and detail
     seen_fields: set[str] = set()
     all_fields: list[FieldInfo] = []
@@ -297,72 +505,93 @@ def _register_options_endpoints(router: APIRouter, resource: Resource, site, ren
         if not target or not target.list_fn:
             continue
 
-        target_list_fn = target.list_fn
+        list_plan = target.call_plan("list")
+        lookup_plan = target.call_plan("get_many") or target.call_plan("get")
         display = target.display_name_field
         search_param = _find_search_param(target, rel_field)
-        target_deps = extract_depends_params(target_list_fn)
+        target_deps = list(list_plan.depends)
+        if lookup_plan:
+            seen_dep_names = {dp.name for dp in target_deps}
+            target_deps.extend(dp for dp in lookup_plan.depends if dp.name not in seen_dep_names)
 
         target_id_field = target.id_param_name or "id"
 
         async def options_handler(
             request: Request,
             _target=target,
-            _list_fn=target_list_fn,
+            _list_plan=list_plan,
+            _lookup_plan=lookup_plan,
             _display=display,
             _search_param=search_param,
             _target_deps=target_deps,
             _id_field=target_id_field,
+            _index=target.label_index,
+            _site=site,
             **kwargs,
         ):
+            timing.label(_target.id, "options")
             q = request.query_params.get("q", "").strip()
             selected_raw = request.query_params.get("selected", "")
             selected_ids = [s.strip() for s in selected_raw.split(",") if s.strip()]
 
-            sig = inspect.signature(_list_fn)
             di_kwargs = {dp.name: kwargs[dp.name] for dp in _target_deps if dp.name in kwargs}
 
-            # Build call kwargs with search filter
-            call_kwargs = dict(di_kwargs)
-            page_param, ps_param = find_pagination_params(_list_fn)
-            if ps_param:
-                call_kwargs[ps_param] = 50
-            if page_param:
-                call_kwargs[page_param] = 1
-            if q and _search_param and _search_param in sig.parameters:
-                call_kwargs[_search_param] = q
-
-            # Only pass kwargs the function accepts
-            valid_kwargs = {k: v for k, v in call_kwargs.items() if k in sig.parameters}
-            result = _list_fn(**valid_kwargs)
-            items = result.items if isinstance(result, Page) else (result if isinstance(result, list) else [])
-
-            # Build JSON response
-            results = []
-            seen_ids: set[str] = set()
-            for item in items:
-                item_id = str(item.get(_id_field) if isinstance(item, dict) else getattr(item, _id_field, ""))
-                item_label = str(item.get(_display) if isinstance(item, dict) else getattr(item, _display, ""))
-                results.append({"value": item_id, "text": item_label})
-                seen_ids.add(item_id)
+            headers = {}
+            if _index is not None:
+                # Indexed targets: search in memory, paged with ?page=
+                try:
+                    page = max(int(request.query_params.get("page", "1")), 1)
+                except ValueError:
+                    page = 1
+                with timing.phase("call"):
+                    await _index.ensure(lambda: _load_labels(_list_plan, di_kwargs, _id_field, _display, _site.thread_limiter))
+                matches, more = _index.search(q, (page - 1) * OPTIONS_PAGE_SIZE, OPTIONS_PAGE_SIZE)
+                results = [{"value": item_id, "text": item_label} for item_id, item_label in matches]
+                if more:
+                    headers["X-Next-Page"] = str(page + 1)
+                # The index knows every label, so selected IDs rarely need a lookup
+                seen_ids = {r["value"] for r in results}
+                for sid in selected_ids:
+                    if sid not in seen_ids and (known := _index.label(sid)) is not None:
+                        results.insert(0, {"value": sid, "text": known})
+                        seen_ids.add(sid)
+            else:
+                # Build call kwargs with search filter
+                call_kwargs = dict(di_kwargs)
+                if _list_plan.page_size_param:
+                    call_kwargs[_list_plan.page_size_param] = OPTIONS_PAGE_SIZE
+                if _list_plan.page_param:
+                    call_kwargs[_list_plan.page_param] = 1
+                if q and _search_param:
+                    call_kwargs[_search_param] = q
+
+                # The plan only passes kwargs the function accepts
+                with timing.phase("call"):
+                    result = await _list_plan.call(call_kwargs, _site.thread_limiter)
+                    items = await _first_items(result, OPTIONS_PAGE_SIZE, _site.thread_limiter)
+
+                # Build JSON response
+                results = []
+                seen_ids: set[str] = set()
+                for item in items:
+                    item_id = str(item.get(_id_field) if isinstance(item, dict) else getattr(item, _id_field, ""))
+                    item_label = str(item.get(_display) if isinstance(item, dict) else getattr(item, _display, ""))
+                    results.append({"value": item_id, "text": item_label})
+                    seen_ids.add(item_id)
+            _site.label_cache.set_many(_target.id, {r["value"]: r["text"] for r in results})
+            timing.record_rows(len(results))
 
             # Fetch any selected items not in search results
             missing_ids = [sid for sid in selected_ids if sid not in seen_ids]
-            if missing_ids and _target.get_fn:
-                for mid in missing_ids:
-                    try:
-                        get_kwargs = dict(di_kwargs)
-                        id_p = _target.id_param_name or "id"
-                        get_kwargs[id_p] = _coerce_id(mid, _target.get_fn, id_p)
-                        get_sig = inspect.signature(_target.get_fn)
-                        valid_get = {k: v for k, v in get_kwargs.items() if k in get_sig.parameters}
-                        sel_item = _target.get_fn(**valid_get)
-                        if sel_item:
-                            item_label = str(sel_item.get(_display) if isinstance(sel_item, dict) else getattr(sel_item, _display, ""))
-                            results.insert(0, {"value": mid, "text": item_label})
-                    except Exception:
-                        results.insert(0, {"value": mid, "text": mid})
-
-            return JSONResponse(content=results)
+            if missing_ids and _lookup_plan:
+                try:
+                    with timing.phase("relationships"):
+                        labels = await _resolve_labels(_target, missing_ids, di_kwargs, _site)
+                except Exception:
+                    labels = {}
+                results[:0] = [{"value": mid, "text": labels.get(mid, mid)} for mid in missing_ids]
+
+            return JSONResponse(content=results, headers=headers)
 
         _inject_depends(options_handler, target_deps)
         router.add_api_route(
@@ -376,7 +605,11 @@ def _register_options_endpoints(router: APIRouter, resource: Resource, site, ren
 def build_resource_router(resource: Resource, render, site=None) -> APIRouter:
     router = APIRouter(prefix=f"/{resource.id}", tags=[resource.id])
 
-    id_param = resource.id_param_name
+    limiter = site.thread_limiter if site else None
+    label_cache = site.label_cache if site else None
+
+    # Compile call plans for every registered operation up front
+    plans = resource.plans
 
     # Setup relationship auto-choices on all field lists
     if site:
@@ -387,82 +620,205 @@ def build_resource_router(resource: Resource, render, site=None) -> APIRouter:
         # Register /options/{field_name} endpoint for each relationship field
         _register_options_endpoints(router, resource, site, render)
 
+    version_plan = plans.get("version")
+
     if resource.list_fn:
-        list_deps = resource.get_depends_params("list")
-        page_param, page_size_param = find_pagination_params(resource.list_fn)
-        sort_param = find_sort_param(resource.list_fn)
+        list_plan = plans["list"]
+        list_deps = list(list_plan.depends)
 
         async def list_page(request: Request, _res=resource):
+            timing.label(_res.id, "list")
             return render("list.html", resource=_res, request=request)
 
-        _native_pagination = page_param is not None
-
-        async def rows(request: Request, _res=resource, _deps=list_deps,
-                       _page_p=page_param, _ps_p=page_size_param, _sort_p=sort_param,
-                       _native_pag=_native_pagination, **kwargs):
-            from typeboard.pagination import Page
+        _native_pagination = list_plan.page_param is not None or list_plan.cursor_param is not None
+        # Column accessors are compiled once; each page is projected to (id, cells) tuples
+        projector = RowProjector(resource.columns, resource.id_param_name)
+
+        async def rows(request: Request, _res=resource, _plan=list_plan, _version_plan=version_plan,
+                       _version_field=resource.version_field, _native_pag=_native_pagination, _projector=projector,
+                       _engine=resource.query_engine, _limiter=limiter, **kwargs):
+            from typeboard.etag import compute_etag, etag_matches, items_version, not_modified, query_key, with_etag
+            from typeboard.pagination import CursorPage, Page, is_row_iterator, paginate_iterator
+
+            timing.label(_res.id, "rows")
+            # With a version hook, unchanged pages are answered before list_fn runs
+            etag = version = None
+            if _version_plan is not None:
+                with timing.phase("call"):
+                    version = await _call_version(_version_plan, request, kwargs, _limiter)
+                etag = compute_etag(_res.id, "rows", query_key(request), version)
+                if etag_matches(request, etag):
+                    return not_modified(etag)
 
             default_page_size = 25 if _native_pag else 1000
             page = int(request.query_params.get("page", "1"))
             page_size = int(request.query_params.get("page_size", str(default_page_size)))
+            cursor = request.query_params.get("cursor")
             sort = request.query_params.get("sort")
 
             fn_kwargs: dict[str, Any] = {}
 
             # DI params
-            for dp in _deps:
-                if dp.name in kwargs:
-                    fn_kwargs[dp.name] = kwargs[dp.name]
+            for name in _plan.depends_names:
+                if name in kwargs:
+                    fn_kwargs[name] = kwargs[name]
 
             # Pagination (only if function supports it natively)
-            if _page_p:
-                fn_kwargs[_page_p] = page
-            if _ps_p:
-                fn_kwargs[_ps_p] = page_size
+            if _plan.page_param:
+                fn_kwargs[_plan.page_param] = page
+            if _plan.page_size_param:
+                fn_kwargs[_plan.page_size_param] = page_size
+            if cursor and _plan.cursor_param:
+                fn_kwargs[_plan.cursor_param] = cursor
 
             # Sort
-            if sort and _sort_p:
-                fn_kwargs[_sort_p] = sort
-
-            # Filters
-            for ff in _res.filter_fields:
-                val = request.query_params.get(ff.name)
-                if val:
-                    fn_kwargs[ff.name] = val
-
-            # Only pass kwargs the function actually accepts
-            sig = inspect.signature(_res.list_fn)
-            valid_kwargs = {k: v for k, v in fn_kwargs.items() if k in sig.parameters}
-            result = _res.list_fn(**valid_kwargs)
-
-            items = []
-            page_info = None
-            if isinstance(result, Page):
-                items = result.items
-                page_info = result
-            elif isinstance(result, list):
-                # Server-side pagination for functions that don't paginate
-                total = len(result)
-                start = (page - 1) * page_size
-                items = result[start:start + page_size]
-                page_info = Page(items=items, total=total, page=page, page_size=page_size)
-
-            return render(
+            if sort and _plan.sort_param:
+                fn_kwargs[_plan.sort_param] = sort
+
+            # Filters (only those the function accepts)
+            for name, val in request.query_params.items():
+                if val and name in _plan.filter_params:
+                    fn_kwargs[name] = val
+
+            with timing.phase("call"):
+                result = await _plan.call(fn_kwargs, _limiter)
+
+                items = []
+                page_info = None
+                if isinstance(result, (Page, CursorPage)):
+                    items = result.items
+                    page_info = result
+                elif isinstance(result, list):
+                    if _engine is not None:
+                        result = _engine.apply(result, _engine.query(request.query_params), version)
+                    # Server-side pagination for functions that don't paginate
+                    total = len(result)
+                    start = (page - 1) * page_size
+                    items = result[start:start + page_size]
+                    page_info = Page(items=items, total=total, page=page, page_size=page_size)
+                elif is_row_iterator(result):
+                    # Lazy rows: skip to the page and keep only page_size (+1 lookahead) rows
+                    page_info = await paginate_iterator(result, page, page_size, _limiter)
+                    items = page_info.items
+            timing.record_rows(len(items))
+
+            # With a version column, unchanged pages skip rendering
+            if etag is None and _version_field is not None:
+                rows_version = items_version(items, _res.id_param_name or "id", _version_field.name)
+                etag = compute_etag(_res.id, "rows", query_key(request), rows_version, _page_state(page_info))
+                if etag_matches(request, etag):
+                    return not_modified(etag)
+
+            response = render(
                 "_table_rows.html",
                 resource=_res,
                 request=request,
                 items=items,
+                rows=_projector.project(items),
                 page_info=page_info,
+                page_query=_page_query(request),
                 columns=_res.columns,
             )
+            return with_etag(response, etag) if etag else response
+
+        async def export(request: Request, _res=resource, _plan=list_plan, _site=site, _engine=resource.query_engine,
+                         _limiter=limiter, **kwargs):
+            from typeboard.export import EXPORT_FORMATS, iter_batches, serialize, since_filter
+
+            timing.label(_res.id, "export")
+            fmt = request.query_params.get("format", "csv")
+            if fmt not in EXPORT_FORMATS:
+                raise HTTPException(400, f"Unsupported export format: {fmt}")
+
+            fn_kwargs: dict[str, Any] = {name: kwargs[name] for name in _plan.depends_names if name in kwargs}
+            sort = request.query_params.get("sort")
+            if sort and _plan.sort_param:
+                fn_kwargs[_plan.sort_param] = sort
+            for name, val in request.query_params.items():
+                if val and name in _plan.filter_params:
+                    fn_kwargs[name] = val
+
+            # Incremental mode: only rows updated at or after since=
+            keep = None
+            since_raw = request.query_params.get("since")
+            if since_raw:
+                updated_at = _res.updated_at_field
+                if updated_at is None and _plan.since_param is None:
+                    raise HTTPException(400, f"{_res.label} has no updated-at field for since=")
+                if _plan.since_param:
+                    fn_kwargs[_plan.since_param] = since_raw
+                if updated_at is not None:
+                    try:
+                        since = updated_at.coerce(since_raw)
+                    except ValueError:
+                        raise HTTPException(400, f"Invalid since value: {since_raw}")
+                    keep = since_filter(updated_at, since)
+
+            arrange = None
+            if _engine is not None:
+                query = _engine.query(request.query_params)
+                arrange = lambda items: _engine.apply(items, query)
+
+            page_size_raw = request.query_params.get("page_size", str(_site.export_page_size if _site else 500))
+            try:
+                page_size = int(page_size_raw)
+            except ValueError:
+                raise HTTPException(400, f"Invalid page_size value: {page_size_raw}")
+            if page_size < 1:
+                raise HTTPException(400, f"Invalid page_size value: {page_size_raw}")
+            batches = iter_batches(
+                _plan, fn_kwargs,
+                page_size=page_size,
+                limiter=_limiter,
+                prefetch=_site.export_prefetch if _site else False,
+                arrange=arrange,
+            )
+            columns = [col for col in _res.columns if not col.hidden]
+            return StreamingResponse(
+                serialize(batches, columns, fmt, keep),
+                media_type=EXPORT_FORMATS[fmt],
+                headers={"Content-Disposition": f'attachment; filename="{_res.id}.{fmt}"'},
+            )
 
-        _inject_depends(rows, list_deps)
+        _inject_depends(list_page, [])
+        _inject_depends(rows, _merge_deps(list_deps, list(version_plan.depends) if version_plan else []))
+        _inject_depends(export, list_deps)
 
         router.add_api_route("/", list_page, methods=["GET"], response_class=HTMLResponse)
         router.add_api_route("/rows", rows, methods=["GET"], response_class=HTMLResponse)
+        router.add_api_route("/export", export, methods=["GET"])
+
+    if resource.has_count:
+        # Lazy counting reuses the list plan and walks the rows it returns
+        count_plan = plans["count"] if resource.count_fn else plans["list"]
+
+        async def rows_count(request: Request, _res=resource, _plan=count_plan, _limiter=limiter,
+                             _engine=resource.query_engine if count_plan.op == "list" else None, **kwargs):
+            timing.label(_res.id, "count")
+            fn_kwargs = {name: kwargs[name] for name in _plan.depends_names if name in kwargs}
+            for name, val in request.query_params.items():
+                if val and name in _plan.filter_params:
+                    fn_kwargs[name] = val
+            with timing.phase("call"):
+                result = await _plan.call(fn_kwargs, _limiter)
+                if _engine is not None and isinstance(result, list):
+                    # Only the filters change the total; skip sorting
+                    result = _engine.apply(result, Query(_engine.query(request.query_params).filters))
+                total = await _count_rows(result, _limiter) if _plan.op == "list" else result
+            if total is None:
+                # Nothing to count (a Page without total, or a count hook returning None):
+                # htmx doesn't swap on 204, so the footer keeps what it shows
+                return Response(status_code=204)
+            return render("_record_count.html", request=request, total=total)
+
+        _inject_depends(rows_count, list(count_plan.depends))
+        # Loaded by a separate htmx request so rows never wait on the count
+        router.add_api_route("/rows/count", rows_count, methods=["GET"], response_class=HTMLResponse)
 
     if resource.create_fn:
-        create_deps = resource.get_depends_params("create")
+        create_plan = plans["create"]
+        create_deps = list(create_plan.depends)
+        create_choices = _choices_specs(resource.create_fields)
         create_form_choices_deps = _collect_choices_deps(resource.create_fields)
         # Merge create deps + choices deps (deduped)
         create_form_deps = list(create_deps)
@@ -472,54 +828,41 @@ def build_resource_router(resource: Resource, render, site=None) -> APIRouter:
                 create_form_deps.append(dp)
                 seen_dep_names.add(dp.name)
 
-        async def create_form(request: Request, _res=resource, _deps=create_form_deps, **kwargs):
+        async def create_form(request: Request, _res=resource, _deps=create_form_deps, _choices=create_choices, _limiter=limiter,
+                              _choices_cache=site.choices_cache if site else None, **kwargs):
+            timing.label(_res.id, "create_form")
             fields = _res.create_fields
             di_kwargs = {dp.name: kwargs[dp.name] for dp in _deps if dp.name in kwargs}
-            _resolve_choices(fields, di_kwargs)
-            return render("form.html", resource=_res, request=request, mode="create", fields=fields, values={}, errors=[])
+            choices = await _resolve_choices(_choices, di_kwargs, _limiter, _choices_cache)
+            return render("form.html", resource=_res, request=request, mode="create", fields=fields, values={}, errors=[], choices=choices)
 
-        async def create_submit(request: Request, _res=resource, _deps=create_deps, **kwargs):
-            from pydantic import BaseModel
+        async def create_submit(request: Request, _res=resource, _plan=create_plan, _limiter=limiter, _cache=label_cache,
+                                _index=resource.label_index, _engine=resource.query_engine, **kwargs):
+            timing.label(_res.id, "create")
             fields = _res.create_fields
             form_data = await request.form()
-            values = {}
-            for field in fields:
-                if field.hidden or field.read_only:
-                    continue
-                if field.widget == "multiselect":
-                    raw = form_data.getlist(field.name)
-                    values[field.name] = _coerce(raw, field.python_type) if raw else []
-                    continue
-                raw = form_data.get(field.name)
-                if raw is None or raw == "":
-                    if not field.required:
-                        values[field.name] = field.default
-                    continue
-                values[field.name] = _coerce(raw, field.python_type)
-
-            fn_kwargs = {dp.name: kwargs[dp.name] for dp in _deps if dp.name in kwargs}
-
-            sig = inspect.signature(_res.create_fn)
-            params = list(sig.parameters.values())
-            model_param = None
-            for p in params:
-                hints = inspect.get_annotations(_res.create_fn, eval_str=True)
-                ann = hints.get(p.name)
-                if ann and isinstance(ann, type) and issubclass(ann, BaseModel):
-                    model_param = (p.name, ann)
-                    break
-
-            if model_param:
-                name, model_cls = model_param
-                model_instance = model_cls(**values)
-                fn_kwargs[name] = model_instance
+            values = _read_form_values(form_data, fields)
+
+            fn_kwargs = {name: kwargs[name] for name in _plan.depends_names if name in kwargs}
+            if _plan.model_param:
+                fn_kwargs[_plan.model_param] = _plan.model_cls(**values)
             else:
                 fn_kwargs.update(values)
 
-            result = _res.create_fn(**fn_kwargs)
+            with timing.phase("call"):
+                result = await _plan.call(fn_kwargs, _limiter)
 
-            if _res.get_fn and result is not None:
+            item_id_val = None
+            if result is not None:
                 item_id_val = getattr(result, "id", None) or (result.get("id") if isinstance(result, dict) else None)
+            if _cache is not None and item_id_val is not None:
+                _cache.invalidate(_res.id, item_id_val)
+            if _index is not None:
+                _index.invalidate()
+            if _engine is not None:
+                _engine.clear()
+
+            if _res.get_fn and result is not None:
                 if item_id_val is not None:
                     return RedirectResponse(
                         url=f"{request.scope.get('root_path', '')}/{_res.id}/{item_id_val}",
@@ -536,7 +879,8 @@ def build_resource_router(resource: Resource, render, site=None) -> APIRouter:
         router.add_api_route("/new", create_submit, methods=["POST"])
 
     if resource.get_fn:
-        get_deps = resource.get_depends_params("get")
+        get_plan = plans["get"]
+        get_deps = list(get_plan.depends)
         # Merge in DI deps needed for relationship resolution on the detail page
         detail_rel_deps = _collect_relationship_deps(resource.detail_fields, site) if site else []
         detail_deps = list(get_deps)
@@ -546,27 +890,50 @@ def build_resource_router(resource: Resource, render, site=None) -> APIRouter:
                 detail_deps.append(dp)
                 seen_dep_names.add(dp.name)
 
-        async def detail_page(request: Request, id: str, _res=resource, _deps=get_deps, _all_deps=detail_deps, _id_p=id_param, _site=site, **kwargs):
-            coerced_id = _coerce_id(id, _res.get_fn, _id_p)
-            fn_kwargs = {dp.name: kwargs[dp.name] for dp in _deps if dp.name in kwargs}
-            fn_kwargs[_id_p or "id"] = coerced_id
-            item = _res.get_fn(**fn_kwargs)
+        detail_version_field = next((f for f in resource.detail_fields if f.version), None)
+
+        async def detail_page(request: Request, id: str, _res=resource, _plan=get_plan, _version_plan=version_plan,
+                              _version_field=detail_version_field, _all_deps=detail_deps, _site=site, _limiter=limiter, **kwargs):
+            from typeboard.etag import compute_etag, etag_matches, not_modified, with_etag
+
+            timing.label(_res.id, "get")
+            etag = None
+            if _version_plan is not None:
+                with timing.phase("call"):
+                    version = await _call_version(_version_plan, request, kwargs, _limiter, id=id)
+                etag = compute_etag(_res.id, "detail", id, version)
+                if etag_matches(request, etag):
+                    return not_modified(etag)
+            fn_kwargs = {name: kwargs[name] for name in _plan.depends_names if name in kwargs}
+            fn_kwargs[_plan.id_param] = _plan.coerce_id(id)
+            with timing.phase("call"):
+                item = await _plan.call(fn_kwargs, _limiter)
+            timing.record_rows(0 if item is None else 1)
+            if etag is None and _version_field is not None and item is not None:
+                version = item.get(_version_field.name) if isinstance(item, dict) else getattr(item, _version_field.name, None)
+                etag = compute_etag(_res.id, "detail", id, version)
+                if etag_matches(request, etag):
+                    return not_modified(etag)
             display_field = _res.display_name_field
             display_name = (item.get(display_field) if isinstance(item, dict) else getattr(item, display_field, None)) if item else None
             # Resolve relationship IDs to display names
             relationship_targets = {}
             if _site:
                 all_di = {dp.name: kwargs[dp.name] for dp in _all_deps if dp.name in kwargs}
-                item, relationship_targets = _resolve_detail_relationships(item, _res.detail_fields, _site, all_di)
-            return render("detail.html", resource=_res, request=request, id=id, item=item, columns=_res.detail_fields, display_name=display_name, relationship_targets=relationship_targets)
+                item, relationship_targets = await _resolve_detail_relationships(item, _res.detail_fields, _site, all_di)
+            response = render("detail.html", resource=_res, request=request, id=id, item=item, columns=_res.detail_fields, display_name=display_name, relationship_targets=relationship_targets)
+            return with_etag(response, etag) if etag else response
 
-        _inject_depends(detail_page, detail_deps)
+        _inject_depends(detail_page, _merge_deps(detail_deps, list(version_plan.depends) if version_plan else []))
         router.add_api_route("/{id}", detail_page, methods=["GET"], response_class=HTMLResponse)
 
     if resource.update_fn:
-        update_deps = resource.get_depends_params("update")
+        update_plan = plans["update"]
+        update_deps = list(update_plan.depends)
         # edit_form needs get_fn deps + choices deps
-        edit_get_deps = resource.get_depends_params("get") if resource.get_fn else []
+        edit_get_plan = plans.get("get")
+        edit_get_deps = list(edit_get_plan.depends) if edit_get_plan else []
+        edit_choices = _choices_specs(resource.update_fields)
         edit_choices_deps = _collect_choices_deps(resource.update_fields)
         # Merge get deps + choices deps (deduped)
         edit_form_deps = list(edit_get_deps)
@@ -576,16 +943,26 @@ def build_resource_router(resource: Resource, render, site=None) -> APIRouter:
                 edit_form_deps.append(dp)
                 seen_edit_dep_names.add(dp.name)
 
-        async def edit_form(request: Request, id: str, _res=resource, _deps=edit_form_deps, _get_deps=edit_get_deps, _id_p=id_param, **kwargs):
-            fn_kwargs = {dp.name: kwargs[dp.name] for dp in _get_deps if dp.name in kwargs}
-            coerced_id = _coerce_id(id, _res.get_fn, _id_p) if _res.get_fn else int(id)
-            fn_kwargs[_id_p or "id"] = coerced_id
-            item = _res.get_fn(**fn_kwargs) if _res.get_fn else None
+        async def edit_form(request: Request, id: str, _res=resource, _deps=edit_form_deps, _get_plan=edit_get_plan, _choices=edit_choices, _limiter=limiter,
+                            _choices_cache=site.choices_cache if site else None, **kwargs):
+            timing.label(_res.id, "edit_form")
+
+            async def fetch_item():
+                if not _get_plan:
+                    return None
+                fn_kwargs = {name: kwargs[name] for name in _get_plan.depends_names if name in kwargs}
+                fn_kwargs[_get_plan.id_param] = _get_plan.coerce_id(id)
+                with timing.phase("call"):
+                    return await _get_plan.call(fn_kwargs, _limiter)
+
+            di_kwargs = {dp.name: kwargs[dp.name] for dp in _deps if dp.name in kwargs}
+            # The item and every dropdown's choices are fetched concurrently
+            item, choices = await asyncio.gather(
+                fetch_item(), _resolve_choices(_choices, di_kwargs, _limiter, _choices_cache),
+            )
             display_field = _res.display_name_field
             display_name = (item.get(display_field) if isinstance(item, dict) else getattr(item, display_field, None)) if item else None
             fields = _res.update_fields
-            di_kwargs = {dp.name: kwargs[dp.name] for dp in _deps if dp.name in kwargs}
-            _resolve_choices(fields, di_kwargs)
             values = {}
             if item:
                 for f in fields:
@@ -593,51 +970,32 @@ def build_resource_router(resource: Resource, render, site=None) -> APIRouter:
                         values[f.name] = item.get(f.name, f.default)
                     else:
                         values[f.name] = getattr(item, f.name, f.default)
-            return render("form.html", resource=_res, request=request, mode="edit", id=id, fields=fields, values=values, errors=[], display_name=display_name)
+            return render("form.html", resource=_res, request=request, mode="edit", id=id, fields=fields, values=values, errors=[], display_name=display_name, choices=choices)
 
         _inject_depends(edit_form, edit_form_deps)
 
-        async def edit_submit(request: Request, id: str, _res=resource, _deps=update_deps, _id_p=id_param, **kwargs):
-            from pydantic import BaseModel
+        async def edit_submit(request: Request, id: str, _res=resource, _plan=update_plan, _limiter=limiter, _cache=label_cache,
+                              _index=resource.label_index, _engine=resource.query_engine, **kwargs):
+            timing.label(_res.id, "update")
             fields = _res.update_fields
             form_data = await request.form()
-            values = {}
-            for field in fields:
-                if field.hidden or field.read_only:
-                    continue
-                if field.widget == "multiselect":
-                    raw = form_data.getlist(field.name)
-                    values[field.name] = _coerce(raw, field.python_type) if raw else []
-                    continue
-                raw = form_data.get(field.name)
-                if raw is None or raw == "":
-                    if not field.required:
-                        values[field.name] = field.default
-                    continue
-                values[field.name] = _coerce(raw, field.python_type)
-
-            coerced_id = _coerce_id(id, _res.update_fn, _id_p)
-            fn_kwargs = {dp.name: kwargs[dp.name] for dp in _deps if dp.name in kwargs}
-            fn_kwargs[_id_p or "id"] = coerced_id
-
-            sig = inspect.signature(_res.update_fn)
-            params = list(sig.parameters.values())
-            model_param = None
-            for p in params:
-                hints = inspect.get_annotations(_res.update_fn, eval_str=True)
-                ann = hints.get(p.name)
-                if ann and isinstance(ann, type) and issubclass(ann, BaseModel):
-                    model_param = (p.name, ann)
-                    break
-
-            if model_param:
-                name, model_cls = model_param
-                model_instance = model_cls(**values)
-                fn_kwargs[name] = model_instance
+            values = _read_form_values(form_data, fields)
+
+            fn_kwargs = {name: kwargs[name] for name in _plan.depends_names if name in kwargs}
+            fn_kwargs[_plan.id_param] = _plan.coerce_id(id)
+            if _plan.model_param:
+                fn_kwargs[_plan.model_param] = _plan.model_cls(**values)
             else:
                 fn_kwargs.update(values)
 
-            _res.update_fn(**fn_kwargs)
+            with timing.phase("call"):
+                await _plan.call(fn_kwargs, _limiter)
+            if _cache is not None:
+                _cache.invalidate(_res.id, id)
+            if _index is not None:
+                _index.invalidate()
+            if _engine is not None:
+                _engine.clear()
 
             return RedirectResponse(
                 url=f"{request.scope.get('root_path', '')}/{_res.id}/{id}",
@@ -649,13 +1007,22 @@ def build_resource_router(resource: Resource, render, site=None) -> APIRouter:
         router.add_api_route("/{id}/edit", edit_submit, methods=["POST"])
 
     if resource.delete_fn:
-        delete_deps = resource.get_depends_params("delete")
-
-        async def delete_item(request: Request, id: str, _res=resource, _deps=delete_deps, _id_p=id_param, **kwargs):
-            coerced_id = _coerce_id(id, _res.delete_fn, _id_p)
-            fn_kwargs = {dp.name: kwargs[dp.name] for dp in _deps if dp.name in kwargs}
-            fn_kwargs[_id_p or "id"] = coerced_id
-            _res.delete_fn(**fn_kwargs)
+        delete_plan = plans["delete"]
+        delete_deps = list(delete_plan.depends)
+
+        async def delete_item(request: Request, id: str, _res=resource, _plan=delete_plan, _limiter=limiter, _cache=label_cache,
+                              _index=resource.label_index, _engine=resource.query_engine, **kwargs):
+            timing.label(_res.id, "delete")
+            fn_kwargs = {name: kwargs[name] for name in _plan.depends_names if name in kwargs}
+            fn_kwargs[_plan.id_param] = _plan.coerce_id(id)
+            with timing.phase("call"):
+                await _plan.call(fn_kwargs, _limiter)
+            if _cache is not None:
+                _cache.invalidate(_res.id, id)
+            if _index is not None:
+                _index.invalidate()
+            if _engine is not None:
+                _engine.clear()
             return HTMLResponse(content="", headers={"HX-Redirect": f"{request.scope.get('root_path', '')}/{_res.id}/"})
 
         _inject_depends(delete_item, delete_deps)
@@ -664,9 +1031,86 @@ def build_resource_router(resource: Resource, render, site=None) -> APIRouter:
     return router
 
 
+def _route_path(scope) -> str:
+    """The request path relative to the app's root_path, as Starlette's router matches it."""
+    path = scope["path"]
+    root_path = scope.get("root_path", "")
+    if root_path and path.startswith(root_path):
+        return path[len(root_path):]
+    return path
+
+
+class LazyResourceRoute(BaseRoute):
+    """Stands in for a resource's routes until the first request under its prefix.
+
+    Matches /<resource id> and everything below it. The first match builds the
+    resource's router (introspection, call plans, relationship setup) exactly
+    once, even with concurrent requests on several threads; later requests are
+    dispatched straight to it.
+    """
+
+    def __init__(self, resource: Resource, build):
+        self.resource = resource
+        self.prefix = f"/{resource.id}"
+        self._build = build
+        self._app = None
+        self._lock = threading.Lock()
+
+    @property
+    def built(self) -> bool:
+        return self._app is not None
+
+    def build(self):
+        """Build the resource's router if that hasn't happened yet; returns it."""
+        if self._app is None:
+            with self._lock:
+                if self._app is None:
+                    self._app = self._build(self.resource)
+        return self._app
+
+    def matches(self, scope) -> tuple[Match, dict]:
+        if scope["type"] == "http":
+            path = _route_path(scope)
+            if path == self.prefix or path.startswith(self.prefix + "/"):
+                return Match.FULL, {}
+        return Match.NONE, {}
+
+    def url_path_for(self, name: str, /, **path_params: Any):
+        raise NoMatchFound(name, path_params)
+
+    async def handle(self, scope, receive, send) -> None:
+        await self.build()(scope, receive, send)
+
+
+def _register_static_assets(app: FastAPI) -> None:
+    """Serve the vendored front-end assets under /_static/<digest>/ with immutable caching."""
+    from typeboard.assets import IMMUTABLE, assets_digest, resolve_static
+
+    digest = assets_digest()
+    if digest is None:
+        raise RuntimeError(
+            "assets=\"local\" but the vendored assets are missing; run `python -m typeboard.assets`"
+        )
+
+    async def serve_static(request: Request, asset_digest: str, path: str):
+        found = resolve_static(path, request.headers.get("accept-encoding", "")) if asset_digest == digest else None
+        if found is None:
+            return Response(status_code=404)
+        file_path, media_type, encoding = found
+        headers = {"Cache-Control": IMMUTABLE, "Vary": "Accept-Encoding"}
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        return FileResponse(file_path, media_type=media_type, headers=headers)
+
+    app.add_api_route("/_static/{asset_digest}/{path:path}", serve_static, methods=["GET"], include_in_schema=False)
+
+
 def build_app(site) -> FastAPI:
     admin_app = FastAPI(title=site.title, docs_url=None, redoc_url=None)
 
+    if site.manifest is not None and Path(site.manifest).is_file():
+        site.load_manifest(site.manifest)
+
     if isinstance(site.logo_url, Path):
         logo_path = site.logo_url.resolve()
         media_type = (
@@ -680,6 +1124,9 @@ def build_app(site) -> FastAPI:
         admin_app.add_api_route("/_static/logo{ext}", serve_logo, methods=["GET"])
         site.logo_url = f"/_static/logo{logo_path.suffix}"
 
+    if site.assets == "local":
+        _register_static_assets(admin_app)
+
     render = create_renderer(site)
 
     dependencies = []
@@ -689,13 +1136,56 @@ def build_app(site) -> FastAPI:
     main_router = APIRouter(dependencies=dependencies)
 
     async def index(request: Request):
+        timing.label(None, "index")
         return render("index.html", request=request)
 
     main_router.add_api_route("/", index, methods=["GET"], response_class=HTMLResponse)
 
-    for resource in site.resources.values():
-        resource_router = build_resource_router(resource, render, site=site)
-        main_router.include_router(resource_router)
+    if site.lazy_routes:
+        def build_lazily(resource: Resource) -> APIRouter:
+            # Own router so the site-wide auth dependency still applies
+            router = APIRouter(dependencies=dependencies)
+            router.include_router(build_resource_router(resource, render, site=site))
+            return router
+
+        site._lazy_routes = {resource.id: LazyResourceRoute(resource, build_lazily) for resource in site.resources.values()}
+    else:
+        for resource in site.resources.values():
+            resource_router = build_resource_router(resource, render, site=site)
+            main_router.include_router(resource_router)
 
     admin_app.include_router(main_router)
+    if site.lazy_routes:
+        admin_app.router.routes.extend(site._lazy_routes.values())
+
+    if site.metrics is not None:
+        from typeboard.metrics import CONTENT_TYPE
+
+        async def metrics_endpoint():
+            return Response(site.metrics.exposition(site), media_type=CONTENT_TYPE)
+
+        admin_app.add_api_route(
+            "/_metrics", metrics_endpoint, methods=["GET"], include_in_schema=False,
+            dependencies=dependencies if site.metrics_auth else None,
+        )
+
+    timing_hooks = []
+    if site.on_request_timing:
+        timing_hooks.append(site.on_request_timing)
+    if site.metrics is not None:
+        timing_hooks.append(site.metrics.observe)
+    if site.server_timing or timing_hooks:
+        from typeboard.timing import TimingMiddleware
+
+        admin_app.add_middleware(TimingMiddleware, header=site.server_timing, hooks=timing_hooks)
+
+    if site.compression:
+        from typeboard.compression import CompressionMiddleware
+
+        admin_app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=site.compression_min_size,
+            level=site.compression_level,
+        )
+
     return admin_app
@@ -0,0 +1,143 @@
+import asyncio
+import re
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from itertools import islice
+
+_WORD = re.compile(r"\w+")
+
+
+def _tokens(text: str) -> list[str]:
+    return _WORD.findall(text.casefold())
+
+
+def _having(positions: Iterable[int], texts: list[str], needle: str) -> Iterator[int]:
+    # " jo" in " john smith" tests for a word prefix in one C-level call
+    return (i for i in positions if needle in texts[i])
+
+
+class LabelIndex:
+    """In-memory prefix index over one resource's (id, display label) pairs.
+
+    Serves relationship option lookups without calling the list function per
+    keystroke. Every word of a query must prefix some word of a label
+    ("jo sm" finds "John Smith"); matches come back in label order and can be
+    paged with offset/limit.
+
+    The index is rebuilt on the first lookup after invalidate() (typeboard's
+    create/update/delete handlers call it) or once it is older than ttl
+    seconds; ttl=None rebuilds only on invalidation.
+    """
+
+    def __init__(self, ttl: float | None = 300.0, memo_size: int = 128):
+        self.ttl = ttl
+        self.memo_size = memo_size
+        self.built_at: float | None = None
+        # (id, label) sorted by label; positions below index into this list
+        self._entries: list[tuple[str, str]] = []
+        # Each entry's words as " word word", for checking further query words
+        self._entry_texts: list[str] = []
+        self._labels: dict[str, str] = {}
+        # Distinct words, sorted, with the entry positions containing each
+        self._words: list[str] = []
+        self._postings: list[tuple[int, ...]] = []
+        # Query word -> sorted positions of entries with a word it prefixes
+        self._memo: OrderedDict[str, tuple[int, ...]] = OrderedDict()
+        self._generation = 0
+        self._built_generation = -1
+        self._loading: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def fresh(self) -> bool:
+        if self._built_generation != self._generation:
+            return False
+        return self.ttl is None or time.monotonic() - self.built_at < self.ttl
+
+    def invalidate(self) -> None:
+        """Mark the index stale; the next lookup rebuilds it."""
+        self._generation += 1
+
+    def build(self, pairs: Iterable[tuple[str, str]], generation: int | None = None) -> None:
+        entries = sorted(pairs, key=lambda pair: pair[1].casefold())
+        entry_words = [_tokens(label) for _, label in entries]
+        postings: dict[str, list[int]] = {}
+        for position, own in enumerate(entry_words):
+            for word in set(own):
+                postings.setdefault(word, []).append(position)
+        words = sorted(postings)
+        # Swap everything in at once so lookups never see a half-built index
+        self._entries = entries
+        self._entry_texts = [" " + " ".join(own) for own in entry_words]
+        self._labels = dict(entries)
+        self._words = words
+        self._postings = [tuple(postings[word]) for word in words]
+        self._memo = OrderedDict()
+        self.built_at = time.monotonic()
+        self._built_generation = self._generation if generation is None else generation
+
+    async def ensure(self, load: Callable[[], Awaitable[Iterable[tuple[str, str]]]]) -> None:
+        """Rebuild from load() unless fresh; concurrent callers share one load."""
+        if self.fresh:
+            return
+        task = self._loading
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = self._loading = asyncio.ensure_future(self._reload(load))
+        # A cancelled keystroke request must not cancel the load others wait on
+        await asyncio.shield(task)
+
+    async def _reload(self, load: Callable[[], Awaitable[Iterable[tuple[str, str]]]]) -> None:
+        generation = self._generation
+        pairs = await load()
+        # A write during the load leaves the index stale, so it's loaded again
+        self.build(pairs, generation)
+
+    def label(self, id: str) -> str | None:
+        return self._labels.get(id)
+
+    def search(self, q: str, offset: int = 0, limit: int = 50) -> tuple[list[tuple[str, str]], bool]:
+        """Up to limit (id, label) matches after offset, and whether more follow."""
+        entries = self._entries
+        words = _tokens(q)
+        if not words:
+            return entries[offset:offset + limit], offset + limit < len(entries)
+        # Walk the rarest word's entries (already in label order) and check the
+        # other words against each entry's text, stopping once the page is full
+        rarest, *rest = sorted(set(words), key=lambda word: len(self._prefixed(word)))
+        candidates = self._prefixed(rarest)
+        if not rest:
+            return [entries[i] for i in candidates[offset:offset + limit]], offset + limit < len(candidates)
+        texts = self._entry_texts
+        found = iter(candidates)
+        for word in rest:
+            found = _having(found, texts, f" {word}")
+        wanted = offset + limit + 1
+        matches = list(islice(found, wanted))
+        return [entries[i] for i in matches[offset:offset + limit]], len(matches) == wanted
+
+    def _prefixed(self, word: str) -> tuple[int, ...]:
+        memo = self._memo
+        positions = memo.get(word)
+        if positions is not None:
+            memo.move_to_end(word)
+            return positions
+        words, postings = self._words, self._postings
+        i = bisect_left(words, word)
+        end = i
+        while end < len(words) and words[end].startswith(word):
+            end += 1
+        if end - i == 1:
+            positions = postings[i]
+        else:
+            found: set[int] = set()
+            for j in range(i, end):
+                found.update(postings[j])
+            positions = tuple(sorted(found))
+        memo[word] = positions
+        while len(memo) > self.memo_size:
+            memo.popitem(last=False)
+        return positions
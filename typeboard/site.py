@@ -1,10 +1,17 @@
 from pathlib import Path
-from collections.abc import Callable
+from collections.abc import Callable, Collection, Mapping
 
+from typeboard.assets import ASSET_MODES
+from typeboard.cache import ChoicesCache, LabelCache
+from typeboard.execution import create_thread_limiter
+from typeboard.metrics import Metrics
 from typeboard.resource import Resource
 from typeboard.theme import LIGHT, Theme
 
 
+TEMPLATE_MODES = ("development", "production")
+
+
 class AdminSite:
     def __init__(
         self,
@@ -13,12 +20,84 @@ class AdminSite:
         logo_height: str = "28px",
         auth_dependency: Callable | None = None,
         theme: Theme | None = None,
+        thread_pool_size: int = 40,
+        label_cache_size: int = 0,
+        label_cache_ttl: float | None = 60.0,
+        streaming: bool | Collection[str] = False,
+        export_page_size: int = 500,
+        export_prefetch: bool = False,
+        relationship_timeout: float | None = None,
+        template_mode: str = "development",
+        template_cache_dir: str | Path | None = None,
+        assets: str = "cdn",
+        compression: bool = False,
+        compression_level: int | Mapping[str, int] = 6,
+        compression_min_size: int = 1024,
+        server_timing: bool = False,
+        on_request_timing: Callable | None = None,
+        metrics: bool = False,
+        metrics_auth: bool = True,
+        lazy_routes: bool = False,
+        manifest: str | Path | None = None,
     ):
         self.title = title
         self.logo_url = logo_url
         self.logo_height = logo_height
         self.auth_dependency = auth_dependency
         self.theme = theme or LIGHT
+        # Bounds how many sync resource callables run in worker threads at once
+        self.thread_pool_size = thread_pool_size
+        self.thread_limiter = create_thread_limiter(thread_pool_size)
+        # (resource_id, id) -> display label; disabled when label_cache_size is 0
+        self.label_cache = LabelCache(max_size=label_cache_size, ttl=label_cache_ttl)
+        # Results of choices callables with AdminField(choices_ttl=...)
+        self.choices_cache = ChoicesCache()
+        # True streams every template; a collection of names streams only those
+        self.streaming = streaming
+        # /export walks the list function export_page_size rows at a time,
+        # optionally fetching the next page while the current one is written
+        self.export_page_size = export_page_size
+        self.export_prefetch = export_prefetch
+        # Seconds each detail-page relationship lookup may take before its IDs show unresolved
+        self.relationship_timeout = relationship_timeout
+        # "production" disables template auto-reload and compiles every template
+        # when the app is built; template_cache_dir adds an on-disk bytecode cache
+        if template_mode not in TEMPLATE_MODES:
+            raise ValueError(f"template_mode must be one of {TEMPLATE_MODES}, got {template_mode!r}")
+        self.template_mode = template_mode
+        self.template_cache_dir = template_cache_dir
+        # "cdn" loads Bootstrap/Font Awesome/Tom Select/htmx from public CDNs,
+        # "local" serves the vendored copies from /_static (see typeboard.assets)
+        if assets not in ASSET_MODES:
+            raise ValueError(f"assets must be one of {ASSET_MODES}, got {assets!r}")
+        self.assets = assets
+        # Opt-in zstd/brotli/gzip (whichever the client accepts and is installed) for
+        # text responses of at least compression_min_size bytes; streamed bodies stay
+        # streamed. compression_level is on gzip's 1-9 scale (mapped per codec) or a
+        # {"zstd": 3, "br": 5, "gzip": 6} mapping
+        self.compression = compression
+        self.compression_level = compression_level
+        self.compression_min_size = compression_min_size
+        # Per-phase request timings (call, choices, relationships, render): as a
+        # Server-Timing header and/or passed to on_request_timing(RequestTiming)
+        # after each response. Neither costs anything while both are off
+        self.server_timing = server_timing
+        self.on_request_timing = on_request_timing
+        # Request counts, errors, latency and rows-returned histograms per resource
+        # and operation, plus cache and thread-pool gauges, served from /_metrics
+        self.metrics = Metrics() if metrics else None
+        # /_metrics sits behind auth_dependency unless metrics_auth=False (for
+        # scrapers that can't authenticate; restrict it elsewhere then)
+        self.metrics_auth = metrics_auth
+        # Build each resource's routes (and run its introspection) on the first
+        # request under its prefix instead of in as_asgi(); see warmup()
+        self.lazy_routes = lazy_routes
+        self._lazy_routes: dict = {}
+        # Introspection manifest written by `typeboard-manifest`; loaded by as_asgi()
+        # when the file exists, so unchanged callables skip annotation evaluation
+        self.manifest = manifest
+        # Extra template directories, searched before the built-in templates
+        self.template_dirs: list[Path] = []
         self.resources: dict[str, Resource] = {}
         # Ordered list of (section_name | None, [resource_name, ...])
         self._sections: list[tuple[str | None, list[str]]] = []
@@ -40,6 +119,14 @@ class AdminSite:
         create: Callable | None = None,
         update: Callable | None = None,
         delete: Callable | None = None,
+        get_many: Callable | None = None,
+        count: Callable | None = None,
+        lazy_count: bool = False,
+        version: Callable | None = None,
+        memory_query: bool = False,
+        memory_query_cache: int = 0,
+        options_index: bool = False,
+        options_index_ttl: float | None = 300.0,
     ) -> Resource:
         res = Resource(
             id=id,
@@ -49,6 +136,14 @@ class AdminSite:
             create_fn=create,
             update_fn=update,
             delete_fn=delete,
+            get_many_fn=get_many,
+            count_fn=count,
+            lazy_count=lazy_count,
+            version_fn=version,
+            memory_query=memory_query,
+            memory_query_cache=memory_query_cache,
+            options_index=options_index,
+            options_index_ttl=options_index_ttl,
         )
         self.resources[id] = res
         # Place in the current section (or a default sectionless group)
@@ -62,6 +157,38 @@ class AdminSite:
         """Sections with their resource names, in registration order."""
         return self._sections
 
+    def add_template_dir(self, path: str | Path) -> None:
+        """Register a directory of templates that override or extend the built-in ones.
+
+        Takes effect for apps built afterwards; in production mode its templates
+        are precompiled along with the built-in ones.
+        """
+        self.template_dirs.append(Path(path))
+
+    def warmup(self, *resource_ids: str) -> None:
+        """Prepare resources ahead of their first request; all of them when no IDs are given.
+
+        With lazy_routes, builds the routes of the most recently built app.
+        Otherwise (or before as_asgi()) runs the resources' introspection and
+        compiles their call plans, which is the bulk of the work either way.
+        """
+        for resource_id in resource_ids or list(self.resources):
+            route = self._lazy_routes.get(resource_id)
+            if route is not None:
+                route.build()
+                continue
+            self.resources[resource_id].introspect()
+
+    def export_manifest(self, path: str | Path) -> None:
+        """Introspect every resource and save the results for load_manifest() (see typeboard.manifest)."""
+        from typeboard.manifest import export_manifest
+        export_manifest(self, path)
+
+    def load_manifest(self, path: str | Path) -> int:
+        """Reuse saved introspection for callables whose signatures haven't changed; returns how many."""
+        from typeboard.manifest import load_manifest
+        return load_manifest(self, path)
+
     def as_asgi(self):
         from typeboard.routing import build_app
         return build_app(self)
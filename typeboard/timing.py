@@ -0,0 +1,141 @@
+import time
+from collections.abc import Callable, Sequence
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from typeboard.execution import is_async_callable
+
+
+@dataclass
+class RequestTiming:
+    """Where one admin request spent its time, in milliseconds per phase.
+
+    Phases are "call" (the resource's own callables), "choices" (form choices
+    callables), "relationships" (related label lookups) and "render" (Jinja).
+    Phases that run concurrently each report their own wall time. For streamed
+    pages "render" only covers the work done before the first byte.
+
+    status is the response status (500 when the handler raised) and rows the
+    number of rows the page showed, where that applies.
+    """
+
+    resource: str | None = None
+    operation: str | None = None
+    phases: dict[str, float] = field(default_factory=dict)
+    total: float = 0.0
+    status: int | None = None
+    rows: int | None = None
+    started: float = field(default_factory=time.perf_counter, repr=False)
+
+    def add(self, phase: str, ms: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + ms
+
+    def server_timing(self) -> str:
+        """The Server-Timing header value for the phases recorded so far."""
+        elapsed = (time.perf_counter() - self.started) * 1e3
+        metrics = [f"{name};dur={ms:.1f}" for name, ms in self.phases.items()]
+        metrics.append(f"total;dur={elapsed:.1f}")
+        return ", ".join(metrics)
+
+
+_current: ContextVar[RequestTiming | None] = ContextVar("typeboard_request_timing", default=None)
+
+
+class _Phase:
+    __slots__ = ("timing", "name", "start")
+
+    def __init__(self, timing: RequestTiming, name: str):
+        self.timing = timing
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.timing.add(self.name, (time.perf_counter() - self.start) * 1e3)
+        return False
+
+
+class _NoPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_PHASE = _NoPhase()
+
+
+def phase(name: str) -> _Phase | _NoPhase:
+    """Context manager adding its duration to the current request's timing.
+
+    A shared no-op when timing is disabled, so instrumented code costs one
+    context variable lookup.
+    """
+    timing = _current.get()
+    if timing is None:
+        return _NO_PHASE
+    return _Phase(timing, name)
+
+
+def label(resource: str | None, operation: str) -> None:
+    """Record which resource and operation the current request is serving."""
+    timing = _current.get()
+    if timing is not None:
+        timing.resource = resource
+        timing.operation = operation
+
+
+def record_rows(count: int) -> None:
+    """Record how many rows the current request returned."""
+    timing = _current.get()
+    if timing is not None:
+        timing.rows = count
+
+
+class TimingMiddleware:
+    """ASGI middleware collecting a RequestTiming for every admin request.
+
+    Adds a Server-Timing header when header is true and passes each labelled
+    request's timing to every hook (sync or async) once its response is
+    complete, including requests whose handler raised.
+    """
+
+    def __init__(self, app, header: bool = True, hooks: Sequence[Callable[[RequestTiming], object]] = ()):
+        self.app = app
+        self.header = header
+        self.hooks = [(hook, is_async_callable(hook)) for hook in hooks]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        timing = RequestTiming()
+        token = _current.set(timing)
+
+        async def timed_send(message):
+            if message["type"] == "http.response.start":
+                timing.status = message["status"]
+                if self.header:
+                    headers = [*message.get("headers", ()), (b"server-timing", timing.server_timing().encode())]
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, timed_send)
+        except Exception:
+            timing.status = 500
+            raise
+        finally:
+            _current.reset(token)
+            timing.total = (time.perf_counter() - timing.started) * 1e3
+            if timing.operation is not None:
+                for hook, hook_is_async in self.hooks:
+                    if hook_is_async:
+                        await hook(timing)
+                    else:
+                        hook(timing)